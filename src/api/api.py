@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse, RedirectResponse
 from datastore import DataStore
 from lib.logging import silence_access_logs
 
+from .async_store import build_limiter
 from .auth import AuthServices
 from .models import ErrorDetail
 from .routes import presets_account, presets_global
@@ -22,6 +23,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         app.state.store = ds  # expose for dependencies
     if not hasattr(app.state, "auth"):
         app.state.auth = AuthServices.from_env()
+    if not hasattr(app.state, "datastore_limiter"):
+        app.state.datastore_limiter = build_limiter()
     yield
     # add cleanup logic here
 
@@ -36,9 +39,11 @@ class RegistryAPI(FastAPI):
 
         from datastore.exceptions import ConcurrencyError
 
-        from .exceptions import NotFoundError
+        from .exceptions import NotFoundError, NotModifiedError, PreconditionFailedError
+        from .helpers import format_etag
         from .responses import ERROR_404
         from .routes import accounts, players
+        from .types import DS
 
         router = APIRouter(responses=ERROR_404)
         router.include_router(accounts.router, tags=["accounts"])
@@ -52,6 +57,15 @@ class RegistryAPI(FastAPI):
             err = ErrorDetail(code=exc.code, message=str(exc), details=exc.details)
             return JSONResponse(status_code=404, content=err.model_dump())
 
+        @self.exception_handler(NotModifiedError)
+        async def not_modified_handler(request: Request, exc: NotModifiedError) -> Response:
+            return Response(status_code=304, headers={"ETag": format_etag(exc.etag)})
+
+        @self.exception_handler(PreconditionFailedError)
+        async def precondition_failed_handler(request: Request, exc: PreconditionFailedError) -> JSONResponse:
+            err = ErrorDetail(code=exc.code, message=str(exc), details=exc.details)
+            return JSONResponse(status_code=412, content=err.model_dump())
+
         @self.exception_handler(ConcurrencyError)
         async def conflict_handler(request: Request, exc: ConcurrencyError) -> JSONResponse:
             err = ErrorDetail(code="conflict", message=str(exc), details=None)
@@ -66,7 +80,15 @@ class RegistryAPI(FastAPI):
             # 204 No Content, explicit no-store to avoid caching
             return Response(status_code=204, headers={"Cache-Control": "no-store"})
 
-        silence_access_logs("/healthz")
+        @self.get("/healthz/sync", include_in_schema=False)
+        async def healthz_sync(ds: DS) -> Response:
+            # remote fetch/push health for backends that sync with one; 204 otherwise
+            status = await ds.sync_status()
+            if status is None:
+                return Response(status_code=204, headers={"Cache-Control": "no-store"})
+            return JSONResponse(status, headers={"Cache-Control": "no-store"})
+
+        silence_access_logs(["/healthz", "/healthz/sync"])
 
         self.add_middleware(
             CORSMiddleware,
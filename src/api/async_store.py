@@ -0,0 +1,128 @@
+import os
+from collections.abc import Callable, Collection, Sequence
+from functools import partial
+
+from anyio import CapacityLimiter, to_thread
+from pydantic import BaseModel
+
+from datastore import DataStore
+from datastore.core import ModelStore, ModelWithId
+from datastore.types import ETag, PagedResult, PathParams, ValueWithETag
+
+
+def build_limiter() -> CapacityLimiter:
+    """Bound concurrent datastore calls; REGISTRY_DATASTORE_MAX_THREADS (default 20)."""
+    max_threads = int(os.environ.get("REGISTRY_DATASTORE_MAX_THREADS", "20"))
+    if max_threads < 1:
+        raise ValueError("REGISTRY_DATASTORE_MAX_THREADS must be >= 1")
+    return CapacityLimiter(max_threads)
+
+
+class AsyncModelStore[Entity: ModelWithId, Create: BaseModel]:
+    """Awaitable view of a ModelStore.
+
+    Every call runs in a worker thread bounded by a shared CapacityLimiter, so backend I/O
+    (filesystem reads, boto3 requests, git flock/fetch/push) and model validation never
+    run on the event loop. The limiter is separate from Starlette's threadpool so a slow
+    backend cannot starve sync dependencies such as auth.
+    """
+
+    def __init__(self, store: ModelStore[Entity, Create], limiter: CapacityLimiter) -> None:
+        self.store = store
+        self._limiter = limiter
+
+    async def _run[R](self, func: Callable[[], R]) -> R:
+        return await to_thread.run_sync(func, limiter=self._limiter)
+
+    async def delete(self, object_id: str, *, path_params: PathParams | None = None) -> bool:
+        return await self._run(partial(self.store.delete, object_id, path_params=path_params))
+
+    async def exists(self, object_id: str, *, path_params: PathParams | None = None) -> bool:
+        return await self._run(partial(self.store.exists, object_id, path_params=path_params))
+
+    async def get(self, object_id: str, *, path_params: PathParams | None = None) -> Entity | None:
+        return await self._run(partial(self.store.get, object_id, path_params=path_params))
+
+    async def get_versioned(
+        self,
+        object_id: str,
+        *,
+        path_params: PathParams | None = None,
+        if_none_match: Collection[ETag] = (),
+    ) -> ValueWithETag[Entity]:
+        return await self._run(
+            partial(self.store.get_versioned, object_id, path_params=path_params, if_none_match=if_none_match)
+        )
+
+    async def get_many(
+        self, object_ids: Sequence[str], *, path_params: PathParams | None = None
+    ) -> list[Entity | None]:
+        return await self._run(partial(self.store.get_many, object_ids, path_params=path_params))
+
+    async def list_summaries[Projection: BaseModel](
+        self,
+        projection_model: type[Projection],
+        *,
+        path_params: PathParams | None = None,
+        page: int = 1,
+        per_page: int = 10,
+        start_after: str | None = None,
+    ) -> PagedResult[Projection]:
+        return await self._run(
+            partial(
+                self.store.list_summaries,
+                projection_model,
+                path_params=path_params,
+                page=page,
+                per_page=per_page,
+                start_after=start_after,
+            )
+        )
+
+    async def merge_upsert(
+        self,
+        object_id: str,
+        partial_model: Create,
+        *,
+        path_params: PathParams | None = None,
+        if_match: Collection[ETag] | None = None,
+    ) -> Entity:
+        return await self._run(
+            partial(self.store.merge_upsert, object_id, partial_model, path_params=path_params, if_match=if_match)
+        )
+
+    async def merge_upsert_versioned(
+        self,
+        object_id: str,
+        partial_model: Create,
+        *,
+        path_params: PathParams | None = None,
+        if_match: Collection[ETag] | None = None,
+    ) -> tuple[Entity, ETag]:
+        return await self._run(
+            partial(
+                self.store.merge_upsert_versioned,
+                object_id,
+                partial_model,
+                path_params=path_params,
+                if_match=if_match,
+            )
+        )
+
+    async def save(self, model_obj: Entity, *, path_params: PathParams | None = None) -> Entity:
+        return await self._run(partial(self.store.save, model_obj, path_params=path_params))
+
+
+class AsyncDataStore:
+    """Awaitable view of a DataStore used by the API routes."""
+
+    def __init__(self, store: DataStore, limiter: CapacityLimiter) -> None:
+        self.store = store
+        self._limiter = limiter
+        self.accounts = AsyncModelStore(store.accounts, limiter)
+        self.players = AsyncModelStore(store.players, limiter)
+        self.global_presets = AsyncModelStore(store.global_presets, limiter)
+        self.account_presets = AsyncModelStore(store.account_presets, limiter)
+
+    async def sync_status(self) -> dict[str, object] | None:
+        return await to_thread.run_sync(self.store.sync_status, limiter=self._limiter)
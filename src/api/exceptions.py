@@ -11,3 +11,16 @@ class ApiError(Exception):
 class NotFoundError(ApiError):
     def __init__(self, message: str = "Resource not found", *, details: dict[str, Any] | None = None) -> None:
         super().__init__(message, code="not_found", details=details)
+
+
+class PreconditionFailedError(ApiError):
+    def __init__(self, message: str = "Precondition failed", *, details: dict[str, Any] | None = None) -> None:
+        super().__init__(message, code="precondition_failed", details=details)
+
+
+class NotModifiedError(ApiError):
+    """Raised when a conditional GET matches the current version; answered with a bodyless 304."""
+
+    def __init__(self, etag: str) -> None:
+        super().__init__("Not modified", code="not_modified", details={"etag": etag})
+        self.etag = etag
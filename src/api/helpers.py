@@ -1,9 +1,61 @@
-from typing import Any
+from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from fastapi import Response
 from pydantic import BaseModel
 
-from .exceptions import NotFoundError
-from .models import PaginatedList
+from datastore.core import ModelWithId, normalize_etag
+from datastore.exceptions import ConcurrencyError
+from datastore.types import ETag, PathParams
+
+from .exceptions import NotFoundError, NotModifiedError, PreconditionFailedError
+from .models import PaginatedList, encode_cursor
+
+if TYPE_CHECKING:
+    from .async_store import AsyncModelStore
+
+
+@dataclass(frozen=True)
+class ReadConditions:
+    """Conditional-request state for a single-document GET."""
+
+    response: Response
+    if_none_match: frozenset[ETag]
+
+
+@dataclass(frozen=True)
+class WriteConditions:
+    """Conditional-request state for a PUT; if_match is None when the header was not sent."""
+
+    response: Response
+    if_match: frozenset[ETag] | None
+
+
+def parse_etags(header: str | None, *, allow_weak: bool = True) -> frozenset[ETag]:
+    """Parse an If-None-Match / If-Match style header into bare version tokens.
+
+    Weak validators (W/"...") compare equal to their strong form for If-None-Match; If-Match
+    uses strong comparison (allow_weak=False), so weak validators never match.
+    """
+    if not header:
+        return frozenset()
+    tokens: set[ETag] = set()
+    for part in header.split(","):
+        token = part.strip()
+        if token.startswith("W/"):
+            if not allow_weak:
+                continue
+            token = token[2:]
+        token = normalize_etag(token) or ""
+        if token:
+            tokens.add(token)
+    return frozenset(tokens)
+
+
+def format_etag(version: ETag) -> str:
+    return f'"{version}"'
 
 
 def get_or_404[T](item: T | None, message: str = "Resource not found", **details: str) -> T:
@@ -12,22 +64,77 @@ def get_or_404[T](item: T | None, message: str = "Resource not found", **details
     return item
 
 
-def paginated_summary[Entity: BaseModel, Summary: BaseModel](
-    items: list[Entity],
-    summary_model: type[Summary],
+async def get_or_304[Entity: ModelWithId](
+    store: AsyncModelStore[Entity, Any],
+    object_id: str,
+    conditions: ReadConditions,
+    message: str = "Resource not found",
+    *,
+    path_params: PathParams | None = None,
+    **details: str,
+) -> Entity:
+    """Fetch a document for a GET route, setting its ETag and honoring If-None-Match.
+
+    Raises:
+        NotModifiedError: If the current version matches If-None-Match (no validation or body).
+        NotFoundError: If the document does not exist.
+    """
+    entity, version = await store.get_versioned(
+        object_id, path_params=path_params, if_none_match=conditions.if_none_match
+    )
+    if version is not None:
+        conditions.response.headers["ETag"] = format_etag(version)
+    if entity is None:
+        if version is not None:
+            raise NotModifiedError(version)
+        raise NotFoundError(message, details=details)
+    return entity
+
+
+async def upsert_with_etag[Entity: ModelWithId, Create: BaseModel](
+    store: AsyncModelStore[Entity, Create],
+    object_id: str,
+    payload: Create,
+    conditions: WriteConditions,
+    *,
+    path_params: PathParams | None = None,
+) -> Entity:
+    """Merge-upsert a document for a PUT route, enforcing If-Match and setting the new ETag.
+
+    Raises:
+        PreconditionFailedError: If If-Match was sent and does not match the current version.
+        ConcurrencyError: If a concurrent write wins without If-Match.
+    """
+    try:
+        entity, version = await store.merge_upsert_versioned(
+            object_id, payload, path_params=path_params, if_match=conditions.if_match
+        )
+    except ConcurrencyError as e:
+        if conditions.if_match is None:
+            raise
+        raise PreconditionFailedError(details={"id": object_id}) from e
+    conditions.response.headers["ETag"] = format_etag(version)
+    return entity
+
+
+def paginated_summary[Summary: ModelWithId](
+    summaries: list[Summary],
     *,
     page: int,
     per_page: int,
+    cursor: str | None = None,
 ) -> PaginatedList[Summary]:
-    summaries = [summary_model.model_validate(item, from_attributes=True) for item in items]
-    return PaginatedList.from_paged(summaries, page=page, per_page=per_page)
+    next_cursor = encode_cursor(summaries[-1].id) if summaries else None
+    return PaginatedList.from_paged(summaries, page=page, per_page=per_page, cursor=cursor, next_cursor=next_cursor)
 
 
-def get_paginated[Entity: BaseModel, Summary: BaseModel](
+async def get_paginated[Summary: BaseModel](
     store: Any,
     summary_model: type[Summary],
     paging: Any,
     **kwargs: Any,
 ) -> PaginatedList[Summary]:
-    items = store.list(page=paging.page, per_page=paging.per_page, **kwargs)
-    return paginated_summary(items, summary_model, page=paging.page, per_page=paging.per_page)
+    summaries = await store.list_summaries(
+        summary_model, page=paging.page, per_page=paging.per_page, start_after=paging.start_after, **kwargs
+    )
+    return paginated_summary(summaries, page=paging.page, per_page=paging.per_page, cursor=paging.cursor)
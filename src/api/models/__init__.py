@@ -1,9 +1,11 @@
 from .error import ErrorDetail
-from .pagination import PaginatedList, PaginationLinks, PaginationParams
+from .pagination import PaginatedList, PaginationLinks, PaginationParams, decode_cursor, encode_cursor
 
 __all__ = [
     "ErrorDetail",
     "PaginatedList",
     "PaginationLinks",
     "PaginationParams",
+    "decode_cursor",
+    "encode_cursor",
 ]
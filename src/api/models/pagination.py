@@ -1,3 +1,5 @@
+import base64
+import binascii
 from typing import TypeVar
 
 from pydantic import BaseModel, Field, model_validator
@@ -5,9 +7,36 @@ from pydantic import BaseModel, Field, model_validator
 T = TypeVar("T")
 
 
+def encode_cursor(object_id: str) -> str:
+    """Encode the id of the last item on a page into an opaque keyset cursor."""
+    return base64.urlsafe_b64encode(object_id.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Decode an opaque cursor back into the object id to resume after.
+
+    Raises:
+        ValueError: If the cursor is not one produced by encode_cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        object_id = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    if not object_id:
+        raise ValueError("Invalid pagination cursor")
+    return object_id
+
+
 class PaginationParams(BaseModel):
     page: int = 1
     per_page: int = 10
+    cursor: str | None = None
+
+    @property
+    def start_after(self) -> str | None:
+        """The object id encoded in cursor, if any (keyset mode)."""
+        return decode_cursor(self.cursor) if self.cursor is not None else None
 
 
 class PaginationLinks(BaseModel):
@@ -20,6 +49,10 @@ class PaginatedList[T](BaseModel):
     page: int
     per_page: int
     links: PaginationLinks | None = None
+    next_cursor: str | None = Field(None, description="Opaque cursor for the following page, if any")
+
+    # Cursor the page was requested with (keyset mode); not echoed back
+    cursor: str | None = Field(None, exclude=True)
 
     # Derived fields populated post-validation (excluded from serialization)
     has_next: bool = Field(False, exclude=True)
@@ -32,6 +65,18 @@ class PaginatedList[T](BaseModel):
         # "has_next" is true if the number of items returned is equal to the requested page size.
         # This is a common heuristic for cursor-style pagination.
         self.has_next = len(self.items) == self.per_page
+        if not self.has_next:
+            self.next_cursor = None
+
+        if self.cursor is not None:
+            # Keyset pages only link forward; there is no stable "previous" cursor.
+            self.has_prev = False
+            self.next_page = None
+            self.prev_page = None
+            nxt = f"?cursor={self.next_cursor}&per_page={self.per_page}" if self.next_cursor else None
+            self.links = PaginationLinks(prev=None, next=nxt)
+            return self
+
         self.has_prev = self.page > 1
         self.next_page = self.page + 1 if self.has_next else None
         self.prev_page = self.page - 1 if self.has_prev else None
@@ -46,5 +91,15 @@ class PaginatedList[T](BaseModel):
         return self
 
     @classmethod
-    def from_paged(cls, items: list[T], page: int, per_page: int) -> "PaginatedList[T]":
-        return cls.model_validate({"items": items, "page": page, "per_page": per_page})
+    def from_paged(
+        cls,
+        items: list[T],
+        page: int,
+        per_page: int,
+        *,
+        cursor: str | None = None,
+        next_cursor: str | None = None,
+    ) -> "PaginatedList[T]":
+        return cls.model_validate(
+            {"items": items, "page": page, "per_page": per_page, "cursor": cursor, "next_cursor": next_cursor}
+        )
@@ -16,3 +16,10 @@ ERROR_409: dict[int | str, dict[str, Any]] = {
         "description": "Conflict",
     }
 }
+
+ERROR_412: dict[int | str, dict[str, Any]] = {
+    412: {
+        "model": ErrorDetail,
+        "description": "If-Match precondition failed",
+    }
+}
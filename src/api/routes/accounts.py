@@ -3,31 +3,32 @@ from fastapi import APIRouter, Depends
 from models import Account, AccountCreate, AccountSummary
 
 from ..auth import require_account_manager
-from ..helpers import get_or_404, get_paginated
+from ..helpers import get_or_304, get_paginated, upsert_with_etag
 from ..models import PaginatedList
-from ..responses import ERROR_409
-from ..types import DS, AccountId, PageParams
+from ..responses import ERROR_409, ERROR_412
+from ..types import DS, AccountId, Conditions, PageParams, Preconditions
 
 router = APIRouter(prefix="/accounts")
 
 
-@router.put("/{account_id}", response_model=Account, responses=ERROR_409)
+@router.put("/{account_id}", response_model=Account, responses={**ERROR_409, **ERROR_412})
 async def register_account(
     account_id: AccountId,
     ds: DS,
     account_data: AccountCreate,
+    preconditions: Preconditions,
     _identity: object = Depends(require_account_manager),
 ) -> Account:
-    account = ds.accounts.merge_upsert(account_id, account_data)
-    return account
+    return await upsert_with_etag(ds.accounts, account_id, account_data, preconditions)
 
 
 @router.get("/{account_id}", response_model=Account)
 async def get_account(
     account_id: AccountId,
     ds: DS,
+    conditions: Conditions,
 ) -> Account:
-    return get_or_404(ds.accounts.get(account_id), "Account not found", account_id=account_id)
+    return await get_or_304(ds.accounts, account_id, conditions, "Account not found", account_id=account_id)
 
 
 @router.get("/", response_model=PaginatedList[AccountSummary])
@@ -35,4 +36,4 @@ async def list_accounts(
     ds: DS,
     paging: PageParams,
 ) -> PaginatedList[AccountSummary]:
-    return get_paginated(ds.accounts, AccountSummary, paging)
+    return await get_paginated(ds.accounts, AccountSummary, paging)
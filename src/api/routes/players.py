@@ -3,27 +3,29 @@ from fastapi import APIRouter, Depends
 from models import Account, Player, PlayerCreate, PlayerSummary
 
 from ..auth import require_account_manager
-from ..helpers import get_or_404, get_paginated
+from ..helpers import get_or_304, get_paginated, upsert_with_etag
 from ..models import PaginatedList
-from ..responses import ERROR_409
-from ..types import DS, AccountId, PageParams, PlayerId
+from ..responses import ERROR_409, ERROR_412
+from ..types import DS, AccountId, Conditions, PageParams, PlayerId, Preconditions
 
 router = APIRouter(prefix="/accounts/{account_id}/players")
 
 
-@router.put("/{player_id}", response_model=Player, responses=ERROR_409)
+@router.put("/{player_id}", response_model=Player, responses={**ERROR_409, **ERROR_412})
 async def register_player(
     account_id: AccountId,
     player_id: PlayerId,
     ds: DS,
     player_data: PlayerCreate,
+    preconditions: Preconditions,
     _identity: object = Depends(require_account_manager),
 ) -> Player:
-    if not ds.accounts.exists(account_id):
+    if not await ds.accounts.exists(account_id):
         new_account = Account(id=account_id, name=account_id)
-        ds.accounts.save(new_account)
-    player = ds.players.merge_upsert(player_id, player_data, path_params={"account_id": account_id})
-    return player
+        await ds.accounts.save(new_account)
+    return await upsert_with_etag(
+        ds.players, player_id, player_data, preconditions, path_params={"account_id": account_id}
+    )
 
 
 @router.get("/{player_id}", response_model=Player)
@@ -31,11 +33,15 @@ async def get_player(
     account_id: AccountId,
     player_id: PlayerId,
     ds: DS,
+    conditions: Conditions,
     _identity: object = Depends(require_account_manager),
 ) -> Player:
-    return get_or_404(
-        ds.players.get(player_id, path_params={"account_id": account_id}),
+    return await get_or_304(
+        ds.players,
+        player_id,
+        conditions,
         "Player not found",
+        path_params={"account_id": account_id},
         account_id=account_id,
         player_id=player_id,
     )
@@ -48,4 +54,4 @@ async def list_players(
     paging: PageParams,
     _identity: object = Depends(require_account_manager),
 ) -> PaginatedList[PlayerSummary]:
-    return get_paginated(ds.players, PlayerSummary, paging, path_params={"account_id": account_id})
+    return await get_paginated(ds.players, PlayerSummary, paging, path_params={"account_id": account_id})
@@ -3,10 +3,10 @@ from fastapi import APIRouter, Depends
 from models import AccountStationPreset, AccountStationPresetCreate, AccountStationPresetSummary
 
 from ..auth import require_account_manager
-from ..helpers import get_or_404, get_paginated
+from ..helpers import get_or_304, get_paginated, upsert_with_etag
 from ..models import PaginatedList
-from ..responses import ERROR_409
-from ..types import DS, AccountId, PageParams, PresetId
+from ..responses import ERROR_409, ERROR_412
+from ..types import DS, AccountId, Conditions, PageParams, Preconditions, PresetId
 
 router = APIRouter(prefix="/accounts/{account_id}/presets")
 
@@ -15,17 +15,19 @@ router = APIRouter(prefix="/accounts/{account_id}/presets")
     "/{preset_id}",
     response_model=AccountStationPreset,
     response_model_exclude_none=True,
-    responses=ERROR_409,
+    responses={**ERROR_409, **ERROR_412},
 )
 async def register_account_preset(
     account_id: AccountId,
     preset_id: PresetId,
     ds: DS,
     preset_data: AccountStationPresetCreate,
+    preconditions: Preconditions,
     _identity: object = Depends(require_account_manager),
 ) -> AccountStationPreset:
-    preset = ds.account_presets.merge_upsert(preset_id, preset_data, path_params={"account_id": account_id})
-    return preset
+    return await upsert_with_etag(
+        ds.account_presets, preset_id, preset_data, preconditions, path_params={"account_id": account_id}
+    )
 
 
 @router.get("/{preset_id}", response_model=AccountStationPreset, response_model_exclude_none=True)
@@ -33,10 +35,14 @@ async def get_account_preset(
     account_id: AccountId,
     preset_id: PresetId,
     ds: DS,
+    conditions: Conditions,
 ) -> AccountStationPreset:
-    return get_or_404(
-        ds.account_presets.get(preset_id, path_params={"account_id": account_id}),
+    return await get_or_304(
+        ds.account_presets,
+        preset_id,
+        conditions,
         "Station preset not found",
+        path_params={"account_id": account_id},
         account_id=account_id,
         preset_id=preset_id,
     )
@@ -52,6 +58,6 @@ async def list_account_presets(
     ds: DS,
     paging: PageParams,
 ) -> PaginatedList[AccountStationPresetSummary]:
-    return get_paginated(
+    return await get_paginated(
         ds.account_presets, AccountStationPresetSummary, paging, path_params={"account_id": account_id}
     )
@@ -3,10 +3,10 @@ from fastapi import APIRouter, Depends
 from models import GlobalStationPreset, GlobalStationPresetCreate, GlobalStationPresetSummary
 
 from ..auth import require_admin
-from ..helpers import get_or_404, get_paginated
+from ..helpers import get_or_304, get_paginated, upsert_with_etag
 from ..models import PaginatedList
-from ..responses import ERROR_409
-from ..types import DS, PageParams, PresetId
+from ..responses import ERROR_409, ERROR_412
+from ..types import DS, Conditions, PageParams, Preconditions, PresetId
 
 router = APIRouter(prefix="/presets")
 
@@ -15,24 +15,25 @@ router = APIRouter(prefix="/presets")
     "/{preset_id}",
     response_model=GlobalStationPreset,
     response_model_exclude_none=True,
-    responses=ERROR_409,
+    responses={**ERROR_409, **ERROR_412},
 )
 async def register_global_preset(
     preset_id: PresetId,
     ds: DS,
     preset_data: GlobalStationPresetCreate,
+    preconditions: Preconditions,
     _identity: object = Depends(require_admin),
 ) -> GlobalStationPreset:
-    preset = ds.global_presets.merge_upsert(preset_id, preset_data)
-    return preset
+    return await upsert_with_etag(ds.global_presets, preset_id, preset_data, preconditions)
 
 
 @router.get("/{preset_id}", response_model=GlobalStationPreset, response_model_exclude_none=True)
 async def get_global_preset(
     preset_id: PresetId,
     ds: DS,
+    conditions: Conditions,
 ) -> GlobalStationPreset:
-    return get_or_404(ds.global_presets.get(preset_id), "Station preset not found", preset_id=preset_id)
+    return await get_or_304(ds.global_presets, preset_id, conditions, "Station preset not found", preset_id=preset_id)
 
 
 @router.get(
@@ -44,4 +45,4 @@ async def list_global_presets(
     ds: DS,
     paging: PageParams,
 ) -> PaginatedList[GlobalStationPresetSummary]:
-    return get_paginated(ds.global_presets, GlobalStationPresetSummary, paging)
+    return await get_paginated(ds.global_presets, GlobalStationPresetSummary, paging)
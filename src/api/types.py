@@ -1,12 +1,14 @@
 from typing import Annotated, cast
 
-from fastapi import Depends, HTTPException, Path, Query, Request
+from fastapi import Depends, Header, HTTPException, Path, Query, Request, Response
 
 from datastore import DataStore
 from lib.constants import MAX_PER_PAGE
 from lib.types import Slug
 
-from .models import PaginationParams
+from .async_store import AsyncDataStore
+from .helpers import ReadConditions, WriteConditions, parse_etags
+from .models import PaginationParams, decode_cursor
 
 type PageNumber = Annotated[int, Query(ge=1, description="Page number (>=1)")]
 """1-based page number (>= 1)."""
@@ -19,15 +21,60 @@ def get_store(request: Request) -> DataStore:
     return cast(DataStore, ds)
 
 
+def get_async_store(request: Request, ds: Annotated[DataStore, Depends(get_store)]) -> AsyncDataStore:
+    """Wrap the DataStore so routes await datastore calls in bounded worker threads."""
+    wrapped = getattr(request.app.state, "async_store", None)
+    if isinstance(wrapped, AsyncDataStore) and wrapped.store is ds:
+        return wrapped
+    limiter = getattr(request.app.state, "datastore_limiter", None)
+    if limiter is None:
+        raise HTTPException(status_code=500, detail="Datastore not initialized")
+    wrapped = AsyncDataStore(ds, limiter)
+    request.app.state.async_store = wrapped
+    return wrapped
+
+
 def pagination(
     page: PageNumber = 1,
     per_page: int = Query(10, ge=1, le=MAX_PER_PAGE, description="Items per page (1-100)"),
+    cursor: str | None = Query(
+        None,
+        max_length=256,
+        description="Opaque cursor from a previous page's `next` link; takes precedence over `page`",
+    ),
 ) -> PaginationParams:
-    return PaginationParams(page=page, per_page=per_page)
+    if cursor is not None:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
+    return PaginationParams(page=page, per_page=per_page, cursor=cursor)
+
+
+def read_conditions(
+    response: Response,
+    if_none_match: str | None = Header(
+        None, description="ETag(s) from a previous response; answered with 304 Not Modified if still current"
+    ),
+) -> ReadConditions:
+    return ReadConditions(response=response, if_none_match=parse_etags(if_none_match))
+
+
+def write_conditions(
+    response: Response,
+    if_match: str | None = Header(
+        None, description="ETag from a previous response; the write fails with 412 if the document has changed"
+    ),
+) -> WriteConditions:
+    return WriteConditions(
+        response=response, if_match=None if if_match is None else parse_etags(if_match, allow_weak=False)
+    )
 
 
-DS = Annotated[DataStore, Depends(get_store)]
+DS = Annotated[AsyncDataStore, Depends(get_async_store)]
 PageParams = Annotated[PaginationParams, Depends(pagination)]
+Conditions = Annotated[ReadConditions, Depends(read_conditions)]
+Preconditions = Annotated[WriteConditions, Depends(write_conditions)]
 AccountId = Annotated[Slug, Path(..., description="Account ID (slug)")]
 PlayerId = Annotated[Slug, Path(..., description="Player ID (slug)")]
 PresetId = Annotated[Slug, Path(..., description="Preset ID (slug)")]
@@ -1,4 +1,4 @@
-from .backends import GitBackend, LocalBackend, S3Backend
+from .backends import GitBackend, LocalBackend, S3Backend, SQLiteBackend
 from .datastore import DataStore
 
-__all__ = ["DataStore", "GitBackend", "LocalBackend", "S3Backend"]
+__all__ = ["DataStore", "GitBackend", "LocalBackend", "S3Backend", "SQLiteBackend"]
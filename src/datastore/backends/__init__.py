@@ -1,5 +1,6 @@
 from .git import GitBackend
 from .local import LocalBackend
 from .s3 import S3Backend
+from .sqlite import SQLiteBackend
 
-__all__ = ["GitBackend", "LocalBackend", "S3Backend"]
+__all__ = ["GitBackend", "LocalBackend", "S3Backend", "SQLiteBackend"]
@@ -2,40 +2,280 @@ from __future__ import annotations
 
 import fcntl
 import io
-import json
+import stat
+import threading
 import time
-from collections.abc import Callable, Iterator
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from threading import RLock
+from threading import Condition, Event, Lock, Thread
 from typing import Any, TypeVar, cast
 from urllib.parse import urlsplit, urlunsplit
+from weakref import WeakSet
 
 from dulwich import porcelain
-from dulwich.client import SSHGitClient, get_transport_and_path
+from dulwich.client import LocalGitClient, SSHGitClient, get_transport_and_path
+from dulwich.diff_tree import tree_changes
 from dulwich.errors import GitProtocolError, HangupException, SendPackError
+from dulwich.object_store import BaseObjectStore, ObjectStoreGraphWalker, commit_tree_changes
+from dulwich.objects import Blob, Commit, ObjectID, Tree, TreeEntry
+from dulwich.porcelain import get_user_timezones
 from dulwich.refs import Ref
 from dulwich.repo import Repo
 
 from datastore.core import (
-    atomic_write_json_file,
+    DirectoryListingCache,
+    atomic_write_file,
     compute_etag,
     construct_storage_path,
     extract_object_id_from_path,
+    parse_json,
+    read_json_file,
+    select_page,
+    storage_json,
     strip_id,
     validate_if_match,
+    validate_if_none_match,
 )
 from datastore.exceptions import ConcurrencyError
-from datastore.types import JsonDoc, PagedResult, ValueWithETag
+from datastore.types import ETag, JsonDoc, PagedResult, ValueWithETag
 from lib.logging import logger
 
 _T = TypeVar("_T")
 _RETRY = object()
 _UNSET = object()
+_FILE_MODE = 0o100644
+READ_MODES = ("worktree", "objects")
+_PUSH_RETRY_MIN_SECONDS = 1.0
+_PUSH_RETRY_MAX_SECONDS = 60.0
+# Ref files modified this recently may be rewritten again within the same mtime tick, so the
+# branch head read from them is not cached (the rule DirectoryListingCache applies to listings).
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+class _NoHavesRepo(Repo):
+    """A Repo that announces no haves when it fetches.
+
+    Over a git server, dulwich reads the server's replies while it sends haves, and on a deepening
+    fetch that read can swallow the shallow/unshallow lines the server sends first, leaving the
+    checkout marked as deeper than the history it received. Without haves the server resends the
+    tips, but the shallow updates are read intact.
+    """
+
+    def get_graph_walker(self, heads: list[ObjectID] | None = None) -> ObjectStoreGraphWalker:
+        return super().get_graph_walker(heads=[])
+
+
+class _TreeReader:
+    """Resolves repo-relative paths in the branch's commit tree, without the working tree.
+
+    Tree entries and `.json` listings are cached by tree SHA, so directories that did not change
+    stay cached when the branch moves. Resolved path -> blob SHA lookups are cached per commit in
+    an LRU of `max_blobs` paths; misses are not cached, as they resolve from the cached trees.
+    Safe to share between reader threads; each passes the object store of its own Repo handle.
+    """
+
+    def __init__(self, *, max_trees: int = 1024, max_blobs: int = 4096) -> None:
+        self.max_trees = max_trees
+        self.max_blobs = max_blobs
+        self._trees: OrderedDict[ObjectID, dict[str, tuple[int, ObjectID]]] = OrderedDict()
+        self._listings: OrderedDict[ObjectID, tuple[str, ...]] = OrderedDict()
+        self._commit: ObjectID | None = None
+        self._root: ObjectID | None = None
+        self._blobs: OrderedDict[str, ObjectID] = OrderedDict()
+        self._lock = Lock()
+
+    def blob(self, store: BaseObjectStore, commit_id: ObjectID | None, rel_path: str) -> ObjectID | None:
+        """Return the SHA of the file at rel_path in the given commit, or None."""
+        with self._lock:
+            self._use_commit(store, commit_id)
+            blob_id = self._blobs.get(rel_path)
+            if blob_id is not None:
+                self._blobs.move_to_end(rel_path)
+                return blob_id
+            directory, _, name = rel_path.rpartition("/")
+            tree_id = self._resolve_dir(store, directory)
+            entry = self._entries(store, tree_id).get(name) if tree_id is not None else None
+            if entry is None or stat.S_ISDIR(entry[0]):
+                return None
+            self._remember(self._blobs, rel_path, entry[1], self.max_blobs)
+            return entry[1]
+
+    def names(self, store: BaseObjectStore, commit_id: ObjectID | None, rel_dir: str) -> Sequence[str]:
+        """Return the `<id>.json` file names directly under rel_dir in the given commit, in storage-key order."""
+        with self._lock:
+            self._use_commit(store, commit_id)
+            tree_id = self._resolve_dir(store, rel_dir.strip("/"))
+            if tree_id is None:
+                return ()
+            names = self._listings.get(tree_id)
+            if names is None:
+                entries = self._entries(store, tree_id)
+                names = tuple(
+                    sorted(n for n, (mode, _) in entries.items() if n.endswith(".json") and not stat.S_ISDIR(mode))
+                )
+                self._remember(self._listings, tree_id, names, self.max_trees)
+            return names
+
+    def _use_commit(self, store: BaseObjectStore, commit_id: ObjectID | None) -> None:
+        if commit_id == self._commit:
+            return
+        self._commit = commit_id
+        self._root = cast(Commit, store[commit_id]).tree if commit_id is not None else None
+        self._blobs.clear()
+
+    def _resolve_dir(self, store: BaseObjectStore, rel_dir: str) -> ObjectID | None:
+        tree_id = self._root
+        for part in rel_dir.split("/") if rel_dir else ():
+            if tree_id is None:
+                return None
+            entry = self._entries(store, tree_id).get(part)
+            tree_id = entry[1] if entry is not None and stat.S_ISDIR(entry[0]) else None
+        return tree_id
+
+    def _entries(self, store: BaseObjectStore, tree_id: ObjectID) -> dict[str, tuple[int, ObjectID]]:
+        entries = self._trees.get(tree_id)
+        if entries is None:
+            tree = cast(Tree, store[tree_id])
+            entries = {item.path.decode(): (item.mode, item.sha) for item in tree.iteritems()}
+            self._remember(self._trees, tree_id, entries, self.max_trees)
+        else:
+            self._trees.move_to_end(tree_id)
+        return entries
+
+    @staticmethod
+    def _remember[K, V](cache: OrderedDict[K, V], key: K, value: V, limit: int) -> None:
+        cache[key] = value
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+
+class _ReadWriteLock:
+    """Many readers or one writer, for the threads of one process; writers take precedence.
+
+    Pairs with the shared/exclusive flock, which coordinates processes but not the threads of one.
+    Not reentrant: a thread holding it must not acquire it again.
+    """
+
+    def __init__(self) -> None:
+        self._cond = Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+@dataclass(frozen=True, slots=True)
+class GitFetchStatus:
+    """Health of remote fetches, for alerting on a stale checkout."""
+
+    last_duration_seconds: float | None
+    last_success_age_seconds: float | None
+    failures: int
+    consecutive_failures: int
+
+
+@dataclass(frozen=True, slots=True)
+class GitPushStatus:
+    """Backlog of locally committed writes not yet on the remote (async push mode)."""
+
+    pending_commits: int
+    oldest_pending_age_seconds: float | None
+    failures: int
+    consecutive_failures: int
+
+
+@dataclass(eq=False, slots=True)
+class _GroupedWrite:
+    """A save or delete waiting to be folded into the next group commit."""
+
+    action: str
+    stage: Callable[[], tuple[object, str | None]]
+    done: Event = field(default_factory=Event)
+    result: object = None
+    error: BaseException | None = None
 
 
 class GitBackend:
-    """Git-backed ObjectStore implementation using a working tree checkout."""
+    """Git-backed ObjectStore implementation using a working tree checkout.
+
+    With read_mode="objects", reads resolve paths in the branch's commit tree and versions are
+    blob SHAs; fetches only move refs, and the working tree is reset to the branch lazily, right
+    before the next write needs it.
+
+    With group_commit_max_latency_ms > 0, writes arriving within that window (up to
+    group_commit_max_writes of them) share one fetch, commit and push. Each write is staged and
+    checked against its own preconditions; the commit and push then succeed or fail for all of
+    them together.
+
+    With background_fetch=True, a daemon thread fetches every fetch_ttl_seconds and reads never
+    touch the network. The fetch runs outside the operation lock; only moving the branch to the
+    fetched commit takes it, and that step is skipped if the branch moved meanwhile (e.g. a write
+    pushed a newer commit). Writes still fetch inline first.
+
+    With async_push=True, writes are acknowledged once committed locally, without fetching or
+    pushing; a daemon thread pushes them, backing off while the remote is unreachable. The local
+    branch is the write-ahead journal: commits ahead of the remote-tracking ref are the unpushed
+    ones, so they survive restarts. When the remote has moved on, unpushed commits are replayed
+    onto it path by path (a remote change to the same document is overwritten by the local one).
+    A startup or read whose inline fetch fails serves the local branch and waits out another
+    fetch TTL, so the backend starts and serves reads while the remote is down.
+
+    With clone_depth > 0, an empty checkout is bootstrapped with a shallow clone of that many
+    commits, so cold start does not grow with the data repo's history. Fetches into a shallow
+    checkout stay incremental; `deepen()` pulls in more history when it is wanted.
+
+    Reads hold the lock shared (in-process and `flock(LOCK_SH)` across workers), so they run
+    concurrently with each other; fetches that move the branch, writes, commits and pushes hold it
+    exclusively, so readers never see a half-prepared commit. A read that finds the fetch TTL
+    expired first syncs under the exclusive lock, then reads under the shared one.
+
+    Each thread keeps one Repo handle open for the backend's lifetime, since concurrent readers
+    cannot share dulwich's pack file handles. The branch head is cached against the stat
+    signature of its ref files, so commits, pushes and fetches (including another process's,
+    through the shared checkout) refresh it; refs modified within the last second are re-read
+    on every call, since a rewrite in the same mtime tick keeps the signature. Whether the remote
+    is reached through `origin` is re-resolved after each fetch.
+
+    Writes bypass the index: the file is written to the checkout, the blob, the trees along its
+    path and the commit are written to the object store, and the branch ref is moved with
+    compare-and-swap, so a write does not grow with the number of documents. The commit the
+    checkout matches is kept in `refs/registry/worktree`, and moving the checkout rewrites only
+    the paths that differ from it. `.git/index` is left as it was after the last clone or full
+    reset, so `git status` in the checkout is not meaningful.
+    """
 
     def __init__(
         self,
@@ -44,11 +284,21 @@ class GitBackend:
         prefix: str = "",
         branch: str = "main",
         remote_url: str | None = None,
-        fetch_ttl_seconds: int = 30,
+        fetch_ttl_seconds: float = 30,
         author_name: str = "briceburg",
         author_email: str = "briceburg@users.noreply.github.com",
         ssh_key_path: str | None = None,
+        read_mode: str = "worktree",
+        group_commit_max_latency_ms: int = 0,
+        group_commit_max_writes: int = 32,
+        background_fetch: bool = False,
+        async_push: bool = False,
+        clone_depth: int = 0,
     ) -> None:
+        if read_mode not in READ_MODES:
+            raise ValueError(f"Unknown git read mode {read_mode!r}; expected one of: {', '.join(READ_MODES)}")
+        if clone_depth < 0:
+            raise ValueError("clone_depth must be >= 0")
         self.repo_path = Path(repo_path)
         self.prefix = prefix.strip("/")
         self.branch = branch
@@ -57,56 +307,175 @@ class GitBackend:
         self.author_name = author_name
         self.author_email = author_email
         self.ssh_key_path = ssh_key_path
+        self.clone_depth = clone_depth
 
         self._head_ref = cast(Ref, b"HEAD")
         self._branch_ref = cast(Ref, f"refs/heads/{self.branch}".encode())
         self._remote_branch_ref = cast(Ref, f"refs/remotes/origin/{self.branch}".encode())
-        self._lock = RLock()
+        # commit the working tree was last checked out at or committed from
+        self._worktree_ref = cast(Ref, b"refs/registry/worktree")
+        self._lock = _ReadWriteLock()
         self._lock_path = self.repo_path.parent / f".{self.repo_path.name}.lock"
         self._last_fetch_at = 0.0
         self._origin_remote_url_cache: str | None | object = _UNSET
+        self._remote_location_cache: str | object | None = _UNSET
+        self._local = threading.local()
+        self._repo_handles: WeakSet[Repo] = WeakSet()
+        self._branch_head_cache: tuple[tuple[tuple[int, int, int] | None, ...], ObjectID | None] | None = None
+        self._listings = DirectoryListingCache()
+        self.read_mode = read_mode
+        self._trees = _TreeReader()
+        # blobs (None for deletions) written to the working tree for the next commit, by repo path
+        self._staged: dict[str, ObjectID | None] = {}
+        self.group_commit_max_latency_ms = group_commit_max_latency_ms
+        self.group_commit_max_writes = max(1, group_commit_max_writes)
+        self._group_lock = Lock()
+        self._group_pending: list[_GroupedWrite] = []
+        self._group_leading = False
+        self._group_full = Event()
+        self._stats_lock = Lock()
+        self._last_fetch_duration: float | None = None
+        self._last_fetch_success_at: float | None = None
+        self._fetch_failures = 0
+        self._fetch_consecutive_failures = 0
+        self._fetcher: Thread | None = None
+        self._closing = Event()
+        self.async_push = async_push
+        self._push_failures = 0
+        self._push_consecutive_failures = 0
+        self._pusher: Thread | None = None
+        self._push_wanted = Event()
 
+        started = time.monotonic()
         with self._operation_lock():
             self._ensure_repo_exists()
+            checkout_seconds = time.monotonic() - started
             self._ensure_branch_symbolic_head()
-            self._sync_from_remote(force=True)
+            self._adopt_checkout()
+            self._sync_or_serve_local(force=True)
             repo = self._repo()
             _, remote_label, _ = self._resolved_remote(repo)
             logger.info(
-                "Git backend ready: repo=%s branch=%s remote=%s lock=%s fetch_ttl=%ss",
+                "Git backend ready: repo=%s branch=%s remote=%s lock=%s fetch_ttl=%ss read_mode=%s shallow=%s "
+                "startup=%.2fs checkout=%.2fs",
                 self.repo_path,
                 self.branch,
                 remote_label,
                 self._lock_path,
                 self.fetch_ttl_seconds,
+                self.read_mode,
+                bool(repo.get_shallow()),
+                time.monotonic() - started,
+                checkout_seconds,
+            )
+            if background_fetch and remote_label != "disabled":
+                self._fetcher = Thread(target=self._run_fetcher, name=f"git-fetch-{self.branch}", daemon=True)
+                self._fetcher.start()
+            if async_push and remote_label != "disabled":
+                if self._origin_remote_url(repo) is None:
+                    raise ValueError(f"Git async push needs a checkout with an 'origin' remote: {self.repo_path}")
+                self._pusher = Thread(target=self._run_pusher, name=f"git-push-{self.branch}", daemon=True)
+                self._pusher.start()
+                # commits left unpushed by a previous run
+                self._push_wanted.set()
+
+    def close(self) -> None:
+        """Stop the background fetcher and pusher, if running, and release the repository handles.
+
+        Unpushed commits stay on the local branch and are pushed by the next backend to open it.
+        """
+        self._closing.set()
+        self._push_wanted.set()
+        for thread in (self._fetcher, self._pusher):
+            if thread is not None:
+                thread.join()
+        self._fetcher = self._pusher = None
+        with self._lock.exclusive():
+            for repo in list(self._repo_handles):
+                repo.close()
+            self._repo_handles.clear()
+            self._local = threading.local()
+
+    def fetch_status(self) -> GitFetchStatus:
+        with self._stats_lock:
+            success_at = self._last_fetch_success_at
+            return GitFetchStatus(
+                last_duration_seconds=self._last_fetch_duration,
+                last_success_age_seconds=time.monotonic() - success_at if success_at is not None else None,
+                failures=self._fetch_failures,
+                consecutive_failures=self._fetch_consecutive_failures,
+            )
+
+    def push_status(self) -> GitPushStatus:
+        pending: Sequence[Commit] = ()
+        if self._pusher is not None:
+            with self._shared_lock():
+                repo = self._repo()
+                pending = self._pending_commits(repo, self._remote_head(repo))
+        with self._stats_lock:
+            return GitPushStatus(
+                pending_commits=len(pending),
+                oldest_pending_age_seconds=time.time() - pending[-1].commit_time if pending else None,
+                failures=self._push_failures,
+                consecutive_failures=self._push_consecutive_failures,
             )
 
     def get(self, object_id: str, *path_parts: str) -> ValueWithETag[JsonDoc]:
-        with self._operation_lock():
-            self._sync_from_remote(force=False)
+        with self._read_lock():
             return self._read_existing(self._get_fs_path(object_id, *path_parts))
 
-    def list(self, *path_parts: str, page: int = 1, per_page: int = 10) -> PagedResult[JsonDoc]:
-        with self._operation_lock():
-            self._sync_from_remote(force=False)
-            directory = self._get_dir_path(*path_parts)
-            if not directory.exists():
-                return []
+    def get_many(self, object_ids: Sequence[str], *path_parts: str) -> list[ValueWithETag[JsonDoc]]:
+        with self._read_lock():
+            return [self._read_existing(self._get_fs_path(object_id, *path_parts)) for object_id in object_ids]
 
-            files = sorted([p for p in directory.iterdir() if p.suffix == ".json"], key=lambda p: p.stem)
-            start = max(0, (page - 1) * per_page)
-            page_files = files[start : start + per_page]
+    def exists(self, object_id: str, *path_parts: str) -> bool:
+        with self._read_lock():
+            if self.read_mode == "objects":
+                return self._blob_id(self._repo(), self._storage_key(object_id, *path_parts)) is not None
+            return self._get_fs_path(object_id, *path_parts).is_file()
 
-            items = [self._read_json_file(file_path) for file_path in page_files]
-            for item, file_path in zip(items, page_files, strict=False):
-                item["id"] = extract_object_id_from_path(file_path.name)
+    def list(
+        self, *path_parts: str, page: int = 1, per_page: int = 10, start_after: str | None = None
+    ) -> PagedResult[JsonDoc]:
+        with self._read_lock():
+            directory = self._get_dir_path(*path_parts)
+            if self.read_mode == "objects":
+                repo = self._repo()
+                storage_dir = construct_storage_path(prefix=self.prefix, path_parts=path_parts)
+                names = self._trees.names(repo.object_store, self._branch_head(repo), storage_dir)
+            else:
+                names = self._listings.names(directory)
+            page_names = select_page(names, page=page, per_page=per_page, start_after=start_after)
+
+            items = [cast(dict[str, Any], self._read_existing(directory / name)[0]) for name in page_names]
+            for item, name in zip(items, page_names, strict=False):
+                item["id"] = extract_object_id_from_path(name)
             return items
 
-    def save(self, object_id: str, data: JsonDoc, *path_parts: str, if_match: str | None = None) -> None:
+    def save(
+        self,
+        object_id: str,
+        data: JsonDoc,
+        *path_parts: str,
+        if_match: str | None = None,
+        if_none_match: str | None = None,
+    ) -> ETag:
+        to_write = strip_id(data)
+        if self.group_commit_max_latency_ms > 0:
+            return cast(
+                ETag,
+                self._group_write(
+                    "update", lambda: self._stage_save(object_id, to_write, path_parts, if_match, if_none_match)
+                ),
+            )
         with self._operation_lock():
-            self._with_write_retry(lambda: self._save_once(object_id, strip_id(data), path_parts, if_match))
+            return self._with_write_retry(
+                lambda: self._save_once(object_id, to_write, path_parts, if_match, if_none_match)
+            )
 
     def delete(self, object_id: str, *path_parts: str) -> bool:
+        if self.group_commit_max_latency_ms > 0:
+            return cast(bool, self._group_write("delete", lambda: self._stage_delete(object_id, path_parts)))
         with self._operation_lock():
             return self._with_write_retry(lambda: self._delete_once(object_id, path_parts))
 
@@ -133,10 +502,15 @@ class GitBackend:
                     checkout=True,
                     branch=self.branch,
                     origin="origin",
+                    depth=self.clone_depth or None,
                     errstream=io.BytesIO(),
                     **self._auth_kwargs(),
                 ),
             )
+            repo = self._repo()
+            head = self._branch_head(repo)
+            if head is not None:
+                repo.refs[self._worktree_ref] = head
         else:
             self.repo_path.mkdir(parents=True, exist_ok=True)
             Repo.init(str(self.repo_path))
@@ -155,7 +529,44 @@ class GitBackend:
 
         repo.refs.set_symbolic_ref(self._head_ref, self._branch_ref)
 
-    def _sync_from_remote(self, *, force: bool) -> None:
+    def _adopt_checkout(self) -> None:
+        """Start tracking a worktree-mode checkout from before the worktree ref existed at its branch.
+
+        Such checkouts were kept at their branch; objects-mode ones are reset by the first write.
+        """
+        repo = self._repo()
+        if self.read_mode != "worktree" or self._worktree_ref in repo.refs.keys():
+            return
+        head = self._branch_head(repo)
+        if head is not None:
+            repo.refs[self._worktree_ref] = head
+
+    def deepen(self, commits: int) -> int:
+        """Fetch `commits` more commits of history into a shallow checkout.
+
+        Returns the new depth, or 0 once the checkout has the full history.
+
+        Raises:
+            ValueError: If commits < 1, or the remote is a local path (dulwich's in-process
+                transport cannot deepen a shallow clone; a git server or `file://` via git can).
+        """
+        if commits < 1:
+            raise ValueError("commits must be >= 1")
+        with self._operation_lock():
+            repo = self._repo()
+            head = self._remote_head(repo) or self._branch_head(repo)
+            if head is None or not repo.get_shallow():
+                return 0
+            _, _, remote_url = self._resolved_remote(repo)
+            if remote_url is None or isinstance(get_transport_and_path(remote_url)[0], LocalGitClient):
+                raise ValueError(f"Cannot deepen {self.repo_path}: its remote is not reachable through a git server")
+            depth = sum(1 for _ in repo.get_walker(include=[head])) + commits
+            self._sync_from_remote(force=True, depth=depth)
+            return depth if repo.get_shallow() else 0
+
+    def _sync_from_remote(self, *, force: bool, depth: int | None = None) -> None:
+        if not force and self._fetcher is not None:
+            return
         repo = self._repo()
         remote_location, remote_label, remote_url = self._resolved_remote(repo)
         if remote_location is None:
@@ -163,48 +574,251 @@ class GitBackend:
             return
 
         now = time.monotonic()
-        if not force and self.fetch_ttl_seconds > 0 and now - self._last_fetch_at < self.fetch_ttl_seconds:
+        if not force and not self._fetch_due(now):
             logger.debug("Skipping git fetch for %s; within fetch TTL (%ss)", remote_label, self.fetch_ttl_seconds)
             return
 
         logger.debug("Fetching git remote %s for branch %s", remote_label, self.branch)
-        self._run_remote_operation(
-            "fetch",
-            remote_label=remote_label,
-            remote_url=remote_url,
-            operation=lambda: porcelain.fetch(
-                str(self.repo_path),
-                remote_location,
-                outstream=io.StringIO(),
-                errstream=io.BytesIO(),
-                quiet=True,
-                **self._auth_kwargs(),
-            ),
-        )
+        target = repo if depth is None else _NoHavesRepo(str(self.repo_path))
+        try:
+            self._run_remote_operation(
+                "fetch",
+                remote_label=remote_label,
+                remote_url=remote_url,
+                operation=lambda: porcelain.fetch(
+                    target,
+                    remote_location,
+                    outstream=io.StringIO(),
+                    errstream=io.BytesIO(),
+                    quiet=True,
+                    depth=depth,
+                    **self._auth_kwargs(),
+                ),
+            )
+        except Exception:
+            self._record_fetch(time.monotonic() - now, succeeded=False)
+            raise
+        finally:
+            if target is not repo:
+                target.close()
+        self._record_fetch(time.monotonic() - now, succeeded=True)
+        self._remote_location_cache = _UNSET
 
-        repo = self._repo()
         if self._remote_branch_ref in repo.refs.keys():
-            target = repo.refs[self._remote_branch_ref]
-            repo.refs[self._branch_ref] = target
-            repo.refs.set_symbolic_ref(self._head_ref, self._branch_ref)
-            porcelain.reset(str(self.repo_path), mode="hard", treeish=target)
-            logger.debug("Updated local branch %s to remote target %s", self.branch, target.hex())
+            self._advance_branch(repo, repo.refs[self._remote_branch_ref])
 
         self._last_fetch_at = now
 
+    def _advance_branch(self, repo: Repo, target: ObjectID) -> None:
+        """Move the branch to a fetched remote commit, keeping unpushed commits in async push mode."""
+        if self.async_push:
+            target = self._replay_pending(repo, target)
+            if target == self._branch_head(repo):
+                return
+        self._move_branch(repo, target)
+
+    def _move_branch(self, repo: Repo, target: ObjectID) -> None:
+        repo.refs[self._branch_ref] = target
+        repo.refs.set_symbolic_ref(self._head_ref, self._branch_ref)
+        if self.read_mode == "worktree":
+            self._checkout(repo, target)
+        logger.debug("Updated local branch %s to remote target %s", self.branch, target.hex())
+
+    def _run_fetcher(self) -> None:
+        while not self._closing.wait(max(self.fetch_ttl_seconds, 0.1)):
+            try:
+                self._background_fetch()
+            except Exception:
+                status = self.fetch_status()
+                logger.warning(
+                    "Background git fetch failed (%d in a row; last success %s s ago)",
+                    status.consecutive_failures,
+                    "never" if status.last_success_age_seconds is None else f"{status.last_success_age_seconds:.0f}",
+                    exc_info=True,
+                )
+
+    def _background_fetch(self) -> None:
+        """Fetch the remote branch without holding the operation lock, then move the branch under it.
+
+        Objects are only added to the object store during the network transfer, which readers
+        (in this and other processes) tolerate; refs and the checkout change under the lock.
+        """
+        repo = self._repo()
+        remote_location, remote_label, remote_url = self._resolved_remote(repo)
+        if remote_location != "origin":
+            return
+        branch_before = self._branch_head(repo)
+        _, location = porcelain.get_remote_repo(repo, remote_location)
+        client, path = get_transport_and_path(
+            location, config=repo.get_config_stack(), quiet=True, **self._auth_kwargs()
+        )
+        started = time.monotonic()
+        try:
+            result = self._run_remote_operation(
+                "fetch",
+                remote_label=remote_label,
+                remote_url=remote_url,
+                operation=lambda: client.fetch(path.encode(), repo),
+            )
+        except Exception:
+            self._record_fetch(time.monotonic() - started, succeeded=False)
+            raise
+        self._record_fetch(time.monotonic() - started, succeeded=True)
+
+        target = result.refs.get(self._branch_ref)
+        if target is None:
+            return
+        with self._operation_lock():
+            self._remote_location_cache = _UNSET
+            repo = self._repo()
+            if self._branch_head(repo) != branch_before:
+                logger.debug("Branch %s moved during background fetch; keeping it", self.branch)
+                return
+            repo.refs[self._remote_branch_ref] = target
+            if target != branch_before:
+                self._advance_branch(repo, target)
+            self._last_fetch_at = started
+
+    def _record_fetch(self, duration: float, *, succeeded: bool) -> None:
+        with self._stats_lock:
+            self._last_fetch_duration = duration
+            if succeeded:
+                self._last_fetch_success_at = time.monotonic()
+                self._fetch_consecutive_failures = 0
+            else:
+                self._fetch_failures += 1
+                self._fetch_consecutive_failures += 1
+
+    def _run_pusher(self) -> None:
+        backoff = _PUSH_RETRY_MIN_SECONDS
+        while True:
+            self._push_wanted.wait()
+            self._push_wanted.clear()
+            if self._closing.is_set():
+                return
+            try:
+                self._push_pending()
+            except Exception:
+                self._record_push(succeeded=False)
+                status = self.push_status()
+                logger.warning(
+                    "Background git push failed (%d in a row; %d commit(s) pending, oldest %s s); retrying in %.0fs",
+                    status.consecutive_failures,
+                    status.pending_commits,
+                    "-" if status.oldest_pending_age_seconds is None else f"{status.oldest_pending_age_seconds:.0f}",
+                    backoff,
+                    exc_info=True,
+                )
+                if self._closing.wait(backoff):
+                    return
+                backoff = min(backoff * 2, _PUSH_RETRY_MAX_SECONDS)
+                self._push_wanted.set()
+            else:
+                self._record_push(succeeded=True)
+                backoff = _PUSH_RETRY_MIN_SECONDS
+
+    def _push_pending(self) -> None:
+        """Push unpushed commits to origin; on rejection, fetch and replay them onto the remote, then retry.
+
+        The push runs outside the operation lock: it only reads objects and the branch ref, and
+        updates the remote-tracking ref once the remote has accepted it.
+        """
+        repo = self._repo()
+        for _ in range(3):
+            if not self._pending_commits(repo, self._remote_head(repo)):
+                return
+            if self._send_branch(repo, "origin", "origin", self._origin_remote_url(repo)):
+                self._remote_location_cache = _UNSET
+                continue
+            logger.debug("Git push to origin was rejected; replaying unpushed commits onto the remote")
+            with self._operation_lock():
+                self._sync_from_remote(force=True)
+        if self._pending_commits(repo, self._remote_head(repo)):
+            raise ConcurrencyError("Push rejected")
+
+    def _record_push(self, *, succeeded: bool) -> None:
+        with self._stats_lock:
+            if succeeded:
+                self._push_consecutive_failures = 0
+            else:
+                self._push_failures += 1
+                self._push_consecutive_failures += 1
+
+    def _pending_commits(self, repo: Repo, upstream: ObjectID | None) -> Sequence[Commit]:
+        """Commits on the branch that upstream does not contain, newest first."""
+        head = self._branch_head(repo)
+        if head is None:
+            return ()
+        return [entry.commit for entry in repo.get_walker(include=[head], exclude=[upstream] if upstream else [])]
+
+    def _replay_pending(self, repo: Repo, target: ObjectID) -> ObjectID:
+        """Return a commit with target's history plus the branch's unpushed changes, replaying them if needed."""
+        pending = self._pending_commits(repo, target)
+        if not pending:
+            return target
+        if pending[-1].parents == [target]:
+            return pending[0].id
+
+        store = repo.object_store
+        base = target
+        for commit in reversed(pending):
+            base_tree = cast(Commit, store[base]).tree
+            parent_tree = cast(Commit, store[commit.parents[0]]).tree if commit.parents else None
+            changes = [
+                (
+                    change.new.path if change.new is not None else cast(TreeEntry, change.old).path,
+                    change.new.mode if change.new is not None else None,
+                    change.new.sha if change.new is not None else None,
+                )
+                for change in tree_changes(store, parent_tree, commit.tree)
+            ]
+            tree_id = commit_tree_changes(store, base_tree, changes)
+            if tree_id == base_tree:
+                continue
+            replayed = cast(Commit, commit.copy())
+            replayed.tree = tree_id
+            replayed.parents = [base]
+            store.add_object(replayed)
+            base = replayed.id
+        logger.info("Replayed %d unpushed commit(s) onto remote branch %s", len(pending), self.branch)
+        return base
+
+    def _remote_head(self, repo: Repo) -> ObjectID | None:
+        try:
+            return repo.refs[self._remote_branch_ref]
+        except KeyError:
+            return None
+
+    def _publish(self) -> bool:
+        """Push the new commit, or in async push mode leave it to the pusher and acknowledge now."""
+        if self.async_push:
+            self._push_wanted.set()
+            return True
+        return self._push_branch()
+
     def _push_branch(self) -> bool:
         repo = self._repo()
         remote_location, remote_label, remote_url = self._resolved_remote(repo)
         if remote_location is None:
             return True
 
+        if not self._send_branch(repo, remote_location, remote_label, remote_url):
+            logger.debug("Git push to %s was rejected; refreshing from remote before retry", remote_label)
+            self._sync_from_remote(force=True)
+            return False
+
+        self._last_fetch_at = time.monotonic()
+        return True
+
+    def _send_branch(self, repo: Repo, remote_location: str, remote_label: str, remote_url: str | None) -> bool:
+        """Push the branch; False if the remote rejected it."""
         logger.debug("Pushing git branch %s to %s", self.branch, remote_label)
         result = self._run_remote_operation(
             "push",
             remote_label=remote_label,
             remote_url=remote_url,
             operation=lambda: porcelain.push(
-                str(self.repo_path),
+                repo,
                 remote_location,
                 refspecs=f"refs/heads/{self.branch}:refs/heads/{self.branch}",
                 outstream=io.BytesIO(),
@@ -214,11 +828,7 @@ class GitBackend:
         )
         statuses = result.ref_status or {}
         if any(status is not None for status in statuses.values()):
-            logger.debug("Git push to %s was rejected; refreshing from remote before retry", remote_label)
-            self._sync_from_remote(force=True)
             return False
-
-        self._last_fetch_at = time.monotonic()
         logger.debug("Git push to %s succeeded", remote_label)
         return True
 
@@ -228,35 +838,134 @@ class GitBackend:
         data: JsonDoc,
         path_parts: tuple[str, ...],
         if_match: str | None,
-    ) -> None | object:
+        if_none_match: str | None = None,
+    ) -> ETag | object:
+        new_version, rel_path = self._stage_save(object_id, data, path_parts, if_match, if_none_match)
+        if rel_path is None:
+            return new_version
+        self._commit_changes([("update", rel_path)])
+        return new_version if self._publish() else _RETRY
+
+    def _delete_once(self, object_id: str, path_parts: tuple[str, ...]) -> bool | object:
+        deleted, rel_path = self._stage_delete(object_id, path_parts)
+        if rel_path is None:
+            return deleted
+        self._commit_changes([("delete", rel_path)])
+        return True if self._publish() else _RETRY
+
+    def _stage_save(
+        self,
+        object_id: str,
+        data: JsonDoc,
+        path_parts: tuple[str, ...],
+        if_match: str | None,
+        if_none_match: str | None = None,
+    ) -> tuple[ETag, str | None]:
+        """Write and stage a document in the checkout; the staged path is None for a no-op write.
+
+        Reads the checkout rather than the branch tree so that earlier writes staged for the
+        same commit are visible to this one's preconditions.
+        """
         file_path = self._get_fs_path(object_id, *path_parts)
-        current, current_version = self._read_existing(file_path)
-        validate_if_match(if_match, current_version)
+        current, current_version = self._read_checkout(file_path)
+        if current_version is not None:
+            validate_if_match(if_match, current_version)
+        validate_if_none_match(if_none_match, current_version)
 
-        if current is not None and compute_etag(data) == current_version:
-            return None
+        new_version = self._version_of(data)
+        if current is not None and new_version == current_version:
+            return new_version, None
 
+        blob = Blob.from_string(storage_json(data).encode("utf-8"))
+        self._repo().object_store.add_object(blob)
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        atomic_write_json_file(file_path, data)
+        atomic_write_file(file_path, blob.data)
+        self._listings.invalidate(file_path.parent)
         rel_path = self._relative_repo_path(file_path)
-        porcelain.add(str(self.repo_path), paths=[rel_path])
-        self._commit_change("update", rel_path)
-        return None if self._push_branch() else _RETRY
+        self._staged[rel_path] = blob.id
+        return new_version, rel_path
 
-    def _delete_once(self, object_id: str, path_parts: tuple[str, ...]) -> bool | object:
+    def _stage_delete(self, object_id: str, path_parts: tuple[str, ...]) -> tuple[bool, str | None]:
         file_path = self._get_fs_path(object_id, *path_parts)
         if not file_path.exists():
-            return False
+            return False, None
 
         rel_path = self._relative_repo_path(file_path)
-        porcelain.remove(str(self.repo_path), paths=[rel_path])
+        file_path.unlink()
+        self._staged[rel_path] = None
+        self._listings.invalidate(file_path.parent)
         self._prune_empty_dirs(file_path.parent)
-        self._commit_change("delete", rel_path)
-        return True if self._push_branch() else _RETRY
+        return True, rel_path
+
+    def _group_write(self, action: str, stage: Callable[[], tuple[object, str | None]]) -> object:
+        """Queue a write for the next group commit and wait for its outcome.
+
+        The first writer to arrive while no group is forming leads: it waits up to the max
+        latency (less if the group fills up), then commits queued writes in batches until the
+        queue is empty. Everyone else just waits to be acknowledged.
+        """
+        write = _GroupedWrite(action=action, stage=stage)
+        with self._group_lock:
+            self._group_pending.append(write)
+            lead = not self._group_leading
+            self._group_leading = True
+            if len(self._group_pending) >= self.group_commit_max_writes:
+                self._group_full.set()
+        if lead:
+            self._group_full.wait(self.group_commit_max_latency_ms / 1000)
+            self._lead_group_commits()
+        write.done.wait()
+        if write.error is not None:
+            raise write.error
+        return write.result
+
+    def _lead_group_commits(self) -> None:
+        while True:
+            with self._group_lock:
+                batch = self._group_pending[: self.group_commit_max_writes]
+                del self._group_pending[: len(batch)]
+                self._group_full.clear()
+                if not batch:
+                    self._group_leading = False
+                    return
+            self._commit_group(batch)
+
+    def _commit_group(self, batch: Sequence[_GroupedWrite]) -> None:
+        try:
+            with self._operation_lock():
+                for _ in range(2):
+                    if not self.async_push:
+                        self._sync_from_remote(force=True)
+                    self._ensure_worktree_at_branch()
+                    changes: list[tuple[str, str]] = []
+                    for write in batch:
+                        write.error = None
+                        try:
+                            write.result, rel_path = write.stage()
+                        except Exception as exc:
+                            write.error = exc
+                            continue
+                        if rel_path is not None:
+                            changes.append((write.action, rel_path))
+                    if not changes:
+                        return
+                    self._commit_changes(changes)
+                    if self._publish():
+                        logger.debug("Git group commit of %d change(s) pushed", len(changes))
+                        return
+                raise ConcurrencyError("Push rejected")
+        except BaseException as exc:
+            for write in batch:
+                write.error = exc
+        finally:
+            for write in batch:
+                write.done.set()
 
     def _with_write_retry(self, operation: Callable[[], _T | object]) -> _T:
         for _ in range(2):
-            self._sync_from_remote(force=True)
+            if not self.async_push:
+                self._sync_from_remote(force=True)
+            self._ensure_worktree_at_branch()
             result = operation()
             if result is not _RETRY:
                 return cast(_T, result)
@@ -264,23 +973,155 @@ class GitBackend:
 
     @contextmanager
     def _operation_lock(self) -> Iterator[None]:
+        with self._lock.exclusive(), self._file_lock(fcntl.LOCK_EX):
+            yield
+
+    @contextmanager
+    def _read_lock(self) -> Iterator[None]:
+        if self._read_needs_sync():
+            with self._operation_lock():
+                self._sync_or_serve_local(force=False)
+        with self._shared_lock():
+            yield
+
+    @contextmanager
+    def _shared_lock(self) -> Iterator[None]:
+        with self._lock.shared(), self._file_lock(fcntl.LOCK_SH):
+            yield
+
+    @contextmanager
+    def _file_lock(self, operation: int) -> Iterator[None]:
         self._lock_path.parent.mkdir(parents=True, exist_ok=True)
-        with self._lock, self._lock_path.open("a+b") as lock_file:
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        with self._lock_path.open("a+b") as lock_file:
+            fcntl.flock(lock_file.fileno(), operation)
             try:
                 yield
             finally:
                 fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
+    def _sync_or_serve_local(self, *, force: bool) -> None:
+        """Fetch at startup or for a read; with async push a failure is logged and the local branch served."""
+        try:
+            self._sync_from_remote(force=force)
+        except Exception:
+            if not self.async_push:
+                raise
+            self._last_fetch_at = time.monotonic()
+            logger.warning(
+                "Git fetch failed (%d in a row); serving the local branch",
+                self.fetch_status().consecutive_failures,
+                exc_info=True,
+            )
+
+    def _read_needs_sync(self) -> bool:
+        if self._fetcher is not None or not self._fetch_due(time.monotonic()):
+            return False
+        return self._remote_location(self._repo()) is not None
+
+    def _fetch_due(self, now: float) -> bool:
+        return self.fetch_ttl_seconds <= 0 or now - self._last_fetch_at >= self.fetch_ttl_seconds
+
+    def _ensure_worktree_at_branch(self) -> None:
+        """Bring the working tree up to the branch before a write stages files in it (objects mode defers this)."""
+        repo = self._repo()
+        head = self._branch_head(repo)
+        if head is not None:
+            self._checkout(repo, head)
+
+    def _checkout(self, repo: Repo, target: ObjectID) -> None:
+        """Update the working tree from the commit it was checked out at to target.
+
+        Only the paths that differ between the two trees are rewritten. A checkout without a
+        recorded commit gets a full `reset --hard`, which also rebuilds the index.
+        """
+        recorded = repo.refs.read_ref(self._worktree_ref)
+        base = None if recorded is None else ObjectID(recorded)
+        if base == target:
+            return
+        store = repo.object_store
+        if base is None or base not in store:
+            porcelain.reset(repo, mode="hard", treeish=target)
+        else:
+            base_tree = cast(Commit, store[base]).tree
+            for change in tree_changes(store, base_tree, cast(Commit, store[target]).tree):
+                if change.new is None:
+                    self._checkout_path(store, cast(TreeEntry, change.old).path, None)
+                else:
+                    self._checkout_path(store, change.new.path, change.new.sha)
+        repo.refs[self._worktree_ref] = target
+        self._listings.clear()
+
+    def _checkout_path(self, store: BaseObjectStore, path: bytes | None, blob_id: ObjectID | None) -> None:
+        if path is None:
+            return
+        file_path = self.repo_path / path.decode("utf-8")
+        if blob_id is None:
+            file_path.unlink(missing_ok=True)
+            self._prune_empty_dirs(file_path.parent)
+        else:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_file(file_path, cast(Blob, store[blob_id]).data)
+
+    def _branch_head(self, repo: Repo) -> ObjectID | None:
+        signature = self._branch_ref_signature()
+        cached = self._branch_head_cache
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        try:
+            head: ObjectID | None = repo.refs[self._branch_ref]
+        except KeyError:
+            head = None
+        racy_after = time.time_ns() - _RACY_WINDOW_NS
+        if any(entry is not None and entry[1] >= racy_after for entry in signature):
+            self._branch_head_cache = None
+        else:
+            self._branch_head_cache = (signature, head)
+        return head
+
+    def _branch_ref_signature(self) -> tuple[tuple[int, int, int] | None, ...]:
+        """Stat signatures of the files the branch ref can live in; refs are replaced atomically."""
+        git_dir = self.repo_path / ".git"
+        signature: list[tuple[int, int, int] | None] = []
+        for path in (git_dir / self._branch_ref.decode(), git_dir / "packed-refs"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((st.st_ino, st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+
+    def _blob_id(self, repo: Repo, rel_path: str) -> ObjectID | None:
+        return self._trees.blob(repo.object_store, self._branch_head(repo), rel_path)
+
+    def _version_of(self, data: JsonDoc) -> ETag:
+        if self.read_mode == "objects":
+            return Blob.from_string(storage_json(data).encode("utf-8")).id.decode("ascii")
+        return compute_etag(data)
+
     def _read_existing(self, file_path: Path) -> ValueWithETag[JsonDoc]:
+        if self.read_mode == "objects":
+            repo = self._repo()
+            blob_id = self._blob_id(repo, self._relative_repo_path(file_path))
+            if blob_id is None:
+                return None, None
+            return parse_json(cast(Blob, repo.object_store[blob_id]).data), blob_id.decode("ascii")
+        return self._read_checkout(file_path)
+
+    def _read_checkout(self, file_path: Path) -> ValueWithETag[JsonDoc]:
         if not file_path.exists():
             return None, None
+        if self.read_mode == "objects":
+            content = file_path.read_bytes()
+            return parse_json(content), Blob.from_string(content).id.decode("ascii")
         raw = self._read_json_file(file_path)
         return raw, compute_etag(raw)
 
     def _read_json_file(self, file_path: Path) -> dict[str, Any]:
-        with file_path.open("r", encoding="utf-8") as f:
-            return cast(dict[str, Any], json.load(f))
+        return read_json_file(file_path)
+
+    def _storage_key(self, object_id: str, *path_parts: str) -> str:
+        return construct_storage_path(prefix=self.prefix, path_parts=path_parts, object_id=object_id)
 
     def _get_fs_path(self, object_id: str, *path_parts: str) -> Path:
         storage_path = construct_storage_path(prefix=self.prefix, path_parts=path_parts, object_id=object_id)
@@ -306,18 +1147,66 @@ class GitBackend:
     def _author_identity(self) -> bytes:
         return f"{self.author_name} <{self.author_email}>".encode()
 
-    def _commit_change(self, action: str, rel_path: str) -> None:
-        author = self._author_identity()
-        porcelain.commit(
-            str(self.repo_path),
-            message=self._commit_message(action, rel_path),
-            author=author,
-            committer=author,
-        )
+    def _commit_changes(self, changes: Sequence[tuple[str, str]]) -> None:
+        """Commit the staged paths on top of the branch head without going through the index.
+
+        The new tree is the parent tree with just the staged paths replaced, so only the trees
+        along those paths are rewritten; the branch ref is then moved with compare-and-swap. If
+        the commit fails, the staged files in the working tree are put back.
+        """
+        repo = self._repo()
+        store = repo.object_store
+        parent = self._branch_head(repo)
+        staged, self._staged = self._staged, {}
+        try:
+            if parent is None:
+                parent_tree = Tree()
+                store.add_object(parent_tree)
+                base_tree = parent_tree.id
+            else:
+                base_tree = cast(Commit, store[parent]).tree
+            tree_id = commit_tree_changes(
+                store,
+                base_tree,
+                [
+                    (rel_path.encode("utf-8"), None if blob_id is None else _FILE_MODE, blob_id)
+                    for rel_path, blob_id in staged.items()
+                ],
+            )
+            author = self._author_identity()
+            author_timezone, commit_timezone = get_user_timezones()
+            commit = Commit()
+            commit.tree = tree_id
+            commit.parents = [] if parent is None else [parent]
+            commit.author = author
+            commit.committer = author
+            commit.author_time = commit.commit_time = int(time.time())
+            commit.author_timezone = author_timezone
+            commit.commit_timezone = commit_timezone
+            commit.message = self._commit_message(changes)
+            store.add_object(commit)
+            if parent is None:
+                moved = repo.refs.add_if_new(self._branch_ref, commit.id)
+            else:
+                moved = repo.refs.set_if_equals(self._branch_ref, parent, commit.id)
+            if not moved:
+                raise ConcurrencyError(f"Branch {self.branch} moved while committing")
+        except BaseException:
+            for rel_path in staged:
+                blob_id = None if parent is None else self._trees.blob(store, parent, rel_path)
+                self._checkout_path(store, rel_path.encode("utf-8"), blob_id)
+                self._listings.invalidate((self.repo_path / rel_path).parent)
+            raise
+        repo.refs[self._worktree_ref] = commit.id
 
-    def _commit_message(self, action: str, rel_path: str) -> bytes:
-        summary = f"radio-pad-registry: {action} {self._commit_target(rel_path)}"
-        return f"{summary}\n\nGenerated-by: radio-pad-registry".encode()
+    def _commit_message(self, changes: Sequence[tuple[str, str]]) -> bytes:
+        if len(changes) == 1:
+            action, rel_path = changes[0]
+            summary = f"radio-pad-registry: {action} {self._commit_target(rel_path)}"
+            return f"{summary}\n\nGenerated-by: radio-pad-registry".encode()
+        targets = "\n".join(f"- {action} {self._commit_target(rel_path)}" for action, rel_path in changes)
+        summary = f"radio-pad-registry: {len(changes)} changes"
+        return f"{summary}\n\n{targets}\n\nGenerated-by: radio-pad-registry".encode()
 
     def _commit_target(self, rel_path: str) -> str:
         parts = Path(rel_path).parts
@@ -334,9 +1223,11 @@ class GitBackend:
     def _remote_location(self, repo: Repo) -> str | None:
         if self.remote_url == "":
             return None
-        if any(ref.startswith(b"refs/remotes/origin/") for ref in repo.refs.keys()):
-            return "origin"
-        return self.remote_url
+        if self._remote_location_cache is not _UNSET:
+            return cast(str | None, self._remote_location_cache)
+        location = "origin" if repo.refs.keys(base=cast(Ref, b"refs/remotes/origin/")) else self.remote_url
+        self._remote_location_cache = location
+        return location
 
     def _resolved_remote(self, repo: Repo) -> tuple[str | None, str, str | None]:
         remote_location = self._remote_location(repo)
@@ -347,7 +1238,13 @@ class GitBackend:
         return remote_location, self._display_remote(remote_location), remote_location
 
     def _repo(self) -> Repo:
-        return Repo(str(self.repo_path))
+        """Return this thread's Repo handle; handles of threads that have exited are garbage collected."""
+        repo = cast(Repo | None, getattr(self._local, "repo", None))
+        if repo is None:
+            repo = Repo(str(self.repo_path))
+            self._local.repo = repo
+            self._repo_handles.add(repo)
+        return repo
 
     def _run_remote_operation(
         self,
@@ -1,17 +1,22 @@
-import itertools
-import json
+import os
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
 from datastore.core import (
+    DirectoryListingCache,
+    FileVersionCache,
     atomic_write_json_file,
     compute_etag,
     construct_storage_path,
     extract_object_id_from_path,
+    parse_json,
+    select_page,
     strip_id,
     validate_if_match,
+    validate_if_none_match,
 )
-from datastore.types import JsonDoc, PagedResult, ValueWithETag
+from datastore.types import ETag, JsonDoc, PagedResult, ValueWithETag
 
 
 class LocalBackend:
@@ -23,6 +28,11 @@ class LocalBackend:
       This is created by the `construct_storage_path` helper.
     - The physical "filesystem path", which is the absolute path on disk
       (e.g., "/tmp/data/prefix/accounts/acct-123.json").
+
+    Versions are content hashes. They are recorded when a file is written (or first read)
+    and reused while the file's (inode, mtime_ns, size) is unchanged, so reads do not
+    re-hash unchanged documents. Sorted directory listings are likewise reused while the
+    directory's mtime is unchanged.
     """
 
     def __init__(self, base_path: str, prefix: str = "") -> None:
@@ -30,70 +40,123 @@ class LocalBackend:
         self.prefix = prefix.strip("/")
         # Ensure the full root path for this backend exists.
         (self.base_path / self.prefix).mkdir(parents=True, exist_ok=True)
+        self._versions = FileVersionCache()
+        self._listings = DirectoryListingCache()
 
     def _get_fs_path(self, storage_path: str) -> Path:
         """Translates a logical storage path into a physical filesystem path."""
         return self.base_path.joinpath(storage_path)
 
+    def _read(self, file_path: Path, *, with_version: bool = True) -> ValueWithETag[JsonDoc]:
+        """Read and parse a file, returning (None, None) if it does not exist.
+
+        The stat used to look up the version token is taken from the open file handle, so it
+        always describes the bytes that were parsed.
+        """
+        try:
+            with file_path.open("rb") as f:
+                stat = os.fstat(f.fileno())
+                raw = parse_json(f.read())
+        except FileNotFoundError:
+            return None, None
+        if not with_version:
+            return raw, None
+        version = self._versions.get(str(file_path), stat)
+        if version is None:
+            version = compute_etag(raw)
+            self._versions.put(str(file_path), stat, version)
+        return raw, version
+
+    def _current_version(self, file_path: Path) -> str | None:
+        """Return the version of the file on disk, hashing it only if no token is recorded."""
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return None
+        version = self._versions.get(str(file_path), stat)
+        if version is None:
+            _, version = self._read(file_path)
+        return version
+
     def get(self, object_id: str, *path_parts: str) -> ValueWithETag[JsonDoc]:
         """
         Retrieves a JSON object by its ID and path and returns (data, etag).
         """
         storage_path = construct_storage_path(prefix=self.prefix, path_parts=path_parts, object_id=object_id)
-        file_path = self._get_fs_path(storage_path)
-        if not file_path.exists():
-            return None, None
-        with file_path.open("r", encoding="utf-8") as f:
-            raw = json.load(f)
-        return raw, compute_etag(raw)
+        return self._read(self._get_fs_path(storage_path))
 
-    def list(self, *path_parts: str, page: int = 1, per_page: int = 10) -> PagedResult[JsonDoc]:
+    def get_many(self, object_ids: Sequence[str], *path_parts: str) -> list[ValueWithETag[JsonDoc]]:
         """
-        Lists JSON objects from a specified path with pagination.
-        The 'id' of each object is derived from its filename if not present in the file.
+        Retrieves several JSON objects from one directory, returning (data, etag) pairs
+        aligned with object_ids. Missing objects yield (None, None).
         """
         storage_dir = construct_storage_path(prefix=self.prefix, path_parts=path_parts)
         directory = self._get_fs_path(storage_dir)
-        if not directory.exists():
-            return []
+        return [self._read(directory / f"{object_id}.json") for object_id in object_ids]
 
-        files = sorted([p for p in directory.iterdir() if p.suffix == ".json"], key=lambda p: p.stem)
+    def exists(self, object_id: str, *path_parts: str) -> bool:
+        """
+        Returns True if the object exists, without reading or parsing it.
+        """
+        storage_path = construct_storage_path(prefix=self.prefix, path_parts=path_parts, object_id=object_id)
+        return self._get_fs_path(storage_path).is_file()
 
-        start = max(0, (page - 1) * per_page)
-        page_files = itertools.islice(files, start, start + per_page)
+    def list(
+        self, *path_parts: str, page: int = 1, per_page: int = 10, start_after: str | None = None
+    ) -> PagedResult[JsonDoc]:
+        """
+        Lists JSON objects from a specified path with pagination, in filename order.
+        When start_after is given, returns the objects following that id instead of a numbered page.
+        The 'id' of each object is derived from its filename if not present in the file.
+        """
+        storage_dir = construct_storage_path(prefix=self.prefix, path_parts=path_parts)
+        directory = self._get_fs_path(storage_dir)
+        names = self._listings.names(directory)
+        page_names = select_page(names, page=page, per_page=per_page, start_after=start_after)
 
         items: list[dict[str, Any]] = []
-        for p in page_files:
-            obj_id = extract_object_id_from_path(p.name)
-            data, _ = self.get(obj_id, *path_parts)
+        for name in page_names:
+            # Listings carry no versions, so skip the token lookup entirely.
+            data, _ = self._read(directory / name, with_version=False)
             if data is None:
                 continue
-            data["id"] = obj_id
+            data["id"] = extract_object_id_from_path(name)
             items.append(data)
         return items
 
-    def save(self, object_id: str, data: JsonDoc, *path_parts: str, if_match: str | None = None) -> None:
+    def save(
+        self,
+        object_id: str,
+        data: JsonDoc,
+        *path_parts: str,
+        if_match: str | None = None,
+        if_none_match: str | None = None,
+    ) -> ETag:
         """
         Saves a JSON object by its ID to a specified path.
         Keeps any explicit 'id' field provided by caller.
-        If if_match is provided and the file exists, enforce optimistic concurrency using ETag.
+        If if_match is provided and the file exists, enforce optimistic concurrency using ETag;
+        if_none_match="*" refuses to overwrite an existing file.
+        Returns the new ETag.
         """
         storage_path = construct_storage_path(prefix=self.prefix, path_parts=path_parts, object_id=object_id)
         file_path = self._get_fs_path(storage_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         # Concurrency: if_match must match existing ETag when updating; also skip write when unchanged
-        current_etag: str | None = None
-        if file_path.exists():
-            with file_path.open("r", encoding="utf-8") as f:
-                current = json.load(f)
-            current_etag = compute_etag(current)
+        current_etag = self._current_version(file_path)
+        validate_if_none_match(if_none_match, current_etag)
+        if current_etag is not None:
             validate_if_match(if_match, current_etag)
         # Never persist the 'id' field in the JSON content
         to_write = strip_id(data)
+        new_etag = compute_etag(to_write)
         # If content hash matches existing, no-op to avoid churn
-        if current_etag is not None and compute_etag(to_write) == current_etag:
-            return
-        atomic_write_json_file(file_path, to_write)
+        if current_etag is not None and new_etag == current_etag:
+            return current_etag
+        written = atomic_write_json_file(file_path, to_write)
+        self._versions.put(str(file_path), written, new_etag)
+        self._listings.invalidate(file_path.parent)
+        return new_etag
 
     def delete(self, object_id: str, *path_parts: str) -> bool:
         """
@@ -102,7 +165,9 @@ class LocalBackend:
         """
         storage_path = construct_storage_path(prefix=self.prefix, path_parts=path_parts, object_id=object_id)
         file_path = self._get_fs_path(storage_path)
+        self._versions.invalidate(str(file_path))
         if not file_path.exists():
             return False
         file_path.unlink()
+        self._listings.invalidate(file_path.parent)
         return True
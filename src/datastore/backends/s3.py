@@ -1,20 +1,195 @@
-import json
+import bisect
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
 from typing import Any, cast
 
 import boto3
 from botocore.client import BaseClient
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from datastore.core import (
+    EntityCache,
     compute_etag,
     construct_storage_path,
     deconstruct_storage_path,
+    extract_object_id_from_path,
     normalize_etag,
+    parse_json,
+    select_page,
     storage_json,
     strip_id,
-    validate_if_match,
 )
-from datastore.types import JsonDoc, PagedResult, ValueWithETag
+from datastore.exceptions import ConcurrencyError
+from datastore.types import ETag, JsonDoc, PagedResult, ValueWithETag
+from lib.logging import logger
+
+# S3 answers a failed IfMatch/IfNoneMatch with 412 PreconditionFailed, a concurrent conditional
+# write with 409 ConditionalRequestConflict, and IfMatch on a missing key with NoSuchKey
+# (document saves create the key instead, like the other backends).
+_PRECONDITION_CODES = frozenset({"PreconditionFailed", "ConditionalRequestConflict", "NoSuchKey"})
+
+
+def build_client_config(
+    *,
+    max_workers: int = 8,
+    max_pool_connections: int | None = None,
+    connect_timeout: float = 5.0,
+    read_timeout: float = 15.0,
+    retry_mode: str = "adaptive",
+    max_attempts: int = 3,
+    tcp_keepalive: bool = True,
+) -> Config:
+    """botocore settings for the backend's client.
+
+    The pool defaults to the fan-out width (at least botocore's 10) so parallel GETs never
+    wait on, or churn through, connections. Adaptive retries add client-side rate limiting
+    when S3 throttles, and keepalive stops idle pooled connections from being dropped.
+    """
+    if max_pool_connections is None:
+        max_pool_connections = max(10, max_workers)
+    if max_pool_connections < 1:
+        raise ValueError("max_pool_connections must be >= 1")
+    return Config(
+        max_pool_connections=max_pool_connections,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        retries={"mode": retry_mode, "total_max_attempts": max_attempts},
+        tcp_keepalive=tcp_keepalive,
+    )
+
+
+class _PoolMonitor:
+    """Counts in-flight requests on a client and warns when they outnumber its pooled connections.
+
+    botocore's pool does not block: requests beyond max_pool_connections open extra connections
+    that are discarded afterwards, so saturation shows up as handshakes and latency, not errors.
+    """
+
+    def __init__(self, pool_size: int, *, warn_interval_seconds: float = 60.0) -> None:
+        self.pool_size = pool_size
+        self.warn_interval_seconds = warn_interval_seconds
+        self.in_flight = 0
+        self.peak = 0
+        self._last_warning: float | None = None
+        self._lock = Lock()
+
+    def attach(self, client: BaseClient) -> None:
+        client.meta.events.register("before-send.s3", self._started)
+        client.meta.events.register("response-received.s3", self._finished)
+
+    def _started(self, **_: object) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            in_flight = self.in_flight
+            warn = in_flight > self.pool_size and (
+                self._last_warning is None or now - self._last_warning >= self.warn_interval_seconds
+            )
+            if warn:
+                self._last_warning = now
+        if warn:
+            logger.warning(
+                "S3 connection pool saturated: %d requests in flight for %d pooled connections; "
+                "raise REGISTRY_BACKEND_S3_MAX_POOL_CONNECTIONS",
+                in_flight,
+                self.pool_size,
+            )
+
+    def _finished(self, **_: object) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+# Per-directory summary index. Slugs cannot start with "_", so it never collides with a document.
+MANIFEST_NAME = "_index.json"
+_MANIFEST_ATTEMPTS = 5
+
+
+@dataclass(frozen=True, slots=True)
+class _Manifest:
+    """A directory's summary index as last read from (or written to) S3."""
+
+    etag: ETag
+    # object id -> {"version": <document ETag>, "summary": <top-level scalar fields>}
+    entries: dict[str, dict[str, Any]]
+    # "<id>.json" names in storage-key order, for select_page
+    names: tuple[str, ...]
+
+    @classmethod
+    def build(cls, etag: ETag, entries: dict[str, dict[str, Any]]) -> "_Manifest":
+        return cls(etag=etag, entries=entries, names=tuple(sorted(f"{object_id}.json" for object_id in entries)))
+
+
+def _summary(data: JsonDoc) -> dict[str, Any]:
+    """Top-level scalar fields of a document; nested values such as preset stations are left out."""
+    return {k: v for k, v in data.items() if v is None or isinstance(v, str | int | float | bool)}
+
+
+class _PageTokenCache:
+    """Bounded, TTL-limited map of (directory, per_page, page) to the continuation token that starts that page.
+
+    Tokens pin page boundaries to keys, so they drift from offset paging as the collection
+    changes. The TTL bounds that drift for writes made by other processes; this process's own
+    writes drop the directory's tokens immediately.
+    """
+
+    def __init__(self, *, max_entries: int = 1024, ttl_seconds: float = 60.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, int, int], tuple[str, float]] = OrderedDict()
+        # sorted cached page numbers per (directory, per_page), so lookups bisect instead of scanning
+        self._pages: dict[tuple[str, int], list[int]] = {}
+        self._lock = Lock()
+
+    def nearest(self, storage_dir: str, per_page: int, page: int) -> tuple[int, str | None]:
+        """Return the closest page at or before `page` with a fresh token, or (1, None)."""
+        now = time.monotonic()
+        with self._lock:
+            pages = self._pages.get((storage_dir, per_page), [])
+            index = bisect.bisect_right(pages, page)
+            while index > 0:
+                index -= 1
+                candidate = pages[index]
+                if candidate <= 1:
+                    break
+                key = (storage_dir, per_page, candidate)
+                token, stored_at = self._entries[key]
+                if now - stored_at >= self.ttl_seconds:
+                    self._drop(key)
+                    continue
+                self._entries.move_to_end(key)
+                return candidate, token
+        return 1, None
+
+    def put(self, storage_dir: str, per_page: int, page: int, token: str) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            key = (storage_dir, per_page, page)
+            if key not in self._entries:
+                bisect.insort(self._pages.setdefault((storage_dir, per_page), []), page)
+            self._entries[key] = (token, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, storage_dir: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == storage_dir]:
+                self._drop(key)
+
+    def _drop(self, key: tuple[str, int, int]) -> None:
+        del self._entries[key]
+        pages = self._pages[key[:2]]
+        pages.pop(bisect.bisect_left(pages, key[2]))
+        if not pages:
+            del self._pages[key[:2]]
 
 
 class S3Backend:
@@ -23,13 +198,48 @@ class S3Backend:
     Notes:
     - Stores documents under keys like: <prefix>/<path...>/<id>.json
     - Stores a content hash in object metadata as 'rpr-sha256' for cheap identity checks.
-    - For optimistic concurrency we return/compare backend tokens (VersionId if available else ETag).
+    - Versions are S3 ETags. Writes are conditional PUTs (IfMatch for updates, IfNoneMatch="*"
+      for creates), so S3 enforces optimistic concurrency in the same request as the write.
+    - Batch reads (get_many, list) fan out GETs over a bounded thread pool of max_workers
+      threads sharing one client; results keep the requested (storage-key) order.
+    - With manifests enabled, each indexed directory holds an `_index.json` with the sorted ids,
+      versions and scalar summary fields of its documents. Listings page over the manifest instead
+      of calling ListObjectsV2, and summary listings are served from it with a single (usually
+      304) GET. Writes update it with conditional PUTs; `rebuild_manifests` creates and repairs it.
     """
 
-    def __init__(self, bucket: str, prefix: str = "", client: BaseClient | None = None) -> None:
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        client: BaseClient | None = None,
+        *,
+        config: Config | None = None,
+        max_workers: int = 8,
+        page_token_ttl_seconds: float = 60.0,
+        manifests: bool = False,
+    ) -> None:
         self.bucket = bucket
         self.prefix = prefix.strip("/")
-        self.client = client or boto3.client("s3")
+        self.max_workers = max_workers
+        self.client = client or boto3.client("s3", config=config or build_client_config(max_workers=max_workers))
+        pool_size = self.client.meta.config.max_pool_connections
+        if pool_size < max_workers:
+            logger.warning(
+                "S3 connection pool (%d) is smaller than the fetch width (%d); parallel reads will churn connections",
+                pool_size,
+                max_workers,
+            )
+        self._pool_monitor = _PoolMonitor(pool_size)
+        self._pool_monitor.attach(self.client)
+        # threads are only spawned on first submit, so an idle pool costs nothing
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="s3-get")
+        # key -> (rpr-sha256, ETag) last seen by this process; a hint for skipping unchanged writes
+        self._known_hashes = EntityCache(max_entries=4096, ttl_seconds=0)
+        self._page_tokens = _PageTokenCache(ttl_seconds=page_token_ttl_seconds)
+        self.manifests = manifests
+        # manifest key -> _Manifest last seen by this process; revalidated with If-None-Match on every read
+        self._manifest_cache = EntityCache(max_entries=256, ttl_seconds=0)
 
     def _handle_s3_error(self, error: ClientError, ignore_codes: set[str]) -> None:
         """Re-raises a ClientError unless its code is in the ignore list."""
@@ -37,6 +247,9 @@ class S3Backend:
         if code not in ignore_codes:
             raise error
 
+    def _storage_dir(self, path_parts: tuple[str, ...]) -> str:
+        return construct_storage_path(prefix=self.prefix, path_parts=path_parts)
+
     def _get_head(self, key: str) -> dict[str, Any] | None:
         try:
             # boto3 client methods are untyped (Any); cast to the expected mapping
@@ -52,38 +265,174 @@ class S3Backend:
         except ClientError as e:
             self._handle_s3_error(e, ignore_codes={"NoSuchKey", "404", "NotFound"})
             return None, None
-        body = resp["Body"].read()
-        raw = json.loads(body.decode("utf-8"))
-        # compute returned token: prefer VersionId if present
-        token = normalize_etag(resp.get("VersionId") or resp.get("ETag"))
+        raw = parse_json(resp["Body"].read())
+        token = normalize_etag(resp.get("ETag"))
+        content_hash = resp.get("Metadata", {}).get("rpr-sha256")
+        if token is not None and content_hash is not None:
+            self._known_hashes.put(storage_path, content_hash, token)
         return raw, token
 
-    def list(self, *path_parts: str, page: int = 1, per_page: int = 10) -> PagedResult[JsonDoc]:
-        storage_dir = construct_storage_path(prefix=self.prefix, path_parts=path_parts)
+    def get_many(self, object_ids: Sequence[str], *path_parts: str) -> list[ValueWithETag[JsonDoc]]:
+        if len(object_ids) <= 1 or self.max_workers <= 1:
+            return [self.get(object_id, *path_parts) for object_id in object_ids]
+        return list(self._executor.map(lambda object_id: self.get(object_id, *path_parts), object_ids))
 
-        paginator = self.client.get_paginator("list_objects_v2")
-        page_iterator = paginator.paginate(
-            Bucket=self.bucket,
-            Prefix=storage_dir,
-            Delimiter="/",  # only get direct children, not nested objects
-            PaginationConfig={"PageSize": per_page},
-        )
+    def exists(self, object_id: str, *path_parts: str) -> bool:
+        storage_path = construct_storage_path(prefix=self.prefix, path_parts=path_parts, object_id=object_id)
+        return self._get_head(storage_path) is not None
 
-        # Get the target page with simple enumeration, filtering for .json files
-        files = []
-        for i, page_content in enumerate(page_iterator, 1):
-            if i == page:
-                files = [
-                    item["Key"] for item in page_content.get("Contents", []) if item.get("Key", "").endswith(".json")
-                ]
+    def _list_keys_after(self, storage_dir: str, start_key: str, limit: int) -> list[str]:
+        """Collect up to `limit` direct-child .json keys after start_key, resuming with continuation tokens.
+
+        Common prefixes (nested "directories") count toward MaxKeys, so a single response may
+        hold fewer than `limit` documents even when more exist.
+        """
+        keys: list[str] = []
+        params: dict[str, Any] = {
+            "Bucket": self.bucket,
+            "Prefix": storage_dir,
+            "Delimiter": "/",
+            "StartAfter": start_key,
+        }
+        while len(keys) < limit:
+            resp = self.client.list_objects_v2(**params, MaxKeys=limit - len(keys))
+            keys.extend(self._json_keys(resp))
+            if not resp.get("IsTruncated"):
                 break
+            params.pop("StartAfter", None)
+            params["ContinuationToken"] = resp["NextContinuationToken"]
+        return keys[:limit]
+
+    def _list_page(self, storage_dir: str, page: int, per_page: int) -> list[str]:
+        """Return the .json keys on 1-based listing page `page` of `per_page` entries.
+
+        Resumes from the nearest cached continuation token instead of walking from the first
+        page, and caches the token for every page it passes, so sequential paging costs one
+        list call per page.
+        """
+        current, token = self._page_tokens.nearest(storage_dir, per_page, page)
+        while True:
+            params: dict[str, Any] = {
+                "Bucket": self.bucket,
+                "Prefix": storage_dir,
+                "Delimiter": "/",  # only get direct children, not nested objects
+                "MaxKeys": per_page,
+            }
+            if token is not None:
+                params["ContinuationToken"] = token
+            try:
+                resp = self.client.list_objects_v2(**params)
+            except ClientError:
+                if token is None:
+                    raise
+                # expired or otherwise rejected token: forget this directory's tokens and rewalk
+                self._page_tokens.invalidate(storage_dir)
+                current, token = 1, None
+                continue
+            token = resp.get("NextContinuationToken") if resp.get("IsTruncated") else None
+            if token is not None:
+                self._page_tokens.put(storage_dir, per_page, current + 1, token)
+            if current == page:
+                return self._json_keys(resp)
+            if token is None:
+                return []
+            current += 1
 
-        page_files = [deconstruct_storage_path(key, prefix=self.prefix) for key in files]
-        page_files.sort(key=lambda item: item[0])  # Sort by object_id (index 0), match local backend behavior.
+    def _json_keys(self, listing: dict[str, Any]) -> list[str]:
+        return [
+            item["Key"]
+            for item in listing.get("Contents", [])
+            if item.get("Key", "").endswith(".json") and item["Key"].rpartition("/")[2] != MANIFEST_NAME
+        ]
+
+    def _read_manifest(self, storage_dir: str) -> _Manifest | None:
+        """Return the directory's manifest, or None if the directory is not indexed."""
+        key = f"{storage_dir}{MANIFEST_NAME}"
+        cached = self._manifest_cache.get(key)
+        conditions = {"IfNoneMatch": f'"{cached.version}"'} if cached is not None else {}
+        try:
+            resp = self.client.get_object(Bucket=self.bucket, Key=key, **conditions)
+        except ClientError as e:
+            if cached is not None and e.response.get("Error", {}).get("Code") in {"304", "NotModified"}:
+                return cast(_Manifest, cached.value)
+            self._manifest_cache.invalidate(key)
+            self._handle_s3_error(e, ignore_codes={"NoSuchKey", "404", "NotFound"})
+            return None
+        manifest = _Manifest.build(
+            cast(ETag, normalize_etag(resp.get("ETag"))), parse_json(resp["Body"].read())["entries"]
+        )
+        self._manifest_cache.put(key, manifest, manifest.etag)
+        return manifest
+
+    def _write_manifest(self, storage_dir: str, entries: dict[str, dict[str, Any]], current: _Manifest | None) -> bool:
+        """Replace the manifest if it is still `current`; False when another writer got there first."""
+        key = f"{storage_dir}{MANIFEST_NAME}"
+        conditions = {"IfMatch": f'"{current.etag}"'} if current is not None else {"IfNoneMatch": "*"}
+        body = storage_json({"entries": entries}).encode("utf-8")
+        try:
+            resp = self.client.put_object(Bucket=self.bucket, Key=key, Body=body, **conditions)
+        except ClientError as e:
+            self._manifest_cache.invalidate(key)
+            if e.response.get("Error", {}).get("Code") in _PRECONDITION_CODES:
+                return False
+            raise
+        manifest = _Manifest.build(cast(ETag, normalize_etag(resp.get("ETag"))), entries)
+        self._manifest_cache.put(key, manifest, manifest.etag)
+        return True
+
+    def _update_manifest(self, storage_dir: str, object_id: str, entry: dict[str, Any] | None) -> None:
+        """Record a document write (or a delete, when entry is None) in its directory's manifest.
+
+        Directories without a manifest are left alone; rebuild_manifests indexes them. Before
+        each attempt the document is HEADed, and the update is dropped if it no longer holds the
+        version being recorded: the writer that replaced it records its own version, so racing
+        writers cannot leave an older summary behind. Failures are logged rather than raised
+        because the document write itself has already succeeded.
+        """
+        storage_path = f"{storage_dir}{object_id}.json"
+        expected = entry["version"] if entry is not None else None
+        try:
+            for _ in range(_MANIFEST_ATTEMPTS):
+                current = self._read_manifest(storage_dir)
+                if current is None:
+                    return
+                head = self._get_head(storage_path)
+                if (normalize_etag(head.get("ETag")) if head is not None else None) != expected:
+                    return
+                entries = dict(current.entries)
+                if entry is None:
+                    if entries.pop(object_id, None) is None:
+                        return
+                elif entries.get(object_id) == entry:
+                    return
+                else:
+                    entries[object_id] = entry
+                if self._write_manifest(storage_dir, entries, current):
+                    return
+        except ClientError:
+            logger.exception("Failed to update S3 manifest for %s; rebuild manifests to repair it", storage_path)
+            return
+        logger.warning("Gave up updating S3 manifest for %s after %d conflicts", storage_path, _MANIFEST_ATTEMPTS)
+
+    def list(
+        self, *path_parts: str, page: int = 1, per_page: int = 10, start_after: str | None = None
+    ) -> PagedResult[JsonDoc]:
+        storage_dir = construct_storage_path(prefix=self.prefix, path_parts=path_parts)
+        manifest = self._read_manifest(storage_dir) if self.manifests else None
+
+        if manifest is not None:
+            names = select_page(manifest.names, page=page, per_page=per_page, start_after=start_after)
+            files = [f"{storage_dir}{name}" for name in names]
+        elif start_after is not None:
+            files = self._list_keys_after(storage_dir, f"{storage_dir}{start_after}.json", per_page)
+        else:
+            files = self._list_page(storage_dir, max(1, page), per_page)
+
+        # Keep storage-key order; local backends sort by filename to match.
+        page_ids = [deconstruct_storage_path(key, prefix=self.prefix)[0] for key in sorted(files)]
 
         items: list[dict[str, Any]] = []
-        for obj_id, path_parts_from_key in page_files:
-            data, _ = self.get(obj_id, *path_parts_from_key)
+        for obj_id, (data, _) in zip(page_ids, self.get_many(page_ids, *path_parts), strict=True):
             if data is None:
                 continue
             data["id"] = obj_id
@@ -91,25 +440,92 @@ class S3Backend:
 
         return items
 
-    def save(self, object_id: str, data: JsonDoc, *path_parts: str, if_match: str | None = None) -> None:
+    def list_summaries(
+        self, *path_parts: str, page: int = 1, per_page: int = 10, start_after: str | None = None
+    ) -> PagedResult[JsonDoc]:
+        """List summaries from the directory's manifest, falling back to full documents without one."""
+        storage_dir = construct_storage_path(prefix=self.prefix, path_parts=path_parts)
+        manifest = self._read_manifest(storage_dir) if self.manifests else None
+        if manifest is None:
+            return self.list(*path_parts, page=page, per_page=per_page, start_after=start_after)
+        names = select_page(manifest.names, page=page, per_page=per_page, start_after=start_after)
+        summaries: list[dict[str, Any]] = []
+        for name in names:
+            object_id = extract_object_id_from_path(name)
+            summaries.append({**manifest.entries[object_id]["summary"], "id": object_id})
+        return summaries
+
+    def save(
+        self,
+        object_id: str,
+        data: JsonDoc,
+        *path_parts: str,
+        if_match: str | None = None,
+        if_none_match: str | None = None,
+    ) -> ETag:
         storage_path = construct_storage_path(prefix=self.prefix, path_parts=path_parts, object_id=object_id)
+        # Never persist the 'id' field in the JSON content
         to_write = strip_id(data)
         new_hash = compute_etag(to_write)
-        head = self._get_head(storage_path)
-        current_etag = None
-        current_hash = None
-        if head is not None:
-            # HEAD metadata keys are lowercase in boto3
-            current_hash = head.get("Metadata", {}).get("rpr-sha256")
-            current_etag = normalize_etag(head.get("VersionId") or head.get("ETag"))
-            # enforce optimistic concurrency
-            validate_if_match(if_match, current_etag)
-            # no-op if identical content
-            if current_hash == new_hash:
-                return
-        # Never persist the 'id' field in the JSON content
+        if if_none_match is None:
+            unchanged = self._unchanged_version(storage_path, new_hash, if_match)
+            if unchanged is not None:
+                return unchanged
+
+        # Conditions are enforced by S3 itself, so there is no window between check and write.
+        conditions: dict[str, str] = {}
+        if if_match is not None:
+            conditions["IfMatch"] = f'"{if_match}"'
+        if if_none_match is not None:
+            conditions["IfNoneMatch"] = if_none_match
         body = storage_json(to_write).encode("utf-8")
-        self.client.put_object(Bucket=self.bucket, Key=storage_path, Body=body, Metadata={"rpr-sha256": new_hash})
+
+        def put(conditions: dict[str, str]) -> Any:
+            return self.client.put_object(
+                Bucket=self.bucket, Key=storage_path, Body=body, Metadata={"rpr-sha256": new_hash}, **conditions
+            )
+
+        try:
+            try:
+                resp = put(conditions)
+            except ClientError as e:
+                if if_match is None or e.response.get("Error", {}).get("Code") != "NoSuchKey":
+                    raise
+                # if_match only guards an existing object; create it unless another writer just did
+                resp = put({"IfNoneMatch": "*"})
+        except ClientError as e:
+            self._known_hashes.invalidate(storage_path)
+            if e.response.get("Error", {}).get("Code") in _PRECONDITION_CODES:
+                raise ConcurrencyError("ETag mismatch") from e
+            raise
+        version = cast(ETag, normalize_etag(resp.get("ETag")))
+        self._known_hashes.put(storage_path, new_hash, version)
+        self._page_tokens.invalidate(self._storage_dir(path_parts))
+        if self.manifests:
+            self._update_manifest(
+                self._storage_dir(path_parts), object_id, {"version": version, "summary": _summary(to_write)}
+            )
+        return version
+
+    def _unchanged_version(self, key: str, new_hash: str, if_match: str | None) -> ETag | None:
+        """Return the current version if the object is known to already hold new_hash.
+
+        The rpr-sha256 seen on this process's last read or write of the key is only a hint: a
+        HEAD conditioned on the remembered ETag confirms the object is unchanged before the
+        write is skipped, so a stale hint costs one extra request, never a lost write.
+        """
+        known = self._known_hashes.get(key)
+        if known is None or known.value != new_hash or known.version is None:
+            return None
+        if if_match is not None and if_match != known.version:
+            return None
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key, IfMatch=f'"{known.version}"')
+        except ClientError as e:
+            self._known_hashes.invalidate(key)
+            self._handle_s3_error(e, ignore_codes={"412", "PreconditionFailed", "404", "NotFound"})
+            return None
+        return known.version
 
     def delete(self, object_id: str, *path_parts: str) -> bool:
         storage_path = construct_storage_path(prefix=self.prefix, path_parts=path_parts, object_id=object_id)
@@ -118,4 +534,52 @@ class S3Backend:
         if head is None:
             return False
         self.client.delete_object(Bucket=self.bucket, Key=storage_path)
+        self._known_hashes.invalidate(storage_path)
+        self._page_tokens.invalidate(self._storage_dir(path_parts))
+        if self.manifests:
+            self._update_manifest(self._storage_dir(path_parts), object_id, None)
         return True
+
+    def rebuild_manifests(self, *path_parts: str) -> Sequence[str]:
+        """Create or repair the manifest of every directory at or below path_parts.
+
+        Walks the keys once and only GETs documents whose listed ETag differs from the version
+        already recorded, so repairing a mostly-correct manifest is cheap. Each manifest is
+        replaced with a conditional PUT and recomputed if a concurrent writer changed it.
+        Returns the directories whose manifest was written.
+        """
+        listed: dict[str, dict[str, ETag]] = {}
+        paginator = self.client.get_paginator("list_objects_v2")
+        for listing in paginator.paginate(Bucket=self.bucket, Prefix=self._storage_dir(path_parts)):
+            for item in listing.get("Contents", []):
+                directory, _, name = item["Key"].rpartition("/")
+                storage_dir = f"{directory}/" if directory else ""
+                documents = listed.setdefault(storage_dir, {})
+                if name.endswith(".json") and name != MANIFEST_NAME:
+                    documents[name.removesuffix(".json")] = cast(ETag, normalize_etag(item.get("ETag")))
+
+        rebuilt: list[str] = []
+        for storage_dir, documents in sorted(listed.items()):
+            if self._rebuild_manifest(storage_dir, documents):
+                rebuilt.append(storage_dir)
+        return rebuilt
+
+    def _rebuild_manifest(self, storage_dir: str, documents: dict[str, ETag]) -> bool:
+        _, dir_parts = deconstruct_storage_path(f"{storage_dir}{MANIFEST_NAME}", prefix=self.prefix)
+        for _ in range(_MANIFEST_ATTEMPTS):
+            current = self._read_manifest(storage_dir)
+            known = current.entries if current is not None else {}
+            entries = {
+                object_id: known[object_id]
+                for object_id, version in documents.items()
+                if object_id in known and known[object_id].get("version") == version
+            }
+            stale = [object_id for object_id in documents if object_id not in entries]
+            for object_id, (data, version) in zip(stale, self.get_many(stale, *dir_parts), strict=True):
+                if data is not None and version is not None:
+                    entries[object_id] = {"version": version, "summary": _summary(data)}
+            if current is not None and entries == current.entries:
+                return False
+            if self._write_manifest(storage_dir, entries, current):
+                return True
+        raise ConcurrencyError(f"Manifest for {storage_dir!r} kept changing during rebuild")
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, cast
+
+from datastore.core import (
+    canonical_json,
+    compute_etag,
+    construct_storage_path,
+    extract_object_id_from_path,
+    parse_json,
+    strip_id,
+    validate_if_match,
+    validate_if_none_match,
+)
+from datastore.types import ETag, JsonDoc, PagedResult, ValueWithETag
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    collection TEXT NOT NULL,
+    name TEXT NOT NULL,
+    body TEXT NOT NULL,
+    version TEXT NOT NULL,
+    PRIMARY KEY (collection, name)
+) WITHOUT ROWID
+"""
+
+# Stay well below SQLite's default host-parameter limit for IN (...) batches.
+_MAX_BATCH = 500
+
+
+class SQLiteBackend:
+    """SQLite-backed ObjectStore implementation using a single WAL-mode database file.
+
+    Notes:
+    - Rows are keyed on (collection, name) where collection is the rendered storage
+      directory (e.g. "registry-v1/accounts") and name is the object key "<id>.json".
+      Keying on the object key keeps listing order identical to the filesystem and S3
+      backends (storage-key order).
+    - The version is the SHA-256 content hash, matching LocalBackend's tokens.
+    - Conditional writes check and update the version inside one IMMEDIATE transaction.
+    - Listing is a range scan over the primary key; no directory walk or sort.
+    """
+
+    def __init__(self, db_path: str, prefix: str = "", *, busy_timeout_ms: int = 5000) -> None:
+        self.db_path = Path(db_path)
+        self.prefix = prefix.strip("/")
+        self.busy_timeout_ms = busy_timeout_ms
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._transaction() as conn:
+            conn.execute(_SCHEMA)
+
+    def get(self, object_id: str, *path_parts: str) -> ValueWithETag[JsonDoc]:
+        row = (
+            self._conn()
+            .execute(
+                "SELECT body, version FROM objects WHERE collection = ? AND name = ?",
+                (self._collection(*path_parts), self._name(object_id)),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None, None
+        return parse_json(row[0]), cast(str, row[1])
+
+    def get_many(self, object_ids: Sequence[str], *path_parts: str) -> list[ValueWithETag[JsonDoc]]:
+        collection = self._collection(*path_parts)
+        found: dict[str, tuple[str, str]] = {}
+        conn = self._conn()
+        for start in range(0, len(object_ids), _MAX_BATCH):
+            names = [self._name(object_id) for object_id in object_ids[start : start + _MAX_BATCH]]
+            placeholders = ",".join("?" * len(names))
+            rows = conn.execute(
+                f"SELECT name, body, version FROM objects WHERE collection = ? AND name IN ({placeholders})",
+                (collection, *names),
+            )
+            found.update({name: (body, version) for name, body, version in rows})
+
+        results: list[ValueWithETag[JsonDoc]] = []
+        for object_id in object_ids:
+            hit = found.get(self._name(object_id))
+            results.append((None, None) if hit is None else (parse_json(hit[0]), hit[1]))
+        return results
+
+    def exists(self, object_id: str, *path_parts: str) -> bool:
+        row = (
+            self._conn()
+            .execute(
+                "SELECT 1 FROM objects WHERE collection = ? AND name = ?",
+                (self._collection(*path_parts), self._name(object_id)),
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    def list(
+        self, *path_parts: str, page: int = 1, per_page: int = 10, start_after: str | None = None
+    ) -> PagedResult[JsonDoc]:
+        collection = self._collection(*path_parts)
+        if start_after is not None:
+            rows = self._conn().execute(
+                "SELECT name, body FROM objects WHERE collection = ? AND name > ? ORDER BY name LIMIT ?",
+                (collection, self._name(start_after), per_page),
+            )
+        else:
+            rows = self._conn().execute(
+                "SELECT name, body FROM objects WHERE collection = ? ORDER BY name LIMIT ? OFFSET ?",
+                (collection, per_page, max(0, (page - 1) * per_page)),
+            )
+
+        items: list[dict[str, Any]] = []
+        for name, body in rows:
+            data = parse_json(body)
+            data["id"] = extract_object_id_from_path(name)
+            items.append(data)
+        return items
+
+    def save(
+        self,
+        object_id: str,
+        data: JsonDoc,
+        *path_parts: str,
+        if_match: str | None = None,
+        if_none_match: str | None = None,
+    ) -> ETag:
+        key = (self._collection(*path_parts), self._name(object_id))
+        to_write = strip_id(data)
+        new_version = compute_etag(to_write)
+        with self._transaction() as conn:
+            row = conn.execute("SELECT version FROM objects WHERE collection = ? AND name = ?", key).fetchone()
+            current_version = None if row is None else cast(str, row[0])
+            validate_if_none_match(if_none_match, current_version)
+            if current_version is not None:
+                validate_if_match(if_match, current_version)
+                # If content hash matches existing, no-op to avoid churn
+                if current_version == new_version:
+                    return current_version
+            conn.execute(
+                "INSERT INTO objects (collection, name, body, version) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (collection, name) DO UPDATE SET body = excluded.body, version = excluded.version",
+                (*key, canonical_json(to_write), new_version),
+            )
+        return new_version
+
+    def delete(self, object_id: str, *path_parts: str) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM objects WHERE collection = ? AND name = ?",
+                (self._collection(*path_parts), self._name(object_id)),
+            )
+            return cursor.rowcount > 0
+
+    def _collection(self, *path_parts: str) -> str:
+        return construct_storage_path(prefix=self.prefix, path_parts=path_parts).rstrip("/")
+
+    def _name(self, object_id: str) -> str:
+        return f"{object_id}.json"
+
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection; sqlite3 connections must not be shared across threads."""
+        conn = cast(sqlite3.Connection | None, getattr(self._local, "conn", None))
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), isolation_level=None, timeout=self.busy_timeout_ms / 1000)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
@@ -1,32 +1,57 @@
+from .cache import CachedEntity, DirectoryListingCache, EntityCache, FileVersionCache
+from .codec import JsonCodec, build_codec, get_codec, set_codec
 from .helpers import (
+    atomic_write_file,
     atomic_write_json_file,
+    canonical_json,
     compute_etag,
     construct_storage_path,
     deconstruct_storage_path,
     extract_object_id_from_path,
     normalize_etag,
+    parse_json,
+    read_json_file,
+    select_page,
+    sorted_object_names,
     storage_json,
     strip_id,
     validate_if_match,
+    validate_if_none_match,
 )
-from .interfaces import ModelWithId, ObjectStore, SeedableStore
+from .interfaces import ModelWithId, ObjectStore, SeedableStore, SummaryListingStore
 from .model_store import ModelStore
 from .seeding import seed_from_path, seedable
 
 __all__ = [
+    "CachedEntity",
+    "DirectoryListingCache",
+    "EntityCache",
+    "FileVersionCache",
+    "JsonCodec",
     "ModelStore",
     "ModelWithId",
     "ObjectStore",
     "SeedableStore",
+    "SummaryListingStore",
+    "atomic_write_file",
     "atomic_write_json_file",
+    "build_codec",
+    "canonical_json",
     "compute_etag",
     "construct_storage_path",
     "deconstruct_storage_path",
     "extract_object_id_from_path",
+    "get_codec",
     "normalize_etag",
+    "parse_json",
+    "read_json_file",
     "seed_from_path",
     "seedable",
+    "select_page",
+    "set_codec",
+    "sorted_object_names",
     "storage_json",
     "strip_id",
     "validate_if_match",
+    "validate_if_none_match",
 ]
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+
+from ..types import ETag
+from .helpers import sorted_object_names
+
+# Directories modified this recently may change again within the same mtime tick, so their
+# listings are not cached (the same "racy" rule git applies to its index).
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class CachedEntity:
+    """A validated entity together with the backend version it was read at."""
+
+    value: object
+    version: ETag | None
+    stored_at: float
+
+
+class EntityCache:
+    """Bounded, thread-safe LRU of validated entities keyed by rendered storage path.
+
+    Entries younger than `ttl_seconds` are served without touching the backend. Older
+    entries are kept as revalidation candidates: callers compare the cached version to the
+    backend's current version and only re-validate the document when it has changed.
+
+    Every invalidation stamps the key with a new generation. Readers capture `generation(key)`
+    before reading the backend and pass it to `put`, which drops the entry if the key was
+    invalidated in between, so a read racing a write cannot re-cache the document it replaced.
+    Generations are kept for the `max_entries` most recently invalidated keys; keys whose stamp
+    has been evicted report the highest evicted stamp, which only makes `put` more conservative.
+    """
+
+    def __init__(self, *, max_entries: int = 1024, ttl_seconds: float = 5.0) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if ttl_seconds < 0:
+            raise ValueError("ttl_seconds must be >= 0")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, CachedEntity] = OrderedDict()
+        self._generations: OrderedDict[str, int] = OrderedDict()
+        self._generation_counter = 0
+        self._generation_floor = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def generation(self, key: str) -> int:
+        """Return the current invalidation generation of key, to be passed back to `put`."""
+        with self._lock:
+            return self._generations.get(key, self._generation_floor)
+
+    def get(self, key: str) -> CachedEntity | None:
+        """Return the entry for key (fresh or stale), marking it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry: CachedEntity) -> bool:
+        return time.monotonic() - entry.stored_at < self.ttl_seconds
+
+    def put(self, key: str, value: object, version: ETag | None, *, generation: int | None = None) -> None:
+        """Cache value for key, unless key was invalidated since `generation` was captured."""
+        with self._lock:
+            if generation is not None and self._generations.get(key, self._generation_floor) != generation:
+                return
+            self._entries[key] = CachedEntity(value=value, version=version, stored_at=time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation_counter += 1
+            self._generations[key] = self._generation_counter
+            self._generations.move_to_end(key)
+            while len(self._generations) > self.max_entries:
+                _, evicted = self._generations.popitem(last=False)
+                self._generation_floor = max(self._generation_floor, evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._generation_counter += 1
+            self._generation_floor = self._generation_counter
+
+
+class FileVersionCache:
+    """Bounded LRU of content-hash version tokens for files on disk, keyed by `(inode, mtime_ns, size)`.
+
+    Tokens are recorded when a backend writes a file (or the first time it hashes one) and
+    reused for as long as the file's stat signature is unchanged, so reads and conditional
+    writes do not re-serialize and re-hash documents that have not changed. Atomic writes
+    replace the inode, and in-place edits change mtime or size, so either invalidates the token.
+    """
+
+    def __init__(self, *, max_entries: int = 4096) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self._tokens: OrderedDict[str, tuple[tuple[int, int, int], ETag]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    @staticmethod
+    def _signature(stat: os.stat_result) -> tuple[int, int, int]:
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def get(self, path: str, stat: os.stat_result) -> ETag | None:
+        """Return the recorded token for path if it was recorded for this exact stat signature."""
+        with self._lock:
+            entry = self._tokens.get(path)
+            if entry is not None:
+                self._tokens.move_to_end(path)
+        if entry is None or entry[0] != self._signature(stat):
+            return None
+        return entry[1]
+
+    def put(self, path: str, stat: os.stat_result, version: ETag) -> None:
+        with self._lock:
+            self._tokens[path] = (self._signature(stat), version)
+            self._tokens.move_to_end(path)
+            while len(self._tokens) > self.max_entries:
+                self._tokens.popitem(last=False)
+
+    def invalidate(self, path: str) -> None:
+        with self._lock:
+            self._tokens.pop(path, None)
+
+
+class DirectoryListingCache:
+    """Bounded LRU of sorted `<id>.json` listings per directory, keyed by directory mtime_ns.
+
+    A listing is reused while the directory's mtime_ns is unchanged. The directory is stat'd
+    before it is scanned, so a change racing the scan leaves a stale mtime and forces a rescan.
+    Listings of directories modified within the last second are not cached, because another
+    change in the same timestamp tick would not move mtime. Backends also invalidate a
+    directory after their own writes.
+    """
+
+    def __init__(self, *, max_directories: int = 256) -> None:
+        if max_directories < 1:
+            raise ValueError("max_directories must be >= 1")
+        self.max_directories = max_directories
+        self._entries: OrderedDict[str, tuple[int, tuple[str, ...]]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def names(self, directory: Path) -> Sequence[str]:
+        """Return the sorted object names in directory, or an empty listing if it does not exist."""
+        key = str(directory)
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            self.invalidate(directory)
+            return ()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == mtime_ns:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        try:
+            names = tuple(sorted_object_names(directory))
+        except FileNotFoundError:
+            self.invalidate(directory)
+            return ()
+        if mtime_ns < time.time_ns() - _RACY_WINDOW_NS:
+            with self._lock:
+                self._entries[key] = (mtime_ns, names)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_directories:
+                    self._entries.popitem(last=False)
+        return names
+
+    def invalidate(self, directory: Path) -> None:
+        with self._lock:
+            self._entries.pop(str(directory), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,191 @@
+"""JSON codecs used for persisted documents, canonical hashing and parsing.
+
+The stdlib codec defines the canonical byte format. Faster codecs (orjson, msgspec) are
+used when installed, but only for documents they encode byte-identically: both format
+floats differently from `json.dumps` (e.g. `1e16` vs `1e+16`) and orjson cannot represent
+integers beyond 64 bits, so such documents are routed through the stdlib codec. This keeps
+content hashes (LocalBackend/GitBackend versions, S3 `rpr-sha256` metadata) stable
+regardless of which codec a process picked.
+
+Select with REGISTRY_JSON_CODEC: `auto` (default; orjson, then msgspec, then stdlib),
+`orjson`, `msgspec` or `stdlib`.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import re
+from typing import Any, Protocol
+
+from lib.logging import logger
+
+from ..types import JsonDoc
+
+
+class JsonCodec(Protocol):
+    name: str
+
+    def loads(self, data: bytes | str) -> Any: ...
+
+    def canonical(self, data: JsonDoc) -> bytes:
+        """Compact, key-sorted UTF-8 JSON used for hashing and comparisons."""
+        ...
+
+    def storage(self, data: JsonDoc) -> str:
+        """Key-sorted, 2-space indented JSON with a trailing newline, as persisted at rest."""
+        ...
+
+
+class StdlibCodec:
+    name = "stdlib"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def canonical(self, data: JsonDoc) -> bytes:
+        return json.dumps(data, separators=(",", ":"), sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+    def storage(self, data: JsonDoc) -> str:
+        return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+
+
+_STDLIB = StdlibCodec()
+
+# A run of 19+ digits may be an integer orjson silently parsed as a float (19 digits already
+# overflow i64 on the negative side, e.g. -9223372036854775809).
+_LONG_DIGITS = re.compile(rb"\d{19,}")
+
+
+def _has_float(data: object) -> bool:
+    """Return True if any value in the document is a float (iterative; no recursion limit)."""
+    stack: list[Any] = [data]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is dict:
+            stack.extend(value.values())
+        elif kind is list:
+            stack.extend(value)
+        elif kind is float:
+            return True
+    return False
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._canonical_opts = orjson.OPT_SORT_KEYS
+        self._storage_opts = orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            parsed = self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            # orjson rejects some inputs the stdlib accepts (e.g. NaN literals)
+            return _STDLIB.loads(data)
+        # Integers wider than 64 bits come back as floats; only then is a rescan needed.
+        if _has_float(parsed):
+            raw = data.encode("utf-8") if isinstance(data, str) else data
+            if _LONG_DIGITS.search(raw):
+                return _STDLIB.loads(raw)
+        return parsed
+
+    def canonical(self, data: JsonDoc) -> bytes:
+        if _has_float(data):
+            return _STDLIB.canonical(data)
+        try:
+            return self._orjson.dumps(data, option=self._canonical_opts)
+        except TypeError:
+            return _STDLIB.canonical(data)
+
+    def storage(self, data: JsonDoc) -> str:
+        if _has_float(data):
+            return _STDLIB.storage(data)
+        try:
+            return self._orjson.dumps(data, option=self._storage_opts).decode("utf-8") + "\n"
+        except TypeError:
+            return _STDLIB.storage(data)
+
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder(order="sorted")
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError:
+            # msgspec rejects some inputs the stdlib accepts (e.g. NaN literals)
+            return _STDLIB.loads(data)
+
+    def canonical(self, data: JsonDoc) -> bytes:
+        if _has_float(data):
+            return _STDLIB.canonical(data)
+        try:
+            return self._encoder.encode(data)
+        except (TypeError, UnicodeEncodeError):
+            return _STDLIB.canonical(data)
+
+    def storage(self, data: JsonDoc) -> str:
+        if _has_float(data):
+            return _STDLIB.storage(data)
+        try:
+            return self._msgspec.json.format(self._encoder.encode(data), indent=2).decode("utf-8") + "\n"
+        except (TypeError, UnicodeEncodeError):
+            return _STDLIB.storage(data)
+
+
+_CODECS: dict[str, type[JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "stdlib": StdlibCodec,
+}
+_AUTO_ORDER = ("orjson", "msgspec")
+
+_active: JsonCodec | None = None
+
+
+def build_codec(name: str) -> JsonCodec:
+    """Build a codec by name; `auto` picks the fastest installed codec.
+
+    Raises:
+        ValueError: If the name is unknown or the requested package is not installed.
+    """
+    name = name.strip().lower()
+    if name == "auto":
+        for candidate in _AUTO_ORDER:
+            if importlib.util.find_spec(candidate) is not None:
+                return _CODECS[candidate]()
+        return _STDLIB
+    if name not in _CODECS:
+        raise ValueError(f"Unknown JSON codec {name!r}; expected one of: auto, {', '.join(_CODECS)}")
+    if name != "stdlib" and importlib.util.find_spec(name) is None:
+        raise ValueError(f"JSON codec {name!r} selected but the {name} package is not installed")
+    return _CODECS[name]()
+
+
+def get_codec() -> JsonCodec:
+    """Return the process-wide codec, selecting it from REGISTRY_JSON_CODEC on first use."""
+    global _active
+    if _active is None:
+        _active = build_codec(os.environ.get("REGISTRY_JSON_CODEC", "auto"))
+        logger.debug("JSON codec: %s", _active.name)
+    return _active
+
+
+def set_codec(codec: JsonCodec | str | None) -> None:
+    """Override the process-wide codec (None re-reads REGISTRY_JSON_CODEC on next use)."""
+    global _active
+    _active = build_codec(codec) if isinstance(codec, str) else codec
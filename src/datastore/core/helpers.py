@@ -1,11 +1,14 @@
+import bisect
 import hashlib
-import json
 import os
 import tempfile
+from collections.abc import Sequence
 from pathlib import Path
+from typing import cast
 
 from ..exceptions import ConcurrencyError
 from ..types import JsonDoc
+from .codec import get_codec
 
 
 def canonical_json(data: JsonDoc) -> str:
@@ -15,18 +18,27 @@ def canonical_json(data: JsonDoc) -> str:
     - No extra whitespace
     - UTF-8 friendly (ensure_ascii=False)
     """
-    return json.dumps(data, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
+    return get_codec().canonical(data).decode("utf-8")
 
 
 def storage_json(data: JsonDoc) -> str:
     """Return a stable, human-editable JSON string for persisted documents."""
-    return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+    return get_codec().storage(data)
 
 
 def compute_etag(data: JsonDoc) -> str:
     """Compute a SHA-256 hex digest over the canonical JSON representation."""
-    payload = canonical_json(data).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+    return hashlib.sha256(get_codec().canonical(data)).hexdigest()
+
+
+def parse_json(data: bytes | str) -> JsonDoc:
+    """Parse a stored JSON document with the active codec."""
+    return cast(JsonDoc, get_codec().loads(data))
+
+
+def read_json_file(path: Path) -> JsonDoc:
+    """Read and parse a JSON document from disk."""
+    return parse_json(path.read_bytes())
 
 
 def strip_id(data: JsonDoc) -> JsonDoc:
@@ -51,26 +63,64 @@ def validate_if_match(if_match: str | None, current_version: str | None) -> None
         raise ConcurrencyError("ETag mismatch")
 
 
+def validate_if_none_match(if_none_match: str | None, current_version: str | None) -> None:
+    """Raise when a create-only write (if_none_match="*") finds an existing object."""
+    if if_none_match is not None and current_version is not None:
+        raise ConcurrencyError("Object already exists")
+
+
 def extract_object_id_from_path(path: str) -> str:
     """Extracts the object ID from a storage path."""
     return Path(path).stem
 
 
-def atomic_write_json_file(path: Path, data: JsonDoc) -> None:
-    """Writes a JSON file atomically by writing to a temp file and then renaming."""
+def sorted_object_names(directory: Path) -> list[str]:
+    """Return the `<id>.json` filenames directly under directory in storage-key order.
+
+    Storage-key order (sorting the full filename) matches S3's lexicographic key order,
+    which keyset pagination relies on to agree across backends.
+    """
+    with os.scandir(directory) as entries:
+        return sorted(entry.name for entry in entries if os.path.splitext(entry.name)[1] == ".json")
+
+
+def select_page(names: Sequence[str], *, page: int, per_page: int, start_after: str | None = None) -> Sequence[str]:
+    """Slice one page out of a sorted name listing.
+
+    With start_after (an object id), returns the names strictly after `<start_after>.json`
+    using a bisect; otherwise falls back to 1-based offset paging.
+    """
+    if start_after is not None:
+        start = bisect.bisect_right(names, f"{start_after}.json")
+    else:
+        start = max(0, (page - 1) * per_page)
+    return names[start : start + per_page]
+
+
+def atomic_write_json_file(path: Path, data: JsonDoc) -> os.stat_result:
+    """Writes a JSON file atomically by writing to a temp file and then renaming.
+
+    Returns the stat of the written file, taken before the rename so it describes exactly
+    the bytes written here (rename keeps the inode and mtime).
+    """
+    return atomic_write_file(path, storage_json(data).encode("utf-8"))
+
+
+def atomic_write_file(path: Path, content: bytes) -> os.stat_result:
+    """Writes bytes to a file atomically; see atomic_write_json_file."""
     tmp_path: Path | None = None
     try:
         with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
             prefix=f"{path.name}.",
             suffix=".tmp",
             dir=path.parent,
             delete=False,
         ) as f:
             tmp_path = Path(f.name)
-            f.write(storage_json(data))
+            f.write(content)
+        written = os.stat(tmp_path)
         os.replace(tmp_path, path)
+        return written
     finally:
         if tmp_path is not None and tmp_path.exists():
             tmp_path.unlink()
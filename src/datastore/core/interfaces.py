@@ -1,6 +1,7 @@
-from typing import Any, Protocol, Self
+from collections.abc import Sequence
+from typing import Any, Protocol, Self, runtime_checkable
 
-from ..types import JsonDoc, PagedResult, PathParams, ValueWithETag
+from ..types import ETag, JsonDoc, PagedResult, PathParams, ValueWithETag
 
 
 class ModelWithId(Protocol):
@@ -17,13 +18,44 @@ class ObjectStore(Protocol):
 
     def get(self, object_id: str, *path: str) -> ValueWithETag[JsonDoc]: ...
 
-    def list(self, *path: str, page: int = 1, per_page: int = 10) -> PagedResult[JsonDoc]: ...
+    def get_many(self, object_ids: Sequence[str], *path: str) -> list[ValueWithETag[JsonDoc]]:
+        """Fetch several objects under one path; results align with object_ids, (None, None) when missing."""
+        ...
 
-    def save(self, object_id: str, data: JsonDoc, *path: str, if_match: str | None = None) -> None: ...
+    def exists(self, object_id: str, *path: str) -> bool: ...
+
+    def list(
+        self, *path: str, page: int = 1, per_page: int = 10, start_after: str | None = None
+    ) -> PagedResult[JsonDoc]:
+        """List objects in storage-key order; start_after (an object id) selects keyset paging over page."""
+        ...
+
+    def save(
+        self, object_id: str, data: JsonDoc, *path: str, if_match: str | None = None, if_none_match: str | None = None
+    ) -> ETag:
+        """Persist a document, returning its new version (the current one if the write was a no-op).
+
+        if_match requires the current version to equal the token; if_none_match="*" makes the
+        write create-only. Either failing raises ConcurrencyError.
+        """
+        ...
 
     def delete(self, object_id: str, *path: str) -> bool: ...
 
 
+@runtime_checkable
+class SummaryListingStore(Protocol):
+    """Optional ObjectStore capability: list pages of document summaries without reading each document.
+
+    Summaries hold each document's top-level scalar fields plus its "id"; stores that cannot
+    serve a directory from an index fall back to full documents.
+    """
+
+    def list_summaries(
+        self, *path: str, page: int = 1, per_page: int = 10, start_after: str | None = None
+    ) -> PagedResult[JsonDoc]: ...
+
+
 class SeedableStore(Protocol):
     """Minimal interface used by seeding and helpers to work with stores generically."""
 
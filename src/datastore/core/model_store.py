@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Collection, Mapping, Sequence
 from string import Formatter
+from typing import cast
 
 from pydantic import BaseModel
 
 from ..core import ObjectStore
 from ..exceptions import ConcurrencyError
-from ..types import PagedResult, PathParams
-from .interfaces import ModelWithId
+from ..types import ETag, PagedResult, PathParams, ValueWithETag
+from .cache import CachedEntity, EntityCache
+from .helpers import construct_storage_path
+from .interfaces import ModelWithId, SummaryListingStore
 
 
 class ModelStore[Entity: ModelWithId, Create: BaseModel]:
@@ -31,6 +34,9 @@ class ModelStore[Entity: ModelWithId, Create: BaseModel]:
 
     Notes:
     - save() will infer path params from model fields if not provided.
+    - When an EntityCache is supplied, get() serves validated entities from it and
+      revalidates stale entries against the backend version. Writes made through this
+      store invalidate the affected entry; cached entities must be treated as read-only.
     """
 
     def __init__(
@@ -39,6 +45,7 @@ class ModelStore[Entity: ModelWithId, Create: BaseModel]:
         *,
         model: type[Entity],
         path_template: str,
+        cache: EntityCache | None = None,
     ):
         """Initialize a ModelStore.
 
@@ -46,9 +53,11 @@ class ModelStore[Entity: ModelWithId, Create: BaseModel]:
             backend: Object storage backend used for persistence.
             model: Concrete model type
             path_template: Hierarchical JSON path template ending with "{id}".
+            cache: Optional entity cache shared across stores on the same backend.
         """
         self._backend = backend
         self._model = model
+        self._cache = cache
 
         # normalize and validate template
         normalized = path_template.strip().strip("/")
@@ -82,34 +91,109 @@ class ModelStore[Entity: ModelWithId, Create: BaseModel]:
             True if an object was deleted, False if it did not exist.
         """
         comps = self._dir_components(path_params=path_params)
-        return self._backend.delete(object_id, *comps)
+        try:
+            return self._backend.delete(object_id, *comps)
+        finally:
+            self._invalidate(object_id, comps)
 
     def exists(self, object_id: str, *, path_params: PathParams | None = None) -> bool:
-        """Return True if a model with the given id exists; otherwise False."""
-        return self.get(object_id, path_params=path_params) is not None
+        """Return True if a model with the given id exists; otherwise False.
+
+        Checks the backend without reading or validating the document.
+        """
+        comps = self._dir_components(path_params=path_params)
+        if self._cache is not None:
+            cached = self._cache.get(self._cache_key(object_id, comps))
+            if cached is not None and self._cache.is_fresh(cached):
+                return True
+        return self._backend.exists(object_id, *comps)
 
     def get(self, object_id: str, *, path_params: PathParams | None = None) -> Entity | None:
         """Fetch a single model by id.
         Returns:
             The validated model instance, or None if it does not exist.
         """
+        entity, _ = self.get_versioned(object_id, path_params=path_params)
+        return entity
+
+    def get_versioned(
+        self,
+        object_id: str,
+        *,
+        path_params: PathParams | None = None,
+        if_none_match: Collection[ETag] = (),
+    ) -> ValueWithETag[Entity]:
+        """Fetch a single model by id together with its backend version.
+
+        If the current version is in if_none_match ("*" matches any version), the document
+        is not validated and (None, version) is returned so callers can answer "not modified".
+        Returns:
+            (model, version), (None, version) when not modified, or (None, None) if it does not exist.
+        """
         comps = self._dir_components(path_params=path_params)
-        data, _ = self._backend.get(object_id, *comps)
-        if data is None:
-            return None
-        payload = self._strip_reserved(data)
-        base: dict[str, object] = {"id": object_id}
-        if path_params:
-            base.update({k: path_params[k] for k in self._required_keys})
-        return self._model.model_validate({**base, **payload})
+        key = self._cache_key(object_id, comps)
+        cached = self._cache.get(key) if self._cache is not None else None
+        if cached is not None and self._cache is not None and self._cache.is_fresh(cached):
+            if cached.version is not None and self._matches(cached.version, if_none_match):
+                return None, cached.version
+            return cast(Entity, cached.value), cached.version
+        generation = self._cache.generation(key) if self._cache is not None else None
+
+        data, version = self._backend.get(object_id, *comps)
+        if data is not None and version is not None and self._matches(version, if_none_match):
+            return None, version
+        if self._cache is None:
+            return (None, None) if data is None else (self._validate(object_id, data, path_params), version)
+        return self._resolve_cached(key, cached, generation, object_id, data, version, path_params), version
+
+    def get_many(self, object_ids: Sequence[str], *, path_params: PathParams | None = None) -> list[Entity | None]:
+        """Fetch several models under the same path in one backend batch.
 
-    def list(self, *, path_params: PathParams | None = None, page: int = 1, per_page: int = 10) -> PagedResult[Entity]:
+        Returns:
+            Validated model instances aligned with object_ids; None where an object does not exist.
+        """
+        comps = self._dir_components(path_params=path_params)
+        if self._cache is None:
+            return [
+                None if data is None else self._validate(object_id, data, path_params)
+                for object_id, (data, _) in zip(object_ids, self._backend.get_many(object_ids, *comps), strict=True)
+            ]
+
+        results: list[Entity | None] = [None] * len(object_ids)
+        pending: list[tuple[int, str, CachedEntity | None, int]] = []
+        for index, object_id in enumerate(object_ids):
+            key = self._cache_key(object_id, comps)
+            cached = self._cache.get(key)
+            if cached is not None and self._cache.is_fresh(cached):
+                results[index] = cast(Entity, cached.value)
+            else:
+                pending.append((index, key, cached, self._cache.generation(key)))
+
+        if pending:
+            fetched = self._backend.get_many([object_ids[index] for index, _, _, _ in pending], *comps)
+            for (index, key, cached, generation), (data, version) in zip(pending, fetched, strict=True):
+                results[index] = self._resolve_cached(
+                    key, cached, generation, object_ids[index], data, version, path_params
+                )
+        return results
+
+    def list(
+        self,
+        *,
+        path_params: PathParams | None = None,
+        page: int = 1,
+        per_page: int = 10,
+        start_after: str | None = None,
+    ) -> PagedResult[Entity]:
         """List models under the path, paginated.
+
+        Pass start_after (the id of the last model on the previous page) for keyset paging;
+        page is ignored in that mode.
         Returns:
             A list of validated model instances.
         """
         comps = self._dir_components(path_params=path_params)
-        items = self._backend.list(*comps, page=page, per_page=per_page)
+        items = self._backend.list(*comps, page=page, per_page=per_page, start_after=start_after)
 
         param_vals = {k: path_params[k] for k in self._required_keys} if path_params else {}
         models: list[Entity] = []
@@ -121,23 +205,85 @@ class ModelStore[Entity: ModelWithId, Create: BaseModel]:
 
         return models
 
-    def merge_upsert(self, object_id: str, partial: Create, *, path_params: PathParams | None = None) -> Entity:
+    def list_summaries[Projection: BaseModel](
+        self,
+        projection_model: type[Projection],
+        *,
+        path_params: PathParams | None = None,
+        page: int = 1,
+        per_page: int = 10,
+        start_after: str | None = None,
+    ) -> PagedResult[Projection]:
+        """List lightweight projections under the path, paginated.
+
+        Only the fields declared on projection_model are validated; everything else in the
+        stored document (e.g. preset stations) is dropped without being validated into the
+        full entity model first. Backends that keep a summary index serve the page from it.
+        Returns:
+            A list of validated projection instances.
+        """
+        comps = self._dir_components(path_params=path_params)
+        if isinstance(self._backend, SummaryListingStore):
+            items = self._backend.list_summaries(*comps, page=page, per_page=per_page, start_after=start_after)
+        else:
+            items = self._backend.list(*comps, page=page, per_page=per_page, start_after=start_after)
+
+        fields = projection_model.model_fields.keys()
+        param_vals = {k: path_params[k] for k in self._required_keys if k in fields} if path_params else {}
+        projections: list[Projection] = []
+        for item in items:
+            payload = {k: v for k, v in item.items() if k in fields and k not in self._reserved_keys}
+            projections.append(projection_model.model_validate({"id": item.get("id"), **param_vals, **payload}))
+
+        return projections
+
+    def merge_upsert(
+        self,
+        object_id: str,
+        partial: Create,
+        *,
+        path_params: PathParams | None = None,
+        if_match: Collection[ETag] | None = None,
+    ) -> Entity:
         """Merge a partial payload and upsert with OCC.
 
         If the object exists, merges the provided partial into current data and
         performs a conditional save using the backend version (ETag). If it does not
         exist, creates the object.
 
-        This is used by PUT methods in the API.
-
         Raises:
             ConcurrencyError: If a conditional save fails due to a version conflict.
 
         Returns:
             The validated, persisted model instance.
         """
+        model, _ = self.merge_upsert_versioned(object_id, partial, path_params=path_params, if_match=if_match)
+        return model
+
+    def merge_upsert_versioned(
+        self,
+        object_id: str,
+        partial: Create,
+        *,
+        path_params: PathParams | None = None,
+        if_match: Collection[ETag] | None = None,
+    ) -> tuple[Entity, ETag]:
+        """Like merge_upsert, also returning the new version; this is used by PUT methods in the API.
+
+        When if_match is given, the current version must be one of its tokens ("*" only
+        requires that the object exists). It is checked against the version read for the
+        merge, so a stale write is rejected before anything is written.
+
+        Raises:
+            ConcurrencyError: If if_match does not match or a conditional save fails.
+
+        Returns:
+            (model, version) for the persisted model.
+        """
         comps = self._dir_components(path_params=path_params)
         current, version = self._backend.get(object_id, *comps)
+        if if_match is not None and (current is None or version is None or not self._matches(version, if_match)):
+            raise ConcurrencyError("Precondition failed")
         base: dict[str, object] = {"id": object_id}
         if path_params:
             base.update({k: path_params[k] for k in self._required_keys})
@@ -149,10 +295,15 @@ class ModelStore[Entity: ModelWithId, Create: BaseModel]:
         model = self._model.model_validate({**base, **payload})
         data = self._strip_reserved(model.model_dump(mode="json"))
         try:
-            self._backend.save(model.id, data, *comps, if_match=version if current is not None else None)
+            if current is None:
+                new_version = self._backend.save(model.id, data, *comps, if_none_match="*")
+            else:
+                new_version = self._backend.save(model.id, data, *comps, if_match=version)
         except ConcurrencyError as e:  # backend conflict (e.g., ETag mismatch)
             raise ConcurrencyError("Conditional save failed") from e
-        return model
+        finally:
+            self._invalidate(model.id, comps)
+        return model, new_version
 
     def save(self, model_obj: Entity, *, path_params: PathParams | None = None) -> Entity:
         """Persist a complete model
@@ -167,9 +318,57 @@ class ModelStore[Entity: ModelWithId, Create: BaseModel]:
             path_params = self._path_params_from_model(model_obj)
         comps = self._dir_components(path_params=path_params)
         data = self._strip_reserved(model_obj.model_dump(mode="json"))
-        self._backend.save(model_obj.id, data, *comps)
+        try:
+            self._backend.save(model_obj.id, data, *comps)
+        finally:
+            self._invalidate(model_obj.id, comps)
         return model_obj
 
+    def _validate(self, object_id: str, data: Mapping[str, object], path_params: PathParams | None) -> Entity:
+        """Validate a stored document into the entity, injecting the id and path params."""
+        payload = self._strip_reserved(data)
+        base: dict[str, object] = {"id": object_id}
+        if path_params:
+            base.update({k: path_params[k] for k in self._required_keys})
+        return self._model.model_validate({**base, **payload})
+
+    def _resolve_cached(
+        self,
+        key: str,
+        cached: CachedEntity | None,
+        generation: int | None,
+        object_id: str,
+        data: Mapping[str, object] | None,
+        version: ETag | None,
+        path_params: PathParams | None,
+    ) -> Entity | None:
+        """Reuse a stale cached entity when its version still matches the backend, else re-validate.
+
+        The entity is only cached if the key has not been invalidated since `generation` was
+        captured before the backend read; otherwise a concurrent write may have replaced it.
+        """
+        assert self._cache is not None
+        if data is None:
+            self._cache.invalidate(key)
+            return None
+        if cached is not None and version is not None and cached.version == version:
+            entity = cast(Entity, cached.value)
+        else:
+            entity = self._validate(object_id, data, path_params)
+        self._cache.put(key, entity, version, generation=generation)
+        return entity
+
+    @staticmethod
+    def _matches(version: ETag, if_none_match: Collection[ETag]) -> bool:
+        return "*" in if_none_match or version in if_none_match
+
+    def _cache_key(self, object_id: str, comps: tuple[str, ...]) -> str:
+        return construct_storage_path(prefix="", path_parts=comps, object_id=object_id)
+
+    def _invalidate(self, object_id: str, comps: tuple[str, ...]) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(self._cache_key(object_id, comps))
+
     def _dir_components(self, *, path_params: PathParams | None = None) -> tuple[str, ...]:
         """Render the directory portion of the path into components.
 
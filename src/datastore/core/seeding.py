@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import re
 from collections.abc import Mapping
 from pathlib import Path
@@ -10,6 +9,7 @@ from pydantic import BaseModel
 from lib.logging import logger
 
 from ..types import JsonDoc, PathParams
+from .helpers import read_json_file
 from .interfaces import ModelWithId, SeedableStore
 from .model_store import ModelStore
 
@@ -30,7 +30,7 @@ class _SeedingView[Entity: ModelWithId, Create: BaseModel](SeedableStore):
         return match_path_template(path_stem, template_stem)
 
     def exists(self, object_id: str, *, path_params: Mapping[str, str] | None = None) -> bool:
-        return self._store.get(object_id, path_params=path_params) is not None
+        return self._store.exists(object_id, path_params=path_params)
 
     def seed(self, data: JsonDoc, *, path_params: PathParams | None = None) -> None:
         # Validate and save via underlying store; mirrors previous ModelStore.seed
@@ -63,8 +63,7 @@ def seed_from_path(seed_path: Path, stores: list[SeedableStore], *, label: str)
                 logger.debug(f"Skipping existing {label} object: {relative_path}")
                 break
 
-            with seed_file.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json_file(seed_file)
             store.seed({"id": object_id, **params, **data}, path_params=path_params)
             logger.info(f"Seeded {label} {relative_path}")
             break
@@ -1,11 +1,13 @@
 import os
+from dataclasses import asdict
 from pathlib import Path
 
 from lib.constants import BASE_DIR
 from lib.logging import logger
 
-from .backends import GitBackend, LocalBackend, S3Backend
-from .core import ObjectStore, SeedableStore, seed_from_path, seedable
+from .backends import GitBackend, LocalBackend, S3Backend, SQLiteBackend
+from .backends.s3 import build_client_config
+from .core import EntityCache, ObjectStore, SeedableStore, seed_from_path, seedable
 from .stores import AccountPresets, Accounts, GlobalPresets, Players
 
 
@@ -31,19 +33,19 @@ class DataStore:
             self.prefix = os.environ.get("REGISTRY_BACKEND_PREFIX", default_prefix)
             data_path = os.environ.get("REGISTRY_BACKEND_PATH", str(BASE_DIR / "tmp" / "data"))
             if backend_choice == "s3":
-                bucket = os.environ.get("REGISTRY_BACKEND_S3_BUCKET", "").lower()
-                if not bucket:
-                    raise ValueError("S3 backend selected but REGISTRY_BACKEND_S3_BUCKET is not set")
-                self.backend = S3Backend(bucket=bucket, prefix=self.prefix)
+                self.backend = self._build_s3_backend()
             elif backend_choice == "git":
                 self.backend = self._build_git_backend(data_path)
+            elif backend_choice == "sqlite":
+                self.backend = SQLiteBackend(db_path=str(Path(data_path) / "registry.sqlite3"), prefix=self.prefix)
             else:
                 self.backend = LocalBackend(base_path=data_path, prefix=self.prefix)
 
-        self.accounts = Accounts(self.backend)
-        self.players = Players(self.backend)
-        self.global_presets = GlobalPresets(self.backend)
-        self.account_presets = AccountPresets(self.backend)
+        self.cache = self._build_cache()
+        self.accounts = Accounts(self.backend, cache=self.cache)
+        self.players = Players(self.backend, cache=self.cache)
+        self.global_presets = GlobalPresets(self.backend, cache=self.cache)
+        self.account_presets = AccountPresets(self.backend, cache=self.cache)
 
     def seed(self) -> None:
         """
@@ -52,6 +54,48 @@ class DataStore:
         """
         seed_from_path(self.seed_path, self._seedable_stores(), label="content")
 
+    def sync_status(self) -> dict[str, object] | None:
+        """Report remote fetch health (and the push backlog with async push) for the git backend.
+
+        Returns None for backends that do not sync with a remote.
+        """
+        if not isinstance(self.backend, GitBackend):
+            return None
+        push = asdict(self.backend.push_status()) if self.backend.async_push else None
+        return {"fetch": asdict(self.backend.fetch_status()), "push": push}
+
+    def _build_cache(self) -> EntityCache | None:
+        max_entries = int(os.environ.get("REGISTRY_CACHE_MAX_ENTRIES", "0"))
+        if max_entries <= 0:
+            return None
+        ttl_seconds = float(os.environ.get("REGISTRY_CACHE_TTL_SECONDS", "5"))
+        logger.info(f"DataStore entity cache: max_entries={max_entries} ttl={ttl_seconds}s")
+        return EntityCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    def _build_s3_backend(self) -> S3Backend:
+        bucket = os.environ.get("REGISTRY_BACKEND_S3_BUCKET", "").lower()
+        if not bucket:
+            raise ValueError("S3 backend selected but REGISTRY_BACKEND_S3_BUCKET is not set")
+        max_workers = int(os.environ.get("REGISTRY_BACKEND_S3_MAX_WORKERS", "8"))
+        pool_size = os.environ.get("REGISTRY_BACKEND_S3_MAX_POOL_CONNECTIONS")
+        config = build_client_config(
+            max_workers=max_workers,
+            max_pool_connections=int(pool_size) if pool_size else None,
+            connect_timeout=float(os.environ.get("REGISTRY_BACKEND_S3_CONNECT_TIMEOUT_SECONDS", "5")),
+            read_timeout=float(os.environ.get("REGISTRY_BACKEND_S3_READ_TIMEOUT_SECONDS", "15")),
+            retry_mode=os.environ.get("REGISTRY_BACKEND_S3_RETRY_MODE", "adaptive"),
+            max_attempts=int(os.environ.get("REGISTRY_BACKEND_S3_MAX_ATTEMPTS", "3")),
+            tcp_keepalive=_env_flag("REGISTRY_BACKEND_S3_TCP_KEEPALIVE", default=True),
+        )
+        return S3Backend(
+            bucket=bucket,
+            prefix=self.prefix,
+            config=config,
+            max_workers=max_workers,
+            page_token_ttl_seconds=float(os.environ.get("REGISTRY_BACKEND_S3_PAGE_TOKEN_TTL_SECONDS", "60")),
+            manifests=_env_flag("REGISTRY_BACKEND_S3_MANIFESTS", default=False),
+        )
+
     def _build_git_backend(self, repo_path: str) -> GitBackend:
         remote_url = os.environ.get(
             "REGISTRY_BACKEND_GIT_REMOTE_URL",
@@ -62,13 +106,19 @@ class DataStore:
             prefix=self.prefix,
             branch=os.environ.get("REGISTRY_BACKEND_GIT_BRANCH", "main"),
             remote_url=remote_url,
-            fetch_ttl_seconds=int(os.environ.get("REGISTRY_BACKEND_GIT_FETCH_TTL_SECONDS", "30")),
+            fetch_ttl_seconds=float(os.environ.get("REGISTRY_BACKEND_GIT_FETCH_TTL_SECONDS", "30")),
             author_name=os.environ.get("REGISTRY_BACKEND_GIT_AUTHOR_NAME", "briceburg"),
             author_email=os.environ.get(
                 "REGISTRY_BACKEND_GIT_AUTHOR_EMAIL",
                 "briceburg@users.noreply.github.com",
             ),
             ssh_key_path=os.environ.get("REGISTRY_BACKEND_GIT_SSH_KEY_PATH"),
+            read_mode=os.environ.get("REGISTRY_BACKEND_GIT_READ_MODE", "worktree").lower(),
+            group_commit_max_latency_ms=int(os.environ.get("REGISTRY_BACKEND_GIT_GROUP_COMMIT_MAX_LATENCY_MS", "0")),
+            group_commit_max_writes=int(os.environ.get("REGISTRY_BACKEND_GIT_GROUP_COMMIT_MAX_WRITES", "32")),
+            background_fetch=_env_flag("REGISTRY_BACKEND_GIT_BACKGROUND_FETCH", default=False),
+            async_push=_env_flag("REGISTRY_BACKEND_GIT_ASYNC_PUSH", default=False),
+            clone_depth=int(os.environ.get("REGISTRY_BACKEND_GIT_CLONE_DEPTH", "0")),
         )
 
     def _seedable_stores(self) -> list[SeedableStore]:
@@ -78,3 +128,10 @@ class DataStore:
             seedable(self.global_presets),
             seedable(self.account_presets),
         ]
+
+
+def _env_flag(name: str, *, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
@@ -1,9 +1,9 @@
-from datastore.core import ModelStore, ObjectStore
+from datastore.core import EntityCache, ModelStore, ObjectStore
 from models.account import Account, AccountCreate
 
 
 class Accounts(ModelStore[Account, AccountCreate]):
     """A data store for managing accounts (accounts/<id>.json)."""
 
-    def __init__(self, backend: ObjectStore):
-        super().__init__(backend, model=Account, path_template="accounts/{id}")
+    def __init__(self, backend: ObjectStore, *, cache: EntityCache | None = None):
+        super().__init__(backend, model=Account, path_template="accounts/{id}", cache=cache)
@@ -1,9 +1,9 @@
-from datastore.core import ModelStore, ObjectStore
+from datastore.core import EntityCache, ModelStore, ObjectStore
 from models.player import Player, PlayerCreate
 
 
 class Players(ModelStore[Player, PlayerCreate]):
     """A data store for managing an account's players (accounts/<account_id>/players/<id>.json)."""
 
-    def __init__(self, backend: ObjectStore):
-        super().__init__(backend, model=Player, path_template="accounts/{account_id}/players/{id}")
+    def __init__(self, backend: ObjectStore, *, cache: EntityCache | None = None):
+        super().__init__(backend, model=Player, path_template="accounts/{account_id}/players/{id}", cache=cache)
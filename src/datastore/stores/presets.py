@@ -1,4 +1,4 @@
-from datastore.core import ModelStore, ObjectStore
+from datastore.core import EntityCache, ModelStore, ObjectStore
 from models.station_preset import (
     AccountStationPreset,
     AccountStationPresetCreate,
@@ -10,12 +10,17 @@ from models.station_preset import (
 class GlobalPresets(ModelStore[GlobalStationPreset, GlobalStationPresetCreate]):
     """Repository for global station presets (presets/<id>.json)."""
 
-    def __init__(self, backend: ObjectStore):
-        super().__init__(backend, model=GlobalStationPreset, path_template="presets/{id}")
+    def __init__(self, backend: ObjectStore, *, cache: EntityCache | None = None):
+        super().__init__(backend, model=GlobalStationPreset, path_template="presets/{id}", cache=cache)
 
 
 class AccountPresets(ModelStore[AccountStationPreset, AccountStationPresetCreate]):
     """Repository for account-scoped station presets (accounts/<account_id>/presets/<id>.json)."""
 
-    def __init__(self, backend: ObjectStore):
-        super().__init__(backend, model=AccountStationPreset, path_template="accounts/{account_id}/presets/{id}")
+    def __init__(self, backend: ObjectStore, *, cache: EntityCache | None = None):
+        super().__init__(
+            backend,
+            model=AccountStationPreset,
+            path_template="accounts/{account_id}/presets/{id}",
+            cache=cache,
+        )
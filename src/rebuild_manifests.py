@@ -0,0 +1,30 @@
+"""Create or repair the S3 backend's per-collection `_index.json` manifests.
+
+Uses the same REGISTRY_* environment as the registry; REGISTRY_BACKEND must be `s3`.
+"""
+
+import argparse
+
+from datastore import DataStore
+from datastore.backends import S3Backend
+from datastore.backends.s3 import MANIFEST_NAME
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", nargs="*", help="only rebuild below this path, e.g. `accounts briceburg players`")
+    args = parser.parse_args(argv)
+
+    backend = DataStore().backend
+    if not isinstance(backend, S3Backend):
+        parser.error("manifests are only maintained by the s3 backend; set REGISTRY_BACKEND=s3")
+
+    rebuilt = backend.rebuild_manifests(*args.path)
+    for storage_dir in rebuilt:
+        print(f"rebuilt {storage_dir}{MANIFEST_NAME}")
+    print(f"{len(rebuilt)} manifest(s) written")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
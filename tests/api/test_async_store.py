@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+from starlette.testclient import TestClient
+
+from api.async_store import build_limiter
+from datastore import DataStore, LocalBackend
+from datastore.types import JsonDoc, ValueWithETag
+from models import Account
+from registry import create_app
+
+
+class _BlockingBackend(LocalBackend):
+    """LocalBackend whose reads park until released, standing in for a slow git push or S3 call."""
+
+    def __init__(self, base_path: str) -> None:
+        super().__init__(base_path)
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def get(self, object_id: str, *path_parts: str) -> ValueWithETag[JsonDoc]:
+        self.entered.set()
+        self.release.wait(timeout=10)
+        return super().get(object_id, *path_parts)
+
+
+def test_slow_backend_does_not_block_the_event_loop(tmp_path: Path) -> None:
+    backend = _BlockingBackend(str(tmp_path / "data"))
+    store = DataStore(backend=backend)
+    store.accounts.save(Account(id="slow", name="Slow"))
+
+    app = create_app()
+    from api.types import get_store
+
+    app.dependency_overrides[get_store] = lambda: store
+    app.state.store = store
+
+    with TestClient(app) as client:
+        statuses: list[int] = []
+        slow_request = threading.Thread(target=lambda: statuses.append(client.get("/v1/accounts/slow").status_code))
+        slow_request.start()
+        try:
+            assert backend.entered.wait(timeout=5)
+            # The account read is parked in a worker thread; the loop must still serve other requests.
+            assert client.get("/healthz").status_code == 204
+            assert not backend.release.is_set()
+            assert statuses == []
+        finally:
+            backend.release.set()
+            slow_request.join(timeout=5)
+
+    assert statuses == [200]
+
+
+def test_limiter_size_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("REGISTRY_DATASTORE_MAX_THREADS", "3")
+    assert build_limiter().total_tokens == 3
+
+    monkeypatch.setenv("REGISTRY_DATASTORE_MAX_THREADS", "0")
+    with pytest.raises(ValueError, match="REGISTRY_DATASTORE_MAX_THREADS"):
+        build_limiter()
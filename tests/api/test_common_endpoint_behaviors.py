@@ -232,3 +232,118 @@ def test_pagination_behavior_is_consistent(client: TestClient, resource: str) ->
         prev="?page=1&per_page=1",
         next="?page=3&per_page=1",
     )
+
+
+@pytest.mark.parametrize(
+    "list_path,expected_ids",
+    [
+        ("/v1/accounts", ["testuser1", "testuser2"]),
+        ("/v1/accounts/testuser1/players", ["player1", "player2"]),
+    ],
+    ids=["accounts", "players"],
+)
+def test_cursor_pagination_follows_next_links(client: TestClient, list_path: str, expected_ids: list[str]) -> None:
+    response = client.get(list_path, params={"per_page": 1})
+    assert response.status_code == HTTPStatus.OK
+    first = response.json()
+    assert [item["id"] for item in first["items"]] == expected_ids[:1]
+    assert first["next_cursor"]
+
+    response = client.get(list_path, params={"cursor": first["next_cursor"], "per_page": 1})
+    assert response.status_code == HTTPStatus.OK
+    second = response.json()
+    assert_pagination_page(
+        second,
+        item_ids=expected_ids[1:2],
+        page=1,
+        per_page=1,
+        prev=None,
+        next=f"?cursor={second['next_cursor']}&per_page=1",
+    )
+
+    response = client.get(f"{list_path}{second['links']['next']}")
+    assert response.status_code == HTTPStatus.OK
+    assert_pagination_page(response.json(), item_ids=[], page=1, per_page=1, prev=None, next=None)
+
+
+def test_invalid_cursor_is_rejected(client: TestClient) -> None:
+    response = client.get("/v1/accounts", params={"cursor": "not*a*cursor"})
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize(
+    "path,update",
+    [
+        ("/v1/accounts/testuser1", {"name": "Renamed"}),
+        ("/v1/accounts/testuser1/players/player1", {"name": "Renamed"}),
+        ("/v1/presets/briceburg", {"name": "Renamed", "stations": []}),
+        ("/v1/accounts/testuser1/presets/mine", {"name": "Renamed", "stations": []}),
+    ],
+    ids=["account", "player", "global-preset", "account-preset"],
+)
+def test_conditional_get_returns_304_for_current_etag(client: TestClient, path: str, update: JsonDoc) -> None:
+    if path.endswith("/presets/mine"):
+        _put_ok(client, path, {"name": "Mine", "stations": []})
+
+    first = client.get(path)
+    assert first.status_code == HTTPStatus.OK
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = client.get(path, headers={"If-None-Match": header})
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, header
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    assert client.get(path, headers={"If-None-Match": '"stale"'}).status_code == HTTPStatus.OK
+
+    _put_ok(client, path, update)
+    changed = client.get(path, headers={"If-None-Match": etag})
+    assert changed.status_code == HTTPStatus.OK
+    assert changed.json()["name"] == "Renamed"
+    assert changed.headers["etag"] != etag
+
+
+def test_conditional_get_on_missing_document_is_404(client: TestClient) -> None:
+    response = client.get("/v1/accounts/nobody", headers={"If-None-Match": "*"})
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert "etag" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "path,payload",
+    [
+        ("/v1/accounts/testuser1", {"name": "Renamed"}),
+        ("/v1/accounts/testuser1/players/player1", {"name": "Renamed"}),
+        ("/v1/presets/briceburg", {"name": "Renamed", "stations": []}),
+        ("/v1/accounts/testuser1/presets/mine", {"name": "Renamed", "stations": []}),
+    ],
+    ids=["account", "player", "global-preset", "account-preset"],
+)
+def test_put_if_match_enforces_client_versions(client: TestClient, path: str, payload: JsonDoc) -> None:
+    missing = client.put(path, json=payload, headers={"If-Match": "*"})
+    if path.endswith("/presets/mine"):
+        assert missing.status_code == HTTPStatus.PRECONDITION_FAILED
+        assert missing.json()["code"] == "precondition_failed"
+        created = client.put(path, json={"name": "Mine", "stations": []})
+        assert created.status_code == HTTPStatus.OK
+        assert created.headers["etag"] == client.get(path).headers["etag"]
+    else:
+        assert missing.status_code == HTTPStatus.OK
+
+    etag = client.get(path).headers["etag"]
+    for stale in ('"stale"', f"W/{etag}"):
+        response = client.put(path, json={**payload, "name": "Lost update"}, headers={"If-Match": stale})
+        assert response.status_code == HTTPStatus.PRECONDITION_FAILED, stale
+    assert client.get(path).headers["etag"] == etag
+
+    response = client.put(path, json={**payload, "name": "Won"}, headers={"If-Match": etag})
+    assert response.status_code == HTTPStatus.OK, response.text
+    assert response.json()["name"] == "Won"
+    new_etag = response.headers["etag"]
+    assert new_etag != etag
+    assert client.get(path).headers["etag"] == new_etag
+    assert client.put(path, json={**payload, "name": "Late"}, headers={"If-Match": etag}).status_code == (
+        HTTPStatus.PRECONDITION_FAILED
+    )
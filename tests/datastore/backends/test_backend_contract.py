@@ -9,21 +9,31 @@ from _pytest.fixtures import SubRequest
 
 from datastore.core import ModelStore, seed_from_path, seedable
 from datastore.core.interfaces import ObjectStore
+from datastore.exceptions import ConcurrencyError
 from models.account import Account, AccountCreate
 
 
-@pytest.fixture(params=["json", "s3", "git"], ids=["json", "s3", "git"])
+@pytest.fixture(
+    params=["json", "sqlite", "s3", "git", "git-objects"], ids=["json", "sqlite", "s3", "git", "git-objects"]
+)
 def object_store(request: SubRequest, tmp_path: Path) -> Generator[ObjectStore]:
     """Parameterized backend fixture providing a compatible ObjectStore.
 
     - json: LocalBackend rooted at a temporary directory
+    - sqlite: SQLiteBackend on a temporary database file
     - s3: S3Backend with moto-backed S3 bucket (versioning enabled)
+    - git / git-objects: GitBackend reading from the working tree / the object database
     """
     if request.param == "json":
         from datastore.backends.local import LocalBackend
 
         backend: ObjectStore = LocalBackend(str(tmp_path))
         yield backend
+    elif request.param == "sqlite":
+        from datastore.backends.sqlite import SQLiteBackend
+
+        backend = SQLiteBackend(str(tmp_path / "contract.sqlite3"), prefix="contract")
+        yield backend
     elif request.param == "s3":
         pytest.importorskip("moto")
         from moto import mock_aws
@@ -47,6 +57,7 @@ def object_store(request: SubRequest, tmp_path: Path) -> Generator[ObjectStore]:
             fetch_ttl_seconds=0,
             author_name="Tests",
             author_email="tests@example.invalid",
+            read_mode="objects" if request.param == "git-objects" else "worktree",
         )
         yield backend
 
@@ -59,10 +70,56 @@ class TestObjectStoreContract:
         assert raw == {"k": 1}
         assert isinstance(token, str) and token
 
+    def test_save_returns_the_new_version(self, object_store: ObjectStore) -> None:
+        path = ("versions",)
+        created = object_store.save("a", {"k": 1}, *path)
+        assert created == object_store.get("a", *path)[1]
+
+        updated = object_store.save("a", {"k": 2}, *path, if_match=created)
+        assert updated != created
+        assert updated == object_store.get("a", *path)[1]
+        # An unchanged write is a no-op and reports the current version.
+        assert object_store.save("a", {"k": 2}, *path) == updated
+
+    def test_create_only_writes_refuse_existing_objects(self, object_store: ObjectStore) -> None:
+        path = ("create-only",)
+        version = object_store.save("a", {"k": 1}, *path, if_none_match="*")
+        with pytest.raises(ConcurrencyError):
+            object_store.save("a", {"k": 2}, *path, if_none_match="*")
+        with pytest.raises(ConcurrencyError):
+            object_store.save("a", {"k": 3}, *path, if_match="stale")
+        assert object_store.get("a", *path) == ({"k": 1}, version)
+
+    def test_if_match_on_a_missing_object_creates_it(self, object_store: ObjectStore) -> None:
+        path = ("if-match-missing",)
+        version = object_store.save("a", {"k": 1}, *path, if_match="anything")
+        assert object_store.get("a", *path) == ({"k": 1}, version)
+
     def test_get_nonexistent_returns_none(self, object_store: ObjectStore) -> None:
         data, token = object_store.get("missing", "nowhere")
         assert data is None and token is None
 
+    def test_get_many_aligns_with_requested_ids(self, object_store: ObjectStore) -> None:
+        path = ("batch",)
+        object_store.save("a", {"v": 1}, *path)
+        object_store.save("b", {"v": 2}, *path)
+
+        results = object_store.get_many(["b", "missing", "a"], *path)
+
+        assert [data for data, _ in results] == [{"v": 2}, None, {"v": 1}]
+        assert results[0][1] == object_store.get("b", *path)[1]
+        assert results[1][1] is None
+        assert object_store.get_many([], *path) == []
+
+    def test_exists_reflects_saves_and_deletes(self, object_store: ObjectStore) -> None:
+        path = ("exists",)
+        assert object_store.exists("e", *path) is False
+        object_store.save("e", {"x": 1}, *path)
+        assert object_store.exists("e", *path) is True
+        assert object_store.exists("e", "elsewhere") is False
+        object_store.delete("e", *path)
+        assert object_store.exists("e", *path) is False
+
     def test_list_and_pagination_and_determinism(self, object_store: ObjectStore) -> None:
         path = ("list",)
         for name, val in [("b", 2), ("a", 1), ("c", 3)]:
@@ -76,6 +133,22 @@ class TestObjectStoreContract:
         again = object_store.list(*path, page=1, per_page=10)
         assert sorted([i["id"] for i in again]) == ["a", "b", "c"]
 
+    def test_list_start_after_uses_storage_key_order(self, object_store: ObjectStore) -> None:
+        path = ("keyset",)
+        for name in ["b", "a", "a-b", "c", "a0"]:
+            object_store.save(name, {"n": name}, *path)
+        object_store.save("nested", {"n": "nested"}, *path, "a", "children")
+
+        everything = object_store.list(*path, page=1, per_page=10)
+        assert [i["id"] for i in everything] == ["a-b", "a", "a0", "b", "c"]
+
+        first = object_store.list(*path, per_page=2, start_after="a-b")
+        assert [i["id"] for i in first] == ["a", "a0"]
+        second = object_store.list(*path, per_page=2, start_after="a0")
+        assert [i["id"] for i in second] == ["b", "c"]
+        assert object_store.list(*path, per_page=2, start_after="c") == []
+        assert object_store.list("missing", per_page=2, start_after="a") == []
+
     def test_delete_semantics(self, object_store: ObjectStore) -> None:
         path = ("del",)
         object_store.save("z", {"x": 1}, *path)
@@ -3,20 +3,32 @@ from __future__ import annotations
 import io
 import json
 import multiprocessing as mp
+import os
+import shutil
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, cast
 
 import pytest
+from dulwich import client as dulwich_client
 from dulwich import porcelain
 from dulwich.errors import HangupException
-from dulwich.objects import Commit
+from dulwich.object_store import commit_tree_changes
+from dulwich.objects import Blob, Commit, Tree
 from dulwich.refs import Ref
 from dulwich.repo import Repo
+from starlette.testclient import TestClient
 
+from api.types import get_store
 from datastore import DataStore
+from datastore.backends import git as git_module
 from datastore.backends.git import GitBackend
 from datastore.exceptions import ConcurrencyError
+from models.account import AccountCreate
+from registry import create_app
 
 AUTHOR = b"Tests <tests@example.invalid>"
 AUTHOR_NAME = "Tests"
@@ -52,7 +64,12 @@ def _backend(
     *,
     branch: str = "main",
     remote_url: str | Path | None = None,
-    fetch_ttl_seconds: int = 0,
+    fetch_ttl_seconds: float = 0,
+    read_mode: str = "worktree",
+    group_commit_max_latency_ms: int = 0,
+    background_fetch: bool = False,
+    async_push: bool = False,
+    clone_depth: int = 0,
 ) -> GitBackend:
     return GitBackend(
         repo_path=str(repo_path),
@@ -61,6 +78,11 @@ def _backend(
         fetch_ttl_seconds=fetch_ttl_seconds,
         author_name=AUTHOR_NAME,
         author_email=AUTHOR_EMAIL,
+        read_mode=read_mode,
+        group_commit_max_latency_ms=group_commit_max_latency_ms,
+        background_fetch=background_fetch,
+        async_push=async_push,
+        clone_depth=clone_depth,
     )
 
 
@@ -211,6 +233,72 @@ def test_git_backend_writes_pretty_json_and_clear_commit_subject(tmp_path: Path)
     assert commit.message == (b"radio-pad-registry: update global preset fresh\n\nGenerated-by: radio-pad-registry")
 
 
+def test_git_backend_commits_objects_directly_without_touching_the_index(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (backend_path,) = _clone_pair(tmp_path, remote, "backend")
+    index_before = (backend_path / ".git" / "index").read_bytes()
+    backend = _backend(backend_path, remote_url=remote)
+    seed_head = Repo(str(remote)).refs[cast(Ref, b"refs/heads/main")]
+
+    backend.save("fresh", {"name": "Fresh"}, "accounts")
+    assert backend.delete("seed", "accounts") is True
+
+    assert (backend_path / ".git" / "index").read_bytes() == index_before
+    remote_repo = Repo(str(remote))
+    delete_commit = cast(Commit, remote_repo[remote_repo.refs[cast(Ref, b"refs/heads/main")]])
+    save_commit = cast(Commit, remote_repo[delete_commit.parents[0]])
+    assert save_commit.parents == [seed_head]
+    tree = cast(Tree, remote_repo[delete_commit.tree])
+    accounts = cast(Tree, remote_repo[tree[b"accounts"][1]])
+    assert [entry.path for entry in accounts.items()] == [b"fresh.json"]
+    assert (
+        cast(Blob, remote_repo[accounts[b"fresh.json"][1]]).data
+        == (backend_path / "accounts" / "fresh.json").read_bytes()
+    )
+    assert not (backend_path / "accounts" / "seed.json").exists()
+
+
+def test_git_backend_checkout_follows_remote_after_direct_commits(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (backend_path,) = _clone_pair(tmp_path, remote, "backend")
+    backend = _backend(backend_path, remote_url=remote)
+    backend.save("seed", {"name": "Changed"}, "accounts")
+    backend.save("local", {"name": "Local"}, "accounts")
+
+    # the index still describes the clone; a remote revert and delete must reach the checkout anyway
+    (writer_path,) = _clone_pair(tmp_path, remote, "writer")
+    _commit_json(writer_path, "accounts/seed.json", {"name": "Seed"}, message=b"revert seed")
+    porcelain.remove(str(writer_path), paths=["accounts/local.json"])
+    porcelain.commit(str(writer_path), message=b"drop local", author=AUTHOR, committer=AUTHOR)
+    _push_main(writer_path, "origin")
+
+    assert backend.get("seed", "accounts")[0] == {"name": "Seed"}
+    assert backend.get("local", "accounts") == (None, None)
+    assert not (backend_path / "accounts" / "local.json").exists()
+    assert [item["id"] for item in backend.list("accounts")] == ["seed"]
+
+
+def test_git_backend_restores_checkout_when_branch_moves_during_commit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (backend_path,) = _clone_pair(tmp_path, remote, "backend")
+    backend = _backend(backend_path, remote_url="")
+    seed_bytes = (backend_path / "accounts" / "seed.json").read_bytes()
+    head = Repo(str(backend_path)).head()
+
+    monkeypatch.setattr(type(backend._repo().refs), "set_if_equals", lambda *args, **kwargs: False)
+    with pytest.raises(ConcurrencyError, match="moved while committing"):
+        backend.save("seed", {"name": "Lost"}, "accounts")
+    with pytest.raises(ConcurrencyError, match="moved while committing"):
+        backend.save("fresh", {"name": "Lost"}, "accounts")
+
+    assert (backend_path / "accounts" / "seed.json").read_bytes() == seed_bytes
+    assert not (backend_path / "accounts" / "fresh.json").exists()
+    assert Repo(str(backend_path)).head() == head
+    assert [item["id"] for item in backend.list("accounts")] == ["seed"]
+
+
 def test_git_backend_detects_stale_if_match_after_remote_change(tmp_path: Path) -> None:
     remote = _create_remote_with_seed(tmp_path)
     backend1_path, backend2_path = _clone_pair(tmp_path, remote, "backend1", "backend2")
@@ -310,3 +398,396 @@ def test_git_backend_uses_cross_process_lock_for_shared_repo(tmp_path: Path) ->
     assert result_parent.recv() >= 0.3
     process.join(timeout=5)
     assert process.exitcode == 0
+
+
+@pytest.mark.parametrize("read_mode", ["worktree", "objects"])
+def test_git_backend_reads_share_the_lock_and_writes_wait_for_them(tmp_path: Path, read_mode: str) -> None:
+    repo_path = tmp_path / "repo"
+    _init_repo(repo_path)
+    backend = _backend(repo_path, read_mode=read_mode)
+    backend.save("seed", {"name": "Seed"}, "accounts")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        with backend._read_lock():
+            assert pool.submit(backend.get, "seed", "accounts").result(timeout=5)[0] == {"name": "Seed"}
+            assert [item["id"] for item in pool.submit(backend.list, "accounts").result(timeout=5)] == ["seed"]
+
+            write = pool.submit(backend.save, "seed", {"name": "Renamed"}, "accounts")
+            time.sleep(0.3)
+            assert not write.done()
+            assert json.loads((repo_path / "accounts" / "seed.json").read_text()) == {"name": "Seed"}
+
+        write.result(timeout=5)
+    assert backend.get("seed", "accounts")[0] == {"name": "Renamed"}
+
+
+def test_git_backend_objects_mode_reads_blobs_and_defers_worktree_reset(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    backend_path, writer_path = _clone_pair(tmp_path, remote, "backend", "writer")
+    backend = _backend(backend_path, read_mode="objects")
+
+    data, version = backend.get("seed", "accounts")
+    assert data == {"name": "Seed"}
+    assert version == Blob.from_string((backend_path / "accounts" / "seed.json").read_bytes()).id.decode()
+
+    _commit_json(writer_path, "accounts/fetched.json", {"name": "Fetched"}, message=b"writer update")
+    _push_main(writer_path, "origin")
+
+    # the fetch moves the branch but leaves the checkout alone
+    assert backend.get("fetched", "accounts")[0] == {"name": "Fetched"}
+    assert backend.exists("fetched", "accounts")
+    assert [item["id"] for item in backend.list("accounts")] == ["fetched", "seed"]
+    assert not (backend_path / "accounts" / "fetched.json").exists()
+
+    # a write resets the checkout first, so the remote change is kept in the new commit
+    new_version = backend.save("local", {"name": "Local"}, "accounts")
+    assert backend.get("local", "accounts")[1] == new_version
+    assert json.loads((backend_path / "accounts" / "fetched.json").read_text()) == {"name": "Fetched"}
+    assert backend.save("local", {"name": "Local"}, "accounts", if_match=new_version) == new_version
+
+
+def test_git_backend_objects_mode_bounds_resolved_blob_paths(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (backend_path,) = _clone_pair(tmp_path, remote, "backend")
+    backend = _backend(backend_path, read_mode="objects")
+    backend._trees.max_blobs = 4
+    for index in range(8):
+        backend.save(f"acct-{index}", {"name": f"Account {index}"}, "accounts")
+
+    for index in range(100):
+        assert backend.get(f"missing-{index}", "accounts") == (None, None)
+    for index in range(8):
+        assert backend.get(f"acct-{index}", "accounts")[0] == {"name": f"Account {index}"}
+
+    assert len(backend._trees._blobs) == 4
+
+
+def test_git_backend_reuses_repo_handle_and_sees_commits_from_other_writers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (checkout,) = _clone_pair(tmp_path, remote, "checkout")
+    reader = _backend(checkout, remote_url="", read_mode="objects")
+    writer = _backend(checkout, remote_url="")
+
+    opened: list[object] = []
+
+    class CountingRepo(Repo):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            opened.append(args)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(git_module, "Repo", CountingRepo)
+
+    assert reader.get("seed", "accounts")[0] == {"name": "Seed"}
+    # another backend sharing the checkout commits; the cached branch head notices the ref change
+    writer.save("fresh", {"name": "Fresh"}, "accounts")
+    assert reader.get("fresh", "accounts")[0] == {"name": "Fresh"}
+    assert reader.exists("fresh", "accounts")
+    assert [item["id"] for item in reader.list("accounts")] == ["fresh", "seed"]
+    assert writer.delete("fresh", "accounts") is True
+    assert reader.get("fresh", "accounts") == (None, None)
+    assert opened == []
+
+    reader.close()
+    writer.close()
+
+
+def test_git_backend_rereads_a_branch_ref_rewritten_within_the_same_mtime_tick(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (checkout,) = _clone_pair(tmp_path, remote, "checkout")
+    reader = _backend(checkout, remote_url="", read_mode="objects")
+    ref_path = checkout / ".git" / "refs" / "heads" / "main"
+    before = ref_path.stat()
+    assert reader.get("seed", "accounts")[0] == {"name": "Seed"}
+
+    # another process rewrites the ref in place: same inode, size and mtime
+    repo = Repo(str(checkout))
+    head = repo.refs[cast(Ref, b"refs/heads/main")]
+    blob = Blob.from_string(b'{"name": "Fresh"}\n')
+    repo.object_store.add_object(blob)
+    commit = cast(Commit, repo[head].copy())
+    commit.tree = commit_tree_changes(repo.object_store, commit.tree, [(b"accounts/fresh.json", 0o100644, blob.id)])
+    commit.parents = [head]
+    repo.object_store.add_object(commit)
+    with ref_path.open("r+b") as ref_file:
+        ref_file.write(commit.id + b"\n")
+    os.utime(ref_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    after = ref_path.stat()
+    assert (after.st_ino, after.st_size, after.st_mtime_ns) == (before.st_ino, before.st_size, before.st_mtime_ns)
+
+    assert reader.get("fresh", "accounts")[0] == {"name": "Fresh"}
+    reader.close()
+
+
+def test_git_backend_rejects_unknown_read_mode(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unknown git read mode"):
+        _backend(tmp_path / "repo", remote_url="", read_mode="index")
+
+
+def _remote_commits(remote: Path) -> list[Commit]:
+    repo = Repo(str(remote))
+    return [entry.commit for entry in repo.get_walker(include=[repo.refs[cast(Ref, b"refs/heads/main")]])]
+
+
+def test_git_backend_group_commit_folds_concurrent_writes_into_one_push(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (backend_path,) = _clone_pair(tmp_path, remote, "backend")
+    backend = _backend(backend_path, group_commit_max_latency_ms=500)
+    _, seed_version = backend.get("seed", "accounts")
+    arrived = threading.Barrier(4)
+
+    def write(index: int) -> object:
+        arrived.wait()
+        if index == 3:
+            return backend.save("seed", {"name": "Stale"}, "accounts", if_match="stale")
+        return backend.save(f"acct-{index}", {"name": f"Account {index}"}, "accounts")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(write, index) for index in range(4)]
+    results = [future.exception() or future.result() for future in futures]
+
+    # the stale conditional write fails alone; the other three share one commit
+    assert isinstance(results[3], ConcurrencyError)
+    assert all(isinstance(version, str) for version in results[:3])
+    commits = _remote_commits(remote)
+    assert len(commits) == 2
+    message = commits[0].message.decode().splitlines()
+    assert message[0] == "radio-pad-registry: 3 changes"
+    assert sorted(message[2:5]) == ["- update account acct-0", "- update account acct-1", "- update account acct-2"]
+    assert message[-1] == "Generated-by: radio-pad-registry"
+    assert backend.get("seed", "accounts")[1] == seed_version
+    assert [item["id"] for item in backend.list("accounts")] == ["acct-0", "acct-1", "acct-2", "seed"]
+
+
+def test_git_backend_group_commit_splits_groups_at_max_writes(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (backend_path,) = _clone_pair(tmp_path, remote, "backend")
+    backend = _backend(backend_path, group_commit_max_latency_ms=500)
+    backend.group_commit_max_writes = 2
+    arrived = threading.Barrier(4)
+
+    def write(index: int) -> object:
+        arrived.wait()
+        return backend.delete("seed", "accounts") if index == 0 else backend.save(f"p-{index}", {"n": index}, "x")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(write, range(4)))
+
+    assert results[0] is True
+    assert len(_remote_commits(remote)) == 3
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.02)
+
+
+def test_git_backend_background_fetch_keeps_network_off_the_read_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    backend_path, writer_path = _clone_pair(tmp_path, remote, "backend", "writer")
+    backend = _backend(backend_path, fetch_ttl_seconds=0.1, background_fetch=True)
+    try:
+
+        def inline_fetch(*args: object, **kwargs: object) -> None:
+            raise AssertionError("reads must not fetch inline")
+
+        monkeypatch.setattr("datastore.backends.git.porcelain.fetch", inline_fetch)
+        _commit_json(writer_path, "accounts/fetched.json", {"name": "Fetched"}, message=b"writer update")
+        _push_main(writer_path, "origin")
+
+        _wait_for(lambda: backend.get("fetched", "accounts")[0] == {"name": "Fetched"})
+        status = backend.fetch_status()
+        assert status.failures == 0
+        assert status.last_duration_seconds is not None
+        assert status.last_success_age_seconds is not None and status.last_success_age_seconds < 5
+    finally:
+        backend.close()
+
+
+def test_git_backend_background_fetch_counts_failures(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (backend_path,) = _clone_pair(tmp_path, remote, "backend")
+    backend = _backend(backend_path, fetch_ttl_seconds=0.1, background_fetch=True)
+    try:
+        _wait_for(lambda: backend.fetch_status().last_success_age_seconds is not None)
+        shutil.rmtree(remote)
+
+        _wait_for(lambda: backend.fetch_status().consecutive_failures >= 2)
+        assert backend.get("seed", "accounts")[0] == {"name": "Seed"}
+    finally:
+        backend.close()
+
+
+def test_git_backend_async_push_acknowledges_local_commits_while_remote_is_down(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (backend_path,) = _clone_pair(tmp_path, remote, "backend")
+    backend = _backend(backend_path, fetch_ttl_seconds=3600, async_push=True)
+    try:
+        offline = remote.rename(tmp_path / "offline.git")
+        backend.save("local", {"name": "Local"}, "accounts")
+        assert backend.get("local", "accounts")[0] == {"name": "Local"}
+
+        _wait_for(lambda: backend.push_status().consecutive_failures >= 1)
+        status = backend.push_status()
+        assert status.pending_commits == 1
+        assert status.oldest_pending_age_seconds is not None and status.oldest_pending_age_seconds >= 0
+
+        offline.rename(remote)
+        _wait_for(lambda: backend.push_status().pending_commits == 0)
+        assert backend.push_status().consecutive_failures == 0
+        assert _remote_commits(remote)[0].message.startswith(b"radio-pad-registry: update account local")
+    finally:
+        backend.close()
+
+
+def test_git_backend_async_push_reports_sync_status_on_healthz(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (backend_path,) = _clone_pair(tmp_path, remote, "backend")
+    backend = _backend(backend_path, fetch_ttl_seconds=3600, async_push=True)
+    store = DataStore(backend=backend)
+    app = create_app()
+    app.dependency_overrides[get_store] = lambda: store
+    app.state.store = store
+    try:
+        remote.rename(tmp_path / "offline.git")
+        backend.save("local", {"name": "Local"}, "accounts")
+        _wait_for(lambda: backend.push_status().consecutive_failures >= 1)
+
+        with TestClient(app) as client:
+            response = client.get("/healthz/sync")
+        assert response.status_code == 200
+        assert response.headers.get("cache-control") == "no-store"
+        body = response.json()
+        assert body["push"]["pending_commits"] == 1
+        assert body["push"]["consecutive_failures"] >= 1
+        assert body["push"]["oldest_pending_age_seconds"] >= 0
+        assert set(body["fetch"]) == {
+            "last_duration_seconds",
+            "last_success_age_seconds",
+            "failures",
+            "consecutive_failures",
+        }
+    finally:
+        backend.close()
+
+
+def test_git_backend_async_push_serves_reads_and_merges_after_fetch_ttl_while_remote_is_down(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (backend_path,) = _clone_pair(tmp_path, remote, "backend")
+    backend = _backend(backend_path, fetch_ttl_seconds=0.1, async_push=True)
+    try:
+        remote.rename(tmp_path / "offline.git")
+        time.sleep(0.2)
+        assert backend.get("seed", "accounts")[0] == {"name": "Seed"}
+        assert backend.fetch_status().consecutive_failures == 1
+
+        time.sleep(0.2)
+        store = DataStore(backend=backend)
+        account = store.accounts.merge_upsert("seed", AccountCreate(name="Merged"))
+        assert account.name == "Merged"
+        assert backend.get("seed", "accounts")[0] == {"name": "Merged"}
+        assert backend.push_status().pending_commits == 1
+    finally:
+        backend.close()
+
+
+def test_git_backend_async_push_replays_unpushed_commits_after_restart(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    backend_path, writer_path = _clone_pair(tmp_path, remote, "backend", "writer")
+    backend = _backend(backend_path, fetch_ttl_seconds=3600, async_push=True)
+    offline = remote.rename(tmp_path / "offline.git")
+    backend.save("local", {"name": "Local"}, "accounts")
+    backend.close()
+
+    # the remote moves on while the unpushed commit waits in the stopped checkout
+    offline.rename(remote)
+    _commit_json(writer_path, "accounts/remote.json", {"name": "Remote"}, message=b"writer update")
+    _push_main(writer_path, "origin")
+
+    backend = _backend(backend_path, fetch_ttl_seconds=3600, async_push=True)
+    try:
+        _wait_for(lambda: backend.push_status().pending_commits == 0)
+        head, parent = _remote_commits(remote)[:2]
+        assert head.message.startswith(b"radio-pad-registry: update account local")
+        assert parent.message == b"writer update"
+        assert [item["id"] for item in backend.list("accounts")] == ["local", "remote", "seed"]
+    finally:
+        backend.close()
+
+
+def test_git_backend_async_push_restarts_while_remote_is_down(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (backend_path,) = _clone_pair(tmp_path, remote, "backend")
+    backend = _backend(backend_path, fetch_ttl_seconds=3600, async_push=True)
+    offline = remote.rename(tmp_path / "offline.git")
+    backend.save("local", {"name": "Local"}, "accounts")
+    backend.close()
+
+    backend = _backend(backend_path, fetch_ttl_seconds=3600, async_push=True)
+    try:
+        assert backend.fetch_status().consecutive_failures == 1
+        assert backend.get("local", "accounts")[0] == {"name": "Local"}
+        assert backend.push_status().pending_commits == 1
+
+        offline.rename(remote)
+        _wait_for(lambda: backend.push_status().pending_commits == 0)
+        assert _remote_commits(remote)[0].message.startswith(b"radio-pad-registry: update account local")
+    finally:
+        backend.close()
+
+
+def _history_depth(repo_path: Path) -> int:
+    repo = Repo(str(repo_path))
+    return sum(1 for _ in repo.get_walker(include=[repo.refs[cast(Ref, b"refs/heads/main")]]))
+
+
+def test_git_backend_clone_depth_bootstraps_a_shallow_checkout(tmp_path: Path) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (writer_path,) = _clone_pair(tmp_path, remote, "writer")
+    for i in range(3):
+        _commit_json(writer_path, f"accounts/history-{i}.json", {"name": f"History {i}"}, message=b"history")
+    _push_main(writer_path, "origin")
+
+    backend_path = tmp_path / "backend"
+    backend = _backend(backend_path, remote_url=remote, clone_depth=1)
+    assert Repo(str(backend_path)).get_shallow()
+    assert _history_depth(backend_path) == 1
+    assert backend.get("history-2", "accounts")[0] == {"name": "History 2"}
+
+    # fetches and pushes stay incremental on top of the shallow history
+    _commit_json(writer_path, "accounts/fetched.json", {"name": "Fetched"}, message=b"writer update")
+    _push_main(writer_path, "origin")
+    assert backend.get("fetched", "accounts")[0] == {"name": "Fetched"}
+    backend.save("local", {"name": "Local"}, "accounts")
+    assert _remote_commits(remote)[0].message.startswith(b"radio-pad-registry: update account local")
+    assert _history_depth(backend_path) == 3
+
+
+def test_git_backend_deepens_shallow_checkout_through_git_server(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    remote = _create_remote_with_seed(tmp_path)
+    (writer_path,) = _clone_pair(tmp_path, remote, "writer")
+    for i in range(3):
+        _commit_json(writer_path, f"accounts/history-{i}.json", {"name": f"History {i}"}, message=b"history")
+    _push_main(writer_path, "origin")
+
+    local = _backend(tmp_path / "local", remote_url=remote, clone_depth=1)
+    with pytest.raises(ValueError, match="not reachable through a git server"):
+        local.deepen(1)
+
+    if shutil.which("git-upload-pack") is None and shutil.which("git") is None:
+        pytest.skip("git is not installed")
+    monkeypatch.setattr(dulwich_client, "default_local_git_client_cls", dulwich_client.SubprocessGitClient)
+    backend_path = tmp_path / "backend"
+    backend = _backend(backend_path, remote_url=remote, clone_depth=1)
+    assert backend.deepen(2) == 3
+    assert _history_depth(backend_path) == 3
+    assert backend.deepen(10) == 0
+    assert not Repo(str(backend_path)).get_shallow()
+    assert _history_depth(backend_path) == 4
@@ -1,9 +1,15 @@
+import os
+import time
 from pathlib import Path
 
+import pytest
 from hypothesis import HealthCheck, given, settings
 from hypothesis import strategies as st
 
+import datastore.backends.local as local_module
+import datastore.core.cache as cache_module
 from datastore.backends import LocalBackend
+from datastore.core import FileVersionCache, compute_etag, sorted_object_names
 from datastore.types import JsonDoc
 
 # Constrained strategies for safe filenames / path parts
@@ -28,3 +34,76 @@ def test_round_trip(temp_data_path: Path, object_id: str, data: JsonDoc, path_pa
     expected = {k: v for k, v in data.items() if k != "id"}
     assert retrieved_data == expected
     assert isinstance(version, str) and version
+
+
+def test_versions_are_reused_until_the_file_changes(temp_data_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = LocalBackend(str(temp_data_path / "versions"))
+    backend.save("doc", {"name": "first"}, "things")
+
+    hashes: list[JsonDoc] = []
+
+    def counting_compute_etag(data: JsonDoc) -> str:
+        hashes.append(data)
+        return compute_etag(data)
+
+    monkeypatch.setattr(local_module, "compute_etag", counting_compute_etag)
+
+    data, version = backend.get("doc", "things")
+    assert data == {"name": "first"}
+    assert version == compute_etag({"name": "first"})
+    assert backend.get_many(["doc"], "things") == [(data, version)]
+    backend.save("doc", {"name": "second"}, "things", if_match=version)
+    # Only the incoming document is hashed; reads and the if_match check reuse recorded tokens.
+    assert hashes == [{"name": "second"}]
+
+    # Out-of-band edits change the stat signature and are re-hashed on the next read.
+    file_path = temp_data_path / "versions" / "things" / "doc.json"
+    file_path.write_text('{"name": "edited out of band"}\n')
+    data, version = backend.get("doc", "things")
+    assert data == {"name": "edited out of band"}
+    assert version == compute_etag({"name": "edited out of band"})
+
+
+def test_version_tokens_are_bounded_and_dropped_on_delete(temp_data_path: Path) -> None:
+    backend = LocalBackend(str(temp_data_path / "bounded"))
+    backend._versions = FileVersionCache(max_entries=2)
+    versions = {object_id: backend.save(object_id, {"name": object_id}, "things") for object_id in ("a", "b", "c")}
+    assert len(backend._versions) == 2
+
+    # the evicted token is recomputed on the next read
+    assert backend.get("a", "things") == ({"name": "a"}, versions["a"])
+    assert len(backend._versions) == 2
+
+    assert backend.delete("a", "things") is True
+    assert len(backend._versions) == 1
+
+
+def test_listings_are_reused_until_the_directory_changes(temp_data_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = LocalBackend(str(temp_data_path / "listings"))
+    for object_id in ("b", "a", "c"):
+        backend.save(object_id, {"name": object_id}, "things")
+    directory = temp_data_path / "listings" / "things"
+    # Age the directory past the racy window so its listing may be cached.
+    os.utime(directory, ns=(time.time_ns() - 10**10, time.time_ns() - 10**10))
+
+    scans: list[Path] = []
+
+    def counting_sorted_object_names(path: Path) -> list[str]:
+        scans.append(path)
+        return sorted_object_names(path)
+
+    monkeypatch.setattr(cache_module, "sorted_object_names", counting_sorted_object_names)
+
+    assert [item["id"] for item in backend.list("things", per_page=2)] == ["a", "b"]
+    assert [item["id"] for item in backend.list("things", page=2, per_page=2)] == ["c"]
+    assert len(scans) == 1
+
+    # The backend's own writes invalidate the listing.
+    backend.save("d", {"name": "d"}, "things")
+    assert [item["id"] for item in backend.list("things", per_page=10)] == ["a", "b", "c", "d"]
+    assert len(scans) == 2
+
+    # Out-of-band changes move the directory mtime.
+    (directory / "e.json").write_text('{"name": "e"}\n')
+    assert [item["id"] for item in backend.list("things", per_page=10)] == ["a", "b", "c", "d", "e"]
+    assert len(scans) == 3
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Generator
+from typing import Any, cast
 
 import boto3
 import pytest
+from botocore.model import OperationModel
 from moto import mock_aws
 
-from datastore.backends.s3 import S3Backend
+from datastore.backends.s3 import MANIFEST_NAME, S3Backend, build_client_config
 from datastore.core import storage_json
+from datastore.exceptions import ConcurrencyError
 
 
 @pytest.fixture
@@ -73,3 +80,273 @@ class TestS3BackendListFiltering:
         body = obj["Body"].read().decode("utf-8")
 
         assert body == storage_json(payload)
+
+
+@pytest.fixture
+def s3_calls(s3_backend: S3Backend) -> list[str]:
+    """Names of S3 operations issued by the backend's client."""
+    calls: list[str] = []
+
+    def record(model: OperationModel, **_: object) -> None:
+        calls.append(model.name)
+
+    s3_backend.client.meta.events.register("before-call.s3", record)
+    return calls
+
+
+class TestS3BackendConditionalWrites:
+    """Writes are single conditional PUTs; S3 enforces the precondition."""
+
+    def test_create_and_update_are_one_request_each(self, s3_backend: S3Backend, s3_calls: list[str]) -> None:
+        created = s3_backend.save("acct", {"name": "One"}, "accounts", if_none_match="*")
+        updated = s3_backend.save("acct", {"name": "Two"}, "accounts", if_match=created)
+
+        assert s3_calls == ["PutObject", "PutObject"]
+        assert updated != created
+        assert s3_backend.get("acct", "accounts") == ({"name": "Two"}, updated)
+
+    def test_preconditions_map_to_concurrency_error(self, s3_backend: S3Backend, s3_calls: list[str]) -> None:
+        version = s3_backend.save("acct", {"name": "One"}, "accounts")
+        s3_calls.clear()
+
+        with pytest.raises(ConcurrencyError):
+            s3_backend.save("acct", {"name": "Stale"}, "accounts", if_match="not-the-etag")
+        with pytest.raises(ConcurrencyError):
+            s3_backend.save("acct", {"name": "Dup"}, "accounts", if_none_match="*")
+
+        assert s3_calls == ["PutObject", "PutObject"]
+        assert s3_backend.get("acct", "accounts") == ({"name": "One"}, version)
+
+    def test_if_match_on_a_missing_key_creates_it(self, s3_backend: S3Backend, s3_calls: list[str]) -> None:
+        created = s3_backend.save("missing", {"name": "New"}, "accounts", if_match="not-the-etag")
+
+        # the IfMatch PUT finds no key, so the document is created with IfNoneMatch
+        assert s3_calls == ["PutObject", "PutObject"]
+        assert s3_backend.get("missing", "accounts") == ({"name": "New"}, created)
+
+    def test_unchanged_write_is_confirmed_with_head_and_skipped(
+        self, s3_backend: S3Backend, s3_calls: list[str]
+    ) -> None:
+        version = s3_backend.save("acct", {"name": "One"}, "accounts")
+        s3_calls.clear()
+
+        assert s3_backend.save("acct", {"name": "One"}, "accounts", if_match=version) == version
+        assert s3_calls == ["HeadObject"]
+
+    def test_stale_hash_hint_never_drops_a_write(self, s3_backend: S3Backend, s3_calls: list[str]) -> None:
+        s3_backend.save("acct", {"name": "One"}, "accounts")
+        # Another writer changes the object behind this backend's back.
+        s3_backend.client.put_object(
+            Bucket=s3_backend.bucket, Key="test/accounts/acct.json", Body=storage_json({"name": "Other"})
+        )
+        s3_calls.clear()
+
+        version = s3_backend.save("acct", {"name": "One"}, "accounts")
+
+        assert s3_calls == ["HeadObject", "PutObject"]
+        assert s3_backend.get("acct", "accounts") == ({"name": "One"}, version)
+
+
+def inject_get_latency(backend: S3Backend, latency: Callable[[str], float]) -> None:
+    """Delay each GetObject by latency(key) seconds, standing in for S3 round-trip time."""
+
+    def delay(params: dict[str, Any], **_: object) -> None:
+        time.sleep(latency(params["Key"]))
+
+    backend.client.meta.events.register("before-parameter-build.s3.GetObject", delay)
+
+
+def test_list_fetches_page_concurrently_and_keeps_key_order(s3_backend: S3Backend) -> None:
+    ids = [f"acct-{i:02d}" for i in range(12)]
+    for object_id in ids:
+        s3_backend.save(object_id, {"name": object_id}, "accounts")
+
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def track(**_: object) -> None:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+
+    def untrack(**_: object) -> None:
+        nonlocal in_flight
+        with lock:
+            in_flight -= 1
+
+    s3_backend.client.meta.events.register("before-parameter-build.s3.GetObject", track)
+    # Later keys answer first, so completion order is the reverse of key order.
+    inject_get_latency(s3_backend, lambda key: 0.002 * (12 - int(key[-7:-5])))
+    s3_backend.client.meta.events.register("after-call.s3.GetObject", untrack)
+
+    result = s3_backend.list("accounts", per_page=12)
+
+    assert [item["id"] for item in result] == ids
+    assert 1 < peak <= s3_backend.max_workers
+
+
+def test_undersized_connection_pool_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.WARNING, logger="uvicorn")
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1", config=build_client_config(max_pool_connections=2))
+        client.create_bucket(Bucket="bkt")
+        backend = S3Backend(bucket="bkt", client=client, max_workers=8)
+        assert "smaller than the fetch width (8)" in caplog.text
+
+        ids = [f"acct-{i}" for i in range(8)]
+        for object_id in ids:
+            backend.save(object_id, {"name": object_id}, "accounts")
+
+        def hold_connection(**_: object) -> None:
+            time.sleep(0.02)
+
+        # registered after the backend's own before-send handler, so the request already counts as in flight
+        client.meta.events.register("before-send.s3", hold_connection)
+        backend.get_many(ids, "accounts")
+
+    assert backend._pool_monitor.peak > 2
+    assert backend._pool_monitor.in_flight == 0
+    assert "S3 connection pool saturated" in caplog.text
+
+
+class TestS3BackendPageTokenCache:
+    """Numbered pages resume from cached continuation tokens instead of re-walking the listing."""
+
+    @pytest.fixture
+    def paged_backend(self, s3_backend: S3Backend) -> S3Backend:
+        for i in range(10):
+            s3_backend.save(f"acct-{i}", {"name": f"Account {i}"}, "accounts")
+        return s3_backend
+
+    def _page_ids(self, backend: S3Backend, page: int) -> list[str]:
+        return [item["id"] for item in backend.list("accounts", page=page, per_page=2)]
+
+    def test_sequential_paging_costs_one_list_call_per_page(
+        self, paged_backend: S3Backend, s3_calls: list[str]
+    ) -> None:
+        pages = [self._page_ids(paged_backend, page) for page in range(1, 7)]
+
+        assert pages == [[f"acct-{i}", f"acct-{i + 1}"] for i in range(0, 10, 2)] + [[]]
+        assert s3_calls.count("ListObjectsV2") == 6
+
+    def test_deep_page_jumps_straight_to_cached_token(self, paged_backend: S3Backend, s3_calls: list[str]) -> None:
+        assert self._page_ids(paged_backend, 5) == ["acct-8", "acct-9"]
+        assert s3_calls.count("ListObjectsV2") == 5
+        s3_calls.clear()
+
+        assert self._page_ids(paged_backend, 5) == ["acct-8", "acct-9"]
+        assert self._page_ids(paged_backend, 3) == ["acct-4", "acct-5"]
+        assert s3_calls.count("ListObjectsV2") == 2
+
+    def test_huge_page_numbers_bisect_to_the_nearest_cached_token(
+        self, paged_backend: S3Backend, s3_calls: list[str]
+    ) -> None:
+        self._page_ids(paged_backend, 5)
+        s3_calls.clear()
+
+        started = time.monotonic()
+        assert self._page_ids(paged_backend, 10**12) == []
+        assert time.monotonic() - started < 1
+        # resumes from page 5's token and stops once the listing runs out
+        assert s3_calls.count("ListObjectsV2") == 1
+        storage_dir = paged_backend._storage_dir(("accounts",))
+        assert paged_backend._page_tokens.nearest(storage_dir, 2, 10**12)[0] == 5
+
+    def test_own_writes_and_ttl_invalidate_tokens(self, paged_backend: S3Backend, s3_calls: list[str]) -> None:
+        self._page_ids(paged_backend, 5)
+        paged_backend.save("acct-0a", {"name": "Inserted"}, "accounts")
+        s3_calls.clear()
+
+        assert self._page_ids(paged_backend, 2) == ["acct-1", "acct-2"]
+        assert s3_calls.count("ListObjectsV2") == 2
+
+        paged_backend._page_tokens.ttl_seconds = 0
+        s3_calls.clear()
+        assert self._page_ids(paged_backend, 2) == ["acct-1", "acct-2"]
+        assert s3_calls.count("ListObjectsV2") == 2
+
+
+class TestS3BackendManifests:
+    """Per-directory `_index.json` manifests replace ListObjectsV2 and per-item GETs on list paths."""
+
+    @pytest.fixture
+    def indexed_backend(self, s3_backend: S3Backend) -> S3Backend:
+        s3_backend.manifests = True
+        s3_backend.save("b-preset", {"name": "B", "category": "News", "stations": [{"name": "s"}]}, "presets")
+        s3_backend.save("a-preset", {"name": "A", "stations": []}, "presets")
+        s3_backend.save("living-room", {"name": "Living Room"}, "accounts", "briceburg", "players")
+        assert s3_backend.rebuild_manifests() == ["test/accounts/briceburg/players/", "test/presets/"]
+        return s3_backend
+
+    def _manifest(self, backend: S3Backend, storage_dir: str) -> dict[str, Any]:
+        obj = backend.client.get_object(Bucket=backend.bucket, Key=f"{storage_dir}{MANIFEST_NAME}")
+        return cast(dict[str, Any], json.loads(obj["Body"].read()))
+
+    def test_summaries_are_served_from_one_conditional_get(
+        self, indexed_backend: S3Backend, s3_calls: list[str]
+    ) -> None:
+        s3_calls.clear()
+        expected = [{"id": "a-preset", "name": "A"}, {"id": "b-preset", "name": "B", "category": "News"}]
+
+        assert indexed_backend.list_summaries("presets") == expected
+        assert indexed_backend.list_summaries("presets", page=2, per_page=1) == expected[1:]
+        assert indexed_backend.list_summaries("presets", start_after="a-preset") == expected[1:]
+        assert s3_calls == ["GetObject"] * 3
+
+        full = indexed_backend.list("presets")
+        assert [item["stations"] for item in full] == [[], [{"name": "s"}]]
+        assert "ListObjectsV2" not in s3_calls
+
+    def test_writes_and_deletes_keep_the_manifest_current(self, indexed_backend: S3Backend) -> None:
+        version = indexed_backend.save("c-preset", {"name": "C"}, "presets")
+        indexed_backend.save("a-preset", {"name": "A2", "stations": []}, "presets")
+        assert indexed_backend.delete("b-preset", "presets")
+
+        manifest = self._manifest(indexed_backend, "test/presets/")
+        assert sorted(manifest["entries"]) == ["a-preset", "c-preset"]
+        assert manifest["entries"]["c-preset"] == {"version": version, "summary": {"name": "C"}}
+        assert [item["name"] for item in indexed_backend.list_summaries("presets")] == ["A2", "C"]
+        assert MANIFEST_NAME not in [item["id"] + ".json" for item in indexed_backend.list("presets")]
+
+    def test_conflicting_manifest_updates_are_retried(self, indexed_backend: S3Backend) -> None:
+        other = S3Backend(bucket=indexed_backend.bucket, prefix="test", client=indexed_backend.client, manifests=True)
+        raced: list[bool] = []
+
+        def race(params: dict[str, Any], **_: object) -> None:
+            if params["Key"].endswith(MANIFEST_NAME) and not raced:
+                raced.append(True)
+                other.save("racer", {"name": "Racer"}, "presets")
+
+        indexed_backend.client.meta.events.register("before-parameter-build.s3.PutObject", race)
+        indexed_backend.save("c-preset", {"name": "C"}, "presets")
+
+        assert raced
+        assert sorted(self._manifest(indexed_backend, "test/presets/")["entries"]) == [
+            "a-preset",
+            "b-preset",
+            "c-preset",
+            "racer",
+        ]
+
+    def test_unindexed_directories_fall_back_to_listing(self, indexed_backend: S3Backend, s3_calls: list[str]) -> None:
+        indexed_backend.save("briceburg", {"name": "Brice"}, "accounts")
+        s3_calls.clear()
+
+        assert indexed_backend.list_summaries("accounts") == [{"id": "briceburg", "name": "Brice"}]
+        assert "ListObjectsV2" in s3_calls
+
+    def test_rebuild_repairs_drift_rereading_only_changed_documents(
+        self, indexed_backend: S3Backend, s3_calls: list[str]
+    ) -> None:
+        client, bucket = indexed_backend.client, indexed_backend.bucket
+        client.put_object(Bucket=bucket, Key="test/presets/d-preset.json", Body=storage_json({"name": "D"}))
+        client.delete_object(Bucket=bucket, Key="test/presets/b-preset.json")
+        s3_calls.clear()
+
+        assert indexed_backend.rebuild_manifests("presets") == ["test/presets/"]
+        # the manifest itself plus the one document that is new
+        assert s3_calls.count("GetObject") == 2
+        assert [item["id"] for item in indexed_backend.list_summaries("presets")] == ["a-preset", "d-preset"]
+        assert indexed_backend.rebuild_manifests("presets") == []
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from datastore.backends.sqlite import SQLiteBackend
+from datastore.exceptions import ConcurrencyError
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path: Path) -> SQLiteBackend:
+    return SQLiteBackend(str(tmp_path / "store.sqlite3"), prefix="test")
+
+
+def test_database_uses_wal_and_primary_key_range_scans(sqlite_backend: SQLiteBackend) -> None:
+    conn = sqlite3.connect(str(sqlite_backend.db_path))
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    plan = " ".join(
+        str(row[-1])
+        for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT name, body FROM objects WHERE collection = ? AND name > ? ORDER BY name LIMIT ?",
+            ("test/accounts", "a.json", 10),
+        )
+    )
+    assert "USING PRIMARY KEY" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_if_match_is_enforced(sqlite_backend: SQLiteBackend) -> None:
+    sqlite_backend.save("acct", {"name": "One"}, "accounts")
+    _, version = sqlite_backend.get("acct", "accounts")
+    assert version is not None
+
+    sqlite_backend.save("acct", {"name": "Two"}, "accounts", if_match=version)
+
+    with pytest.raises(ConcurrencyError):
+        sqlite_backend.save("acct", {"name": "Three"}, "accounts", if_match=version)
+    data, _ = sqlite_backend.get("acct", "accounts")
+    assert data == {"name": "Two"}
+
+
+def test_concurrent_conditional_writes_admit_exactly_one_winner(sqlite_backend: SQLiteBackend) -> None:
+    sqlite_backend.save("acct", {"name": "Base"}, "accounts")
+    _, version = sqlite_backend.get("acct", "accounts")
+
+    def write(i: int) -> bool:
+        try:
+            sqlite_backend.save("acct", {"name": f"Writer {i}"}, "accounts", if_match=version)
+        except ConcurrencyError:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outcomes = list(executor.map(write, range(16)))
+
+    assert outcomes.count(True) == 1
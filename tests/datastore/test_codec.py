@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from collections.abc import Generator
+
+import pytest
+from hypothesis import example, given, settings
+from hypothesis import strategies as st
+
+from datastore.core import build_codec, compute_etag, get_codec, set_codec
+from datastore.core.codec import JsonCodec, StdlibCodec
+from lib.constants import BASE_DIR
+
+FAST_CODECS = [name for name in ("orjson", "msgspec") if importlib.util.find_spec(name) is not None]
+
+json_text = st.text(alphabet=st.characters(exclude_categories=["Cs"]), max_size=12)
+json_scalars = st.one_of(
+    st.none(),
+    st.booleans(),
+    st.integers(min_value=-(2**80), max_value=2**80),
+    st.floats(allow_nan=False, allow_infinity=False),
+    json_text,
+)
+json_docs = st.dictionaries(
+    json_text,
+    st.recursive(
+        json_scalars,
+        lambda children: st.lists(children, max_size=3) | st.dictionaries(json_text, children, max_size=3),
+        max_leaves=8,
+    ),
+    max_size=5,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_codec() -> Generator[None]:
+    yield
+    set_codec(None)
+
+
+@pytest.fixture(params=FAST_CODECS)
+def fast_codec(request: pytest.FixtureRequest) -> JsonCodec:
+    return build_codec(request.param)
+
+
+@given(doc=json_docs)
+@example(doc={"": -9223372036854775809})
+@settings(max_examples=200)
+def test_fast_codecs_match_stdlib_bytes(doc: dict[str, object]) -> None:
+    stdlib = StdlibCodec()
+    for name in FAST_CODECS:
+        codec = build_codec(name)
+        assert codec.canonical(doc) == stdlib.canonical(doc), name
+        assert codec.storage(doc) == stdlib.storage(doc), name
+        assert codec.loads(stdlib.canonical(doc)) == doc, name
+
+
+def test_fast_codec_handles_real_presets(fast_codec: JsonCodec) -> None:
+    stdlib = StdlibCodec()
+    for path in (BASE_DIR / "seed-data").rglob("*.json"):
+        raw = path.read_bytes()
+        doc = fast_codec.loads(raw)
+        assert doc == json.loads(raw)
+        assert fast_codec.canonical(doc) == stdlib.canonical(doc)
+        assert fast_codec.storage(doc) == stdlib.storage(doc)
+
+
+def test_fast_codec_preserves_big_integers_and_nan_literals(fast_codec: JsonCodec) -> None:
+    assert fast_codec.loads(b'{"n": 123456789012345678901234567890}') == {"n": 123456789012345678901234567890}
+    assert fast_codec.loads(b'{"n": -9223372036854775809}') == {"n": -9223372036854775809}
+    assert fast_codec.loads(b'{"n": 1e16}') == {"n": 1e16}
+    nan = fast_codec.loads(b'{"n": NaN}')["n"]
+    assert nan != nan
+
+
+def test_etags_are_stable_across_codecs() -> None:
+    doc = {"name": "Preset", "stations": [{"name": "é", "url": "https://example.com"}], "n": 1.5e-7}
+    set_codec("stdlib")
+    expected = compute_etag(doc)
+    for name in FAST_CODECS:
+        set_codec(name)
+        assert compute_etag(doc) == expected
+
+
+def test_codec_selection_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("REGISTRY_JSON_CODEC", "stdlib")
+    set_codec(None)
+    assert get_codec().name == "stdlib"
+
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        build_codec("simdjson")
@@ -7,7 +7,7 @@ from dulwich.repo import Repo
 from pytest import LogCaptureFixture
 
 from datastore import DataStore
-from datastore.backends import GitBackend, LocalBackend, S3Backend
+from datastore.backends import GitBackend, LocalBackend, S3Backend, SQLiteBackend
 
 
 def test_datastore_creates_local_backend_by_default(monkeypatch: MonkeyPatch) -> None:
@@ -38,10 +38,40 @@ def test_datastore_creates_s3_backend_from_env_var(monkeypatch: MonkeyPatch) ->
     monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
     monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
     monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("REGISTRY_BACKEND_S3_MAX_WORKERS", "32")
+    monkeypatch.setenv("REGISTRY_BACKEND_S3_MANIFESTS", "true")
 
     store = DataStore()
     assert isinstance(store.backend, S3Backend)
     assert store.backend.bucket == "test-bucket"
+    assert store.backend.max_workers == 32
+    assert store.backend.manifests is True
+    config = store.backend.client.meta.config
+    assert config.max_pool_connections == 32
+    assert config.retries == {"mode": "adaptive", "total_max_attempts": 3}
+    assert config.tcp_keepalive is True
+
+
+def test_datastore_s3_client_settings_from_env_vars(monkeypatch: MonkeyPatch) -> None:
+    """Pool size, timeouts, retries and keepalive are tunable via REGISTRY_BACKEND_S3_* variables."""
+    monkeypatch.setenv("REGISTRY_BACKEND", "s3")
+    monkeypatch.setenv("REGISTRY_BACKEND_S3_BUCKET", "test-bucket")
+    monkeypatch.setenv("AWS_EC2_METADATA_DISABLED", "true")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("REGISTRY_BACKEND_S3_MAX_POOL_CONNECTIONS", "64")
+    monkeypatch.setenv("REGISTRY_BACKEND_S3_CONNECT_TIMEOUT_SECONDS", "1.5")
+    monkeypatch.setenv("REGISTRY_BACKEND_S3_READ_TIMEOUT_SECONDS", "7")
+    monkeypatch.setenv("REGISTRY_BACKEND_S3_RETRY_MODE", "standard")
+    monkeypatch.setenv("REGISTRY_BACKEND_S3_MAX_ATTEMPTS", "5")
+    monkeypatch.setenv("REGISTRY_BACKEND_S3_TCP_KEEPALIVE", "false")
+
+    store = DataStore()
+    assert isinstance(store.backend, S3Backend)
+    config = store.backend.client.meta.config
+    assert config.max_pool_connections == 64
+    assert (config.connect_timeout, config.read_timeout) == (1.5, 7.0)
+    assert config.retries == {"mode": "standard", "total_max_attempts": 5}
+    assert config.tcp_keepalive is False
 
 
 def test_datastore_creates_git_backend_from_env_var(
@@ -87,3 +117,34 @@ def test_datastore_raises_error_if_s3_bucket_is_missing(monkeypatch: MonkeyPatch
 
     with pytest.raises(ValueError, match="S3 backend selected but REGISTRY_BACKEND_S3_BUCKET is not set"):
         DataStore()
+
+
+def test_datastore_entity_cache_is_disabled_by_default(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("REGISTRY_CACHE_MAX_ENTRIES", raising=False)
+
+    store = DataStore(backend=LocalBackend(base_path=str(tmp_path)))
+    assert store.cache is None
+
+
+def test_datastore_entity_cache_from_env_var(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("REGISTRY_CACHE_MAX_ENTRIES", "64")
+    monkeypatch.setenv("REGISTRY_CACHE_TTL_SECONDS", "2.5")
+
+    store = DataStore(backend=LocalBackend(base_path=str(tmp_path)))
+    assert store.cache is not None
+    assert store.cache.max_entries == 64
+    assert store.cache.ttl_seconds == 2.5
+    assert store.accounts._cache is store.cache
+    assert store.players._cache is store.cache
+
+
+def test_datastore_creates_sqlite_backend_from_env_var(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """SQLiteBackend is created when REGISTRY_BACKEND is 'sqlite'."""
+    monkeypatch.setenv("REGISTRY_BACKEND", "sqlite")
+    monkeypatch.setenv("REGISTRY_BACKEND_PATH", str(tmp_path))
+    monkeypatch.delenv("REGISTRY_BACKEND_PREFIX", raising=False)
+
+    store = DataStore()
+    assert isinstance(store.backend, SQLiteBackend)
+    assert store.backend.db_path == tmp_path / "registry.sqlite3"
+    assert store.backend.prefix == "registry-v1"
@@ -1,10 +1,15 @@
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from datastore.backends import LocalBackend
-from datastore.core import ModelStore
+from datastore.core import EntityCache, ModelStore
+from datastore.exceptions import ConcurrencyError
+from datastore.stores import AccountPresets
+from datastore.types import JsonDoc, ValueWithETag
 from models.account import Account, AccountCreate
+from models.station_preset import AccountStationPresetSummary
 
 
 def test_template_requires_id_at_end(tmp_path: Path) -> None:
@@ -47,3 +52,224 @@ def test_placeholders_accepted_and_injected(tmp_path: Path) -> None:
     got = repo.get("acc1", path_params={"account_id": "acct"})
     assert got is not None
     assert got.id == "acc1"
+
+
+class _CountingBackend(LocalBackend):
+    def __init__(self, base_path: str) -> None:
+        super().__init__(base_path)
+        self.gets = 0
+
+    def get(self, object_id: str, *path_parts: str) -> ValueWithETag[JsonDoc]:
+        self.gets += 1
+        return super().get(object_id, *path_parts)
+
+
+def _cached_repo(
+    tmp_path: Path, *, ttl_seconds: float = 60, max_entries: int = 8
+) -> tuple[_CountingBackend, ModelStore[Account, AccountCreate]]:
+    backend = _CountingBackend(str(tmp_path))
+    cache = EntityCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+    return backend, ModelStore(backend, model=Account, path_template="accounts/{id}", cache=cache)
+
+
+def test_cached_get_skips_backend_while_fresh(tmp_path: Path) -> None:
+    backend, repo = _cached_repo(tmp_path)
+    repo.save(Account(id="acct", name="One"))
+
+    first = repo.get("acct")
+    second = repo.get("acct")
+
+    assert first is second
+    assert backend.gets == 1
+
+
+def test_cached_get_revalidates_stale_entry_by_version(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    backend, repo = _cached_repo(tmp_path, ttl_seconds=0)
+    repo.save(Account(id="acct", name="One"))
+    first = repo.get("acct")
+
+    validations = 0
+    real_validate = Account.model_validate
+
+    def counting_validate(data: object) -> Account:
+        nonlocal validations
+        validations += 1
+        return real_validate(data)
+
+    monkeypatch.setattr(Account, "model_validate", counting_validate)
+
+    assert repo.get("acct") is first
+    assert validations == 0
+    assert backend.gets == 2
+
+    backend.save("acct", {"name": "Changed elsewhere"}, "accounts")
+    changed = repo.get("acct")
+    assert changed is not None and changed.name == "Changed elsewhere"
+    assert validations == 1
+
+
+def test_cache_is_invalidated_by_writes(tmp_path: Path) -> None:
+    _, repo = _cached_repo(tmp_path)
+    repo.save(Account(id="acct", name="One"))
+    assert repo.get("acct") is not None
+
+    repo.merge_upsert("acct", AccountCreate(name="Two"))
+    updated = repo.get("acct")
+    assert updated is not None and updated.name == "Two"
+
+    repo.save(Account(id="acct", name="Three"))
+    saved = repo.get("acct")
+    assert saved is not None and saved.name == "Three"
+
+    assert repo.delete("acct") is True
+    assert repo.get("acct") is None
+
+
+def test_get_racing_a_save_does_not_cache_the_document_it_read(tmp_path: Path) -> None:
+    backend, repo = _cached_repo(tmp_path)
+    repo.save(Account(id="acct", name="Old"))
+    real_get = backend.get
+
+    def get_then_save_concurrently(object_id: str, *path_parts: str) -> ValueWithETag[JsonDoc]:
+        result = real_get(object_id, *path_parts)
+        backend.get = real_get  # type: ignore[method-assign]
+        repo.save(Account(id="acct", name="New"))
+        return result
+
+    backend.get = get_then_save_concurrently  # type: ignore[method-assign]
+    stale = repo.get("acct")
+    assert stale is not None and stale.name == "Old"
+
+    current = repo.get("acct")
+    assert current is not None and current.name == "New"
+
+
+def test_cache_put_is_skipped_after_invalidation_even_when_generations_are_evicted() -> None:
+    cache = EntityCache(max_entries=2, ttl_seconds=60)
+    generation = cache.generation("a")
+    cache.invalidate("a")
+    cache.invalidate("b")
+    cache.invalidate("c")
+
+    cache.put("a", "A", "1", generation=generation)
+    assert cache.get("a") is None
+    cache.put("a", "A", "1", generation=cache.generation("a"))
+    assert cache.get("a") is not None
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = EntityCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", "A", "1")
+    cache.put("b", "B", "2")
+    assert cache.get("a") is not None
+    cache.put("c", "C", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert len(cache) == 2
+
+
+def test_get_many_returns_models_aligned_with_ids(tmp_path: Path) -> None:
+    store = LocalBackend(str(tmp_path))
+    repo: ModelStore[Account, AccountCreate] = ModelStore(
+        store, model=Account, path_template="accounts/{account_id}/{id}"
+    )
+    repo.merge_upsert("one", AccountCreate(name="One"), path_params={"account_id": "acct"})
+    repo.merge_upsert("two", AccountCreate(name="Two"), path_params={"account_id": "acct"})
+
+    got = repo.get_many(["two", "nope", "one"], path_params={"account_id": "acct"})
+
+    assert [m.name if m else None for m in got] == ["Two", None, "One"]
+
+
+def test_cached_get_many_only_fetches_misses(tmp_path: Path) -> None:
+    backend, repo = _cached_repo(tmp_path)
+    repo.save(Account(id="a", name="A"))
+    repo.save(Account(id="b", name="B"))
+    cached_a = repo.get("a")
+
+    got = repo.get_many(["a", "b"])
+
+    assert got[0] is cached_a
+    assert got[1] is not None and got[1].name == "B"
+    assert repo.get("b") is got[1]
+    assert backend.gets == 1
+
+
+def test_exists_does_not_read_or_validate_documents(tmp_path: Path) -> None:
+    backend = _CountingBackend(str(tmp_path))
+    repo: ModelStore[Account, AccountCreate] = ModelStore(backend, model=Account, path_template="accounts/{id}")
+    # Stored document that would fail model validation (missing name)
+    backend.save("broken", {"unexpected": True}, "accounts")
+
+    assert repo.exists("broken") is True
+    assert repo.exists("missing") is False
+    assert backend.gets == 0
+
+
+def test_list_summaries_validates_only_projected_fields(tmp_path: Path) -> None:
+    backend = LocalBackend(str(tmp_path))
+    repo = AccountPresets(backend)
+    # Duplicate/invalid stations would fail full AccountStationPreset validation
+    broken_stations = [{"name": "A", "url": "not-a-url"}, {"name": "A", "url": "not-a-url"}]
+    backend.save(
+        "p1", {"name": "Preset", "category": "News", "stations": broken_stations}, "accounts", "acct", "presets"
+    )
+
+    summaries = repo.list_summaries(AccountStationPresetSummary, path_params={"account_id": "acct"})
+
+    assert summaries == [AccountStationPresetSummary(id="p1", account_id="acct", name="Preset", category="News")]
+    with pytest.raises(ValidationError):
+        repo.list(path_params={"account_id": "acct"})
+
+
+@pytest.mark.parametrize("ttl_seconds", [None, 0, 60], ids=["uncached", "stale-cache", "fresh-cache"])
+def test_get_versioned_skips_validation_when_not_modified(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, ttl_seconds: float | None
+) -> None:
+    if ttl_seconds is None:
+        repo: ModelStore[Account, AccountCreate] = ModelStore(
+            LocalBackend(str(tmp_path)), model=Account, path_template="accounts/{id}"
+        )
+    else:
+        _, repo = _cached_repo(tmp_path, ttl_seconds=ttl_seconds)
+    repo.save(Account(id="acct", name="One"))
+    entity, version = repo.get_versioned("acct")
+    assert entity is not None and entity.name == "One"
+    assert version is not None
+
+    validations = 0
+    real_validate = Account.model_validate
+
+    def counting_validate(data: object) -> Account:
+        nonlocal validations
+        validations += 1
+        return real_validate(data)
+
+    monkeypatch.setattr(Account, "model_validate", counting_validate)
+
+    assert repo.get_versioned("acct", if_none_match={version}) == (None, version)
+    assert repo.get_versioned("acct", if_none_match={"*"}) == (None, version)
+    assert validations == 0
+    assert repo.get_versioned("missing", if_none_match={"*"}) == (None, None)
+
+
+def test_merge_upsert_if_match_rejects_stale_versions_without_writing(tmp_path: Path) -> None:
+    backend, repo = _cached_repo(tmp_path)
+    _, version = repo.merge_upsert_versioned("acct", AccountCreate(name="One"))
+    assert version == backend.get("acct", "accounts")[1]
+
+    with pytest.raises(ConcurrencyError):
+        repo.merge_upsert("acct", AccountCreate(name="Stale"), if_match={"stale"})
+    with pytest.raises(ConcurrencyError):
+        repo.merge_upsert("missing", AccountCreate(name="New"), if_match={"*"})
+    assert not backend.exists("missing", "accounts")
+
+    current = repo.get("acct")
+    assert current is not None and current.name == "One"
+
+    model, new_version = repo.merge_upsert_versioned("acct", AccountCreate(name="Two"), if_match={version})
+    assert model.name == "Two"
+    assert new_version != version
+    assert repo.merge_upsert("acct", AccountCreate(name="Three"), if_match={"*"}).name == "Three"
@@ -1,13 +1,25 @@
+import importlib.util
+import io
+import json
 import logging
+import os
+import shutil
+import subprocess
 import time
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
 
 import boto3
 import pytest
+from dulwich import client as dulwich_client
+from dulwich import porcelain
+from dulwich.objects import Blob, Tree
+from dulwich.repo import Repo
 
 from datastore import DataStore
-from datastore.backends import LocalBackend, S3Backend
+from datastore.backends import GitBackend, LocalBackend, S3Backend
+from datastore.core import build_codec
+from lib.constants import BASE_DIR
 from models.account import Account
 from models.station_preset import GlobalStationPreset
 
@@ -61,6 +73,22 @@ def test_pagination_performance(tmp_path: Path) -> None:
     assert len(paged_accounts) == 100
     assert len(paged_presets) == 100
 
+    # Steady state: directories untouched since the last write, listings served from the
+    # per-directory sorted-name cache instead of a scan and sort per request.
+    past_ns = time.time_ns() - 10**10
+    for directory in [data_path, *(p for p in data_path.rglob("*") if p.is_dir())]:
+        os.utime(directory, ns=(past_ns, past_ns))
+    for label in ("first pass fills the", "served from the"):
+        start_time = time.perf_counter()
+        for page in range(1, 11):
+            assert len(datastore.accounts.list(page=page, per_page=20)) == 20
+        duration = time.perf_counter() - start_time
+        logging.info(
+            "\nLocal pagination of 10 x 20-item account pages (%s listing cache) took %.4f seconds.",
+            label,
+            duration,
+        )
+
 
 @pytest.fixture
 def s3_backend() -> Generator[S3Backend]:
@@ -100,3 +128,213 @@ def test_s3_pagination_performance(s3_backend: S3Backend, page_to_fetch: int, pe
         f"with {NUM_ACCOUNTS} objects took {duration:.4f} seconds."
     )
     assert len(result) == per_page
+
+    # The same page again resumes from the cached continuation token.
+    start_time = time.perf_counter()
+    s3_backend.list("test-path", page=page_to_fetch, per_page=per_page)
+    duration = time.perf_counter() - start_time
+    logging.info(
+        f"\nS3 pagination for page {page_to_fetch} with a cached continuation token took {duration:.4f} seconds."
+    )
+
+
+@pytest.mark.performance
+def test_json_codec_performance() -> None:
+    """
+    Compares installed JSON codecs on the checked-in preset and a synthetic large preset.
+    """
+    seed_preset = json.loads((BASE_DIR / "seed-data/store/presets/briceburg.json").read_text())
+    large_preset = {
+        "name": "Large Preset",
+        "stations": [{"name": f"Station {i}", "url": f"http://example.com/stream-{i}"} for i in range(500)],
+    }
+    codecs = [name for name in ("stdlib", "orjson", "msgspec") if name == "stdlib" or importlib.util.find_spec(name)]
+
+    for label, doc, iterations in (("seed preset", seed_preset, 5000), ("500-station preset", large_preset, 200)):
+        raw = build_codec("stdlib").storage(doc)
+        for name in codecs:
+            codec = build_codec(name)
+            start_time = time.perf_counter()
+            for _ in range(iterations):
+                codec.storage(doc)
+                codec.canonical(doc)
+                codec.loads(raw)
+            duration = time.perf_counter() - start_time
+            logging.info(
+                "\n%s codec: %s encode+hash+parse iterations of the %s took %.4f seconds.",
+                name,
+                iterations,
+                label,
+                duration,
+            )
+            assert codec.storage(doc) == raw
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("per_page", [10, 50, 100])
+def test_s3_list_latency_scales_with_fetch_width(s3_backend: S3Backend, per_page: int) -> None:
+    """
+    Times S3 list pages with 20ms injected per GET, serially and with concurrent fetch widths.
+    """
+    latency_seconds = 0.02
+    for i in range(per_page):
+        s3_backend.save(f"object-{i:03d}", {"data": f"value-{i}"}, "latency")
+
+    def delay(**_: object) -> None:
+        time.sleep(latency_seconds)
+
+    s3_backend.client.meta.events.register("before-parameter-build.s3.GetObject", delay)
+
+    durations: dict[int, float] = {}
+    for max_workers in (1, 8, 32):
+        backend = S3Backend(
+            bucket=s3_backend.bucket, prefix=s3_backend.prefix, client=s3_backend.client, max_workers=max_workers
+        )
+        start_time = time.perf_counter()
+        result = backend.list("latency", per_page=per_page)
+        durations[max_workers] = time.perf_counter() - start_time
+        assert [item["id"] for item in result] == [f"object-{i:03d}" for i in range(per_page)]
+        logging.info(
+            "\nS3 list of %s items with %.0fms GETs and %s fetch workers took %.4f seconds.",
+            per_page,
+            latency_seconds * 1000,
+            max_workers,
+            durations[max_workers],
+        )
+
+    assert durations[8] < durations[1]
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("read_mode", ["worktree", "objects"])
+def test_git_per_operation_overhead(tmp_path: Path, read_mode: str) -> None:
+    """
+    Times per-operation overhead of the git backend against a local bare-repo remote, reads within the fetch TTL.
+    """
+    remote = tmp_path / "remote.git"
+    Repo.init_bare(str(remote), mkdir=True)
+    seed = tmp_path / "seed"
+    (seed / "accounts").mkdir(parents=True)
+    (seed / "accounts" / "seed.json").write_text('{"name": "Seed"}\n')
+    Repo.init(str(seed))
+    porcelain.add(str(seed), paths=["accounts/seed.json"])
+    porcelain.commit(str(seed), message=b"seed", author=b"Perf <perf@example.invalid>")
+    porcelain.push(str(seed), str(remote), refspecs="HEAD:refs/heads/main", errstream=io.BytesIO())
+
+    backend = GitBackend(
+        str(tmp_path / "checkout"), remote_url=str(remote), fetch_ttl_seconds=3600, read_mode=read_mode
+    )
+    for i in range(20):
+        backend.save(f"account-{i}", {"name": f"Account {i}"}, "accounts")
+
+    iterations = 500
+    operations: dict[str, Callable[[int], object]] = {
+        "get": lambda i: backend.get(f"account-{i % 20}", "accounts"),
+        "exists": lambda i: backend.exists(f"account-{i % 20}", "accounts"),
+        "list (5 items)": lambda i: backend.list("accounts", per_page=5),
+    }
+    for label, operation in operations.items():
+        start_time = time.perf_counter()
+        for i in range(iterations):
+            operation(i)
+        duration = time.perf_counter() - start_time
+        logging.info(
+            "\nGit %s-mode %s averaged %.1f microseconds over %s calls.",
+            read_mode,
+            label,
+            duration / iterations * 1_000_000,
+            iterations,
+        )
+
+    start_time = time.perf_counter()
+    for i in range(20):
+        backend.save(f"account-{i}", {"name": f"Renamed {i}"}, "accounts")
+    duration = time.perf_counter() - start_time
+    logging.info("\nGit %s-mode save (fetch, commit, push) averaged %.1f ms.", read_mode, duration / 20 * 1000)
+    backend.close()
+
+
+def _synthetic_git_remote(path: Path, commits: int) -> None:
+    """Bare repo whose `main` has `commits` commits, each rewriting one of 500 account documents."""
+    stream = io.BytesIO()
+    for i in range(1, commits + 1):
+        message = f"radio-pad-registry: update account account-{i % 500}".encode()
+        document = json.dumps({"name": f"Account {i}"}, indent=2).encode() + b"\n"
+        stream.write(b"commit refs/heads/main\nmark :%d\ncommitter Perf <perf@example.invalid> %d +0000\n" % (i, i))
+        stream.write(b"data %d\n%s\n" % (len(message), message))
+        stream.write(b"M 100644 inline accounts/account-%d.json\ndata %d\n%s\n" % (i % 500, len(document), document))
+    subprocess.run(["git", "init", "--quiet", "--bare", "--initial-branch=main", str(path)], check=True)
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=path, input=stream.getvalue(), check=True)
+
+
+@pytest.mark.performance
+def test_git_shallow_clone_cold_start(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Times GitBackend cold start from a 100k-commit remote: a shallow clone versus a full clone.
+    """
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+    num_commits = 100_000
+    remote = tmp_path / "remote.git"
+    start_time = time.perf_counter()
+    _synthetic_git_remote(remote, num_commits)
+    logging.info("\nGenerated a %s-commit remote in %.1f seconds.", num_commits, time.perf_counter() - start_time)
+    # serve the remote with git's own upload-pack, as a hosted remote would
+    monkeypatch.setattr(dulwich_client, "default_local_git_client_cls", dulwich_client.SubprocessGitClient)
+
+    for clone_depth in (1, 100, 0):
+        start_time = time.perf_counter()
+        backend = GitBackend(str(tmp_path / f"checkout-{clone_depth}"), remote_url=str(remote), clone_depth=clone_depth)
+        duration = time.perf_counter() - start_time
+        assert backend.get("account-1", "accounts")[0] is not None
+        logging.info(
+            "\nGit cold start from a %s-commit remote with clone_depth=%s took %.2f seconds.",
+            num_commits,
+            clone_depth,
+            duration,
+        )
+        backend.close()
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("read_mode", ["worktree", "objects"])
+def test_git_write_cost_with_10k_documents(tmp_path: Path, read_mode: str) -> None:
+    """
+    Times git backend saves and deletes in a checkout holding 10k documents (remote sync disabled).
+    """
+    num_documents = 10_000
+    seed = tmp_path / "seed"
+    repo = Repo.init(str(seed), mkdir=True)
+    accounts = Tree()
+    for i in range(num_documents):
+        blob = Blob.from_string(json.dumps({"name": f"Account {i}"}, indent=2).encode() + b"\n")
+        repo.object_store.add_object(blob)
+        accounts.add(f"account-{i}.json".encode(), 0o100644, blob.id)
+    repo.object_store.add_object(accounts)
+    root = Tree()
+    root.add(b"accounts", 0o040000, accounts.id)
+    repo.object_store.add_object(root)
+    repo.get_worktree().commit(message=b"seed", tree=root.id, author=b"Perf <perf@example.invalid>")
+    porcelain.reset(repo, mode="hard")
+
+    backend = GitBackend(str(seed), remote_url="", read_mode=read_mode)
+    iterations = 50
+    start_time = time.perf_counter()
+    for i in range(iterations):
+        backend.save(f"account-{i}", {"name": f"Renamed {i}"}, "accounts")
+    duration = time.perf_counter() - start_time
+    logging.info(
+        "\nGit %s-mode save with %s documents averaged %.1f ms.", read_mode, num_documents, duration / iterations * 1000
+    )
+
+    start_time = time.perf_counter()
+    for i in range(iterations):
+        assert backend.delete(f"account-{i}", "accounts")
+    duration = time.perf_counter() - start_time
+    logging.info(
+        "\nGit %s-mode delete with %s documents averaged %.1f ms.",
+        read_mode,
+        num_documents,
+        duration / iterations * 1000,
+    )
+    backend.close()
@@ -12,3 +12,8 @@ def test_root_and_healthz(client: TestClient) -> None:
     assert h.status_code == 204
     assert h.content == b""
     assert h.headers.get("cache-control") == "no-store"
+
+    # Sync status: nothing to report for a backend without a remote
+    s = client.get("/healthz/sync")
+    assert s.status_code == 204
+    assert s.headers.get("cache-control") == "no-store"